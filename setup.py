@@ -20,6 +20,12 @@ dependencies = ["sqlalchemy"]
 if py_version < (3, 5):
     dependencies.append("typing")
 
+extra_dependencies = {
+    "numpy": ["numpy"],
+    "arrow": ["pyarrow"],
+    "msgpack": ["msgpack"],
+}
+
 setup(
     name=package_name,
     version=read_version(package_name),
@@ -31,6 +37,7 @@ setup(
     url="https://github.com/meyt/sqlalchemy-dict",
     packages=find_packages(),
     install_requires=dependencies,
+    extras_require=extra_dependencies,
     license="MIT License",
     classifiers=[
         "Development Status :: 3 - Alpha",
@@ -1,15 +1,48 @@
-from .formatter import Formatter, DefaultFormatter
-from .base_model import BaseModel
-from .field import Field, relationship, composite, synonym
+import sys
 
 __version__ = "0.7.0"
 
-__all__ = (
-    Formatter,
-    DefaultFormatter,
-    BaseModel,
-    Field,
-    relationship,
-    composite,
-    synonym,
-)
+# Public names and their modules, imported on first access to keep
+# ``import sqlalchemy_dict`` cheap.
+_lazy_names = {
+    "Formatter": "formatter",
+    "DefaultFormatter": "formatter",
+    "BaseModel": "base_model",
+    "ModelMapping": "mapping",
+    "DumpMemo": "memo",
+    "Field": "field",
+    "relationship": "field",
+    "composite": "field",
+    "synonym": "field",
+    "hybrid_property": "field",
+    "association_proxy": "field",
+    "warmup": "_warmup",
+    "update_all_from_dict": "nested",
+}
+
+__all__ = tuple(_lazy_names)
+
+
+def __getattr__(name):
+    try:
+        module_name = _lazy_names[name]
+    except KeyError:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name)
+        )
+
+    from importlib import import_module
+
+    value = getattr(import_module("." + module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names))
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # Module ``__getattr__`` is not supported (PEP 562)
+    for _name in _lazy_names:
+        __getattr__(_name)
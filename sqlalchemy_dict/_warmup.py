@@ -0,0 +1,55 @@
+from typing import List
+
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.inspection import inspect
+
+from sqlalchemy_dict.base_model import BaseModel
+
+
+def iter_models(base: type):
+    """
+    Iterate mapped ``sqlalchemy_dict.BaseModel`` subclasses of a declarative
+    base.
+
+    .. versionadded:: 0.8.0
+
+    :param base: Declarative base class
+    :return:
+    """
+    seen = set()
+    stack = [base]
+    while stack:
+        cls = stack.pop()
+        for subclass in cls.__subclasses__():
+            if subclass in seen:
+                continue
+            seen.add(subclass)
+            stack.append(subclass)
+            if issubclass(subclass, BaseModel) and inspect(
+                subclass, raiseerr=False
+            ):
+                yield subclass
+
+
+def warmup(base: type) -> List[type]:
+    """
+    Configure mappers and build all export/import plans of models of a
+    declarative base, to avoid doing this on first request.
+
+    .. code-block:: python
+
+        DeclarativeBase = declarative_base(cls=BaseModel)
+        ...
+        warmup(DeclarativeBase)
+
+    .. versionadded:: 0.8.0
+
+    :param base: Declarative base class
+    :return: Warmed up model classes
+    """
+    configure_mappers()
+    models = sorted(iter_models(base), key=lambda m: m.__name__)
+    for model in models:
+        model.get_export_function()
+        model.get_import_plan()
+    return models
@@ -1,18 +1,56 @@
 import functools
 
-from typing import Union, Generator, Tuple, Any, Callable, List
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import (
+    Union,
+    Generator,
+    Tuple,
+    Any,
+    Callable,
+    List,
+    Mapping,
+    Iterable,
+)
 
 from datetime import datetime, date, time
 from decimal import Decimal
 
-from sqlalchemy import Column
-from sqlalchemy.orm import Query, CompositeProperty
+from sqlalchemy import Column, Boolean, Text, func, case, cast
+from sqlalchemy.orm import (
+    Query,
+    ColumnProperty,
+    CompositeProperty,
+    configure_mappers,
+    load_only,
+)
 from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.orm.interfaces import NOT_EXTENSION
 from sqlalchemy.orm.relationships import RelationshipProperty
 from sqlalchemy.ext.hybrid import HYBRID_PROPERTY
-from sqlalchemy.ext.associationproxy import ASSOCIATION_PROXY
+from sqlalchemy.ext.associationproxy import (
+    ASSOCIATION_PROXY,
+    AssociationProxyInstance,
+)
 from sqlalchemy.inspection import inspect
-from sqlalchemy_dict import DefaultFormatter
+from sqlalchemy_dict.formatter import DefaultFormatter
+from sqlalchemy_dict.constants import (
+    EXPORT_DEFAULT,
+    EXPORT_OPTIONAL,
+    EXPORT_SQL,
+    EXPORT_NEVER,
+    UNDECLARED_VIEW,
+)
+from sqlalchemy_dict.codegen import compile_export_function, get_column_type
+from sqlalchemy_dict.mapping import ModelMapping
+from sqlalchemy_dict.memo import DumpMemo
+from sqlalchemy_dict.nested import is_nested_value, update_all_from_dict
+from sqlalchemy_dict.pagination import paginate
+from sqlalchemy_dict.fingerprint import get_fingerprint, get_query_fingerprint
+from sqlalchemy_dict.rows import Result, dump_rows
+from sqlalchemy_dict.dto import get_dto_class
+from sqlalchemy_dict.binary import pack_instance, pack_query
+from sqlalchemy_dict.plan import PlanEntry, plans
 
 
 class BaseModel(object):
@@ -50,7 +88,8 @@ class BaseModel(object):
         :return:
         """
         return cls.get_column_info(column).get(
-            "dict_key", cls.__formatter__.export_key(column.key)
+            "dict_key",
+            cls.__formatter__.export_key(cls.get_attribute_key(column)),
         )
 
     @classmethod
@@ -66,6 +105,22 @@ class BaseModel(object):
             return mapper.columns[column]
         return column
 
+    @classmethod
+    def get_attribute_key(cls, column: Column) -> str:
+        """
+        Get model attribute name of column.
+
+        .. versionadded:: 0.8.0
+
+        :param column:
+        :return:
+        """
+        if isinstance(column, AssociationProxyInstance):
+            for k, c in inspect(cls).all_orm_descriptors.items():
+                if c is column.parent:
+                    return k
+        return column.key
+
     @classmethod
     def get_column_info(cls, column: Column) -> dict:
         """
@@ -92,11 +147,18 @@ class BaseModel(object):
         :param column:
         :param v:
         :return:
+
+        .. versionchanged:: 0.8.0
+            Values of column python type are imported as is.
         """
         c = cls.get_column(column)
+        importer = cls.get_column_info(c).get("import")
+        if importer is not None:
+            return importer(v)
+
         if isinstance(c, Column) or isinstance(c, InstrumentedAttribute):
             try:
-                if v is None:
+                if v is None or v.__class__ is c.type.python_type:
                     return v
 
                 if c.type.python_type is bool and not isinstance(v, bool):
@@ -125,54 +187,133 @@ class BaseModel(object):
         :param v:
         :return: Returns tuple of column dictionary key and value
         """
-        if (
+        exporter = cls.get_column_info(column).get("export")
+        if exporter is not None:
+            result = exporter(v)
+
+        elif (
             hasattr(column, "property")
             and isinstance(column.property, RelationshipProperty)
             and column.property.uselist
         ):
             result = [c.to_dict() for c in v]
 
+        elif (
+            isinstance(column, AssociationProxyInstance)
+            and not column.scalar
+        ):
+            result = [c.to_dict() if hasattr(c, "to_dict") else c for c in v]
+
         elif hasattr(column, "property") and isinstance(
             column.property, CompositeProperty
         ):
-            result = v.__composite_values__()
+            if cls.get_column_info(column).get("as_dict"):
+                # Same as generated export function, which reads
+                # constituents of a missing composite as ``None``
+                props = column.property.props
+                values = (
+                    (None,) * len(props)
+                    if v is None
+                    else v.__composite_values__()
+                )
+                result = {}
+                for prop, value in zip(props, values):
+                    key = cls.get_dict_key(getattr(cls, prop.key))
+                    result[key] = cls.export_value(value)
+            elif v is not None:
+                result = v.__composite_values__()
+            else:
+                result = None
 
-        elif v is None:
-            result = v
+        elif isinstance(v, Decimal):
+            result = cls.__formatter__.export_decimal(
+                v, get_column_type(column)
+            )
 
-        elif isinstance(v, datetime):
-            result = cls.__formatter__.export_datetime(v)
+        else:
+            result = cls.export_value(v)
 
-        elif isinstance(v, date):
-            result = cls.__formatter__.export_date(v)
+        return cls.get_dict_key(column), result
 
-        elif isinstance(v, time):
-            result = cls.__formatter__.export_time(v)
+    @classmethod
+    def export_value(cls, v):
+        """
+        Export a single value by its type.
 
-        elif hasattr(v, "to_dict"):
-            result = v.to_dict()
+        .. versionadded:: 0.8.0
 
-        elif isinstance(v, Decimal):
-            result = str(v)
+        :param v:
+        :return:
+        """
+        if v is None:
+            return v
 
-        else:
-            result = v
+        if isinstance(v, datetime):
+            return cls.__formatter__.export_datetime(v)
 
-        return cls.get_dict_key(column), result
+        if isinstance(v, date):
+            return cls.__formatter__.export_date(v)
+
+        if isinstance(v, time):
+            return cls.__formatter__.export_time(v)
 
-    def update_from_dict(self, context: dict):
+        if hasattr(v, "to_dict"):
+            return v.to_dict()
+
+        if isinstance(v, Decimal):
+            return cls.__formatter__.export_decimal(v)
+
+        return v
+
+    def update_from_dict(self, context: dict, strict=False, session=None):
         """
         Update model instance from dictionary.
 
+        Cost is proportional to the dictionary size, values are assigned in
+        dictionary order.
+
+        Relationships accept nested dictionaries (or lists of them), children
+        are matched by primary key and updated, or created when primary key
+        is missing, see :func:`sqlalchemy_dict.nested.import_relationships`.
+
         :param context:
+        :param strict: Raise ``ValueError`` on unknown keys, before assigning
+            any value. Keys of ``readonly`` columns are known but ignored.
+            Nested dictionaries are checked when imported.
+        :param session: Session to resolve nested children, default is
+            session of instance
         :return:
+
+        .. versionchanged:: 0.8.0
+            ``strict`` and ``session`` arguments added.
         """
-        for column, value in self.extract_data_from_dict(context):
-            setattr(
-                self,
-                column.key[1:] if column.key.startswith("_") else column.key,
-                self.import_value(column, value),
-            )
+        update_all_from_dict(((self, context),), strict, session)
+
+    def _assign_entries(self, entries) -> list:
+        """
+        Assign imported values, and return nested relationship entries.
+        """
+        nested = []
+        for entry, value in entries:
+            if is_nested_value(entry, value):
+                nested.append((entry, value))
+                continue
+
+            if entry.children is not None and isinstance(value, dict):
+                # Missing constituents keep their current values
+                value = entry.column.property.composite_class(
+                    *(
+                        self.import_value(c.column, value[c.key])
+                        if c.key in value
+                        else getattr(self, c.attribute)
+                        for c in entry.children
+                    )
+                )
+            else:
+                value = self.import_value(entry.column, value)
+
+            setattr(self, entry.attribute, value)
+        return nested
 
     @classmethod
     def iter_columns(
@@ -192,6 +333,10 @@ class BaseModel(object):
         :param use_inspection: Force to use ``sqlalchemy`` inspector
         :param hybrids: Include hybrids
         :return:
+
+        .. versionchanged:: 0.8.0
+            Association proxies created by
+            :func:`sqlalchemy_dict.field.association_proxy` are included.
         """
         if use_inspection:
             mapper = inspect(cls)
@@ -200,7 +345,10 @@ class BaseModel(object):
                 if k == "__mapper__":
                     continue
 
-                if c.extension_type == ASSOCIATION_PROXY:
+                if (
+                    c.extension_type == ASSOCIATION_PROXY
+                    and "export_mode" not in c.info
+                ):
                     continue
 
                 if (
@@ -252,58 +400,698 @@ class BaseModel(object):
         :param context:
         :return: Tuple of diction
         """
+        for entry, value in cls._extract_entries(context):
+            yield entry.column, value
+
+    @classmethod
+    def _extract_entries(
+        cls, context: dict, strict=False
+    ) -> List[Tuple[PlanEntry, Any]]:
+        plan = cls.get_import_plan()
+        result = []
+        unknown = []
+        for key, value in context.items():
+            entry = plan.get(key)
+            if entry is not None:
+                result.append((entry, value))
+            elif strict and key not in cls.get_dict_keys():
+                unknown.append(key)
+
+        if unknown:
+            raise ValueError("Unknown keys: %s" % ", ".join(sorted(unknown)))
+
+        return result
+
+    @classmethod
+    def get_dict_keys(cls) -> frozenset:
+        """
+        Get all dictionary keys of model, including ``protected`` and
+        ``readonly`` columns.
+
+        .. versionadded:: 0.8.0
+
+        :return:
+        """
+        return plans.get(
+            cls,
+            "dict_keys",
+            None,
+            lambda: frozenset(
+                cls.get_dict_key(c)
+                for c in cls.iter_dict_columns(include_protected_columns=True)
+            ),
+        )
+
+    @classmethod
+    def get_plan_options(cls, include=None, view: str = None) -> tuple:
+        """
+        Normalize ``include`` and ``view`` before using them as keys of
+        cached plans, so values from untrusted input (e.g. request
+        parameters) can not grow the cache. Keys of ``include`` which are
+        not ``optional`` dictionary keys of model are dropped, and views
+        which are not declared by any property are replaced by
+        :data:`sqlalchemy_dict.constants.UNDECLARED_VIEW`, they export the
+        same properties.
+
+        .. versionadded:: 0.8.0
+
+        :param include: Dictionary keys of ``optional`` properties to export
+        :param view: View name
+        :return: Tuple of ``include`` (``frozenset``) and ``view``
+        """
+        optional, views = plans.get(
+            cls, "plan_options", None, cls._build_plan_options
+        )
+        include = optional.intersection(include) if include else frozenset()
+        if view is not None and view not in views:
+            view = UNDECLARED_VIEW
+        return include, view
+
+    @classmethod
+    def _build_plan_options(cls) -> tuple:
+        configure_mappers()
+        optional = set()
+        views = set()
+        for c in cls.iter_dict_columns():
+            info = cls.get_column_info(c)
+            if info.get("export_mode") == EXPORT_OPTIONAL:
+                optional.add(cls.get_dict_key(c))
+            views.update(info.get("views") or ())
+        return frozenset(optional), frozenset(views)
+
+    @classmethod
+    def get_export_plan(cls, include=None, view: str = None) -> Mapping:
+        """
+        Get the read-only ordered mapping of dictionary keys to
+        :data:`sqlalchemy_dict.plan.PlanEntry` exported by
+        :func:`BaseModel.to_dict`.
+
+        Plan will be computed once per model class (and ``include`` and
+        ``view``) and cached, duplicate dictionary keys are dropped (first
+        column wins).
+
+        A named ``view`` exports just the properties declared with that view
+        (see ``views`` argument of :class:`sqlalchemy_dict.field.Field`) and
+        the properties without ``views``, ``protected`` properties are never
+        exported.
+
+        .. versionadded:: 0.8.0
+
+        :param include: Dictionary keys of ``optional`` properties to export
+        :param view: View name, ``None`` to export all views
+        :return:
+        """
+        include, view = cls.get_plan_options(include, view)
+        return plans.get(
+            cls,
+            "export",
+            (include, view),
+            lambda: cls._build_export_plan(include, view),
+        )
+
+    @classmethod
+    def _build_export_plan(cls, include: frozenset, view=None) -> Mapping:
+        configure_mappers()
+        plan = OrderedDict()
+        for c in cls.iter_dict_columns():
+            key = cls.get_dict_key(c)
+            info = cls.get_column_info(c)
+            export_mode = info.get("export_mode", EXPORT_DEFAULT)
+            if export_mode == EXPORT_NEVER or (
+                export_mode == EXPORT_OPTIONAL and key not in include
+            ):
+                continue
+
+            views = info.get("views")
+            if view is not None and views is not None and view not in views:
+                continue
+
+            plan.setdefault(key, cls._build_plan_entry(c, key=key, info=info))
+        return MappingProxyType(plan)
+
+    @classmethod
+    def _build_plan_entry(
+        cls, column, key=None, attribute=None, info=None
+    ) -> PlanEntry:
+        info = cls.get_column_info(column) if info is None else info
+        children = None
+        if info.get("as_dict"):
+            children = tuple(
+                cls._build_plan_entry(getattr(cls, p.key))
+                for p in column.property.props
+            )
+
+        return PlanEntry(
+            cls.get_dict_key(column) if key is None else key,
+            cls.get_attribute_key(column) if attribute is None else attribute,
+            column,
+            info,
+            children,
+        )
+
+    @classmethod
+    def get_import_plan(cls) -> Mapping:
+        """
+        Get the read-only ordered mapping of dictionary keys to
+        :data:`sqlalchemy_dict.plan.PlanEntry` accepted by
+        :func:`BaseModel.update_from_dict`.
+
+        .. versionadded:: 0.8.0
+
+        :return:
+        """
+        return plans.get(cls, "import", None, cls._build_import_plan)
+
+    @classmethod
+    def _build_import_plan(cls) -> Mapping:
+        configure_mappers()
+        plan = OrderedDict()
         for c in cls.iter_dict_columns(
             include_protected_columns=True, include_readonly_columns=False
         ):
-            param_name = cls.get_dict_key(c)
+            key = cls.get_dict_key(c)
+            attribute = cls.get_attribute_key(c)
+            # Prefer the public attribute (e.g. synonym) of private columns
+            if attribute.startswith("_"):
+                attribute = attribute[1:]
+            plan.setdefault(
+                key, cls._build_plan_entry(c, key=key, attribute=attribute)
+            )
+        return MappingProxyType(plan)
 
-            if param_name in context:
-                value = context[param_name]
+    @classmethod
+    def get_export_function(cls, include=None, view: str = None) -> Callable:
+        """
+        Get the generated function used by :func:`BaseModel.to_dict` for
+        current :attr:`BaseModel.__formatter__`, see
+        :func:`sqlalchemy_dict.codegen.compile_export_function`.
+
+        Generated source is available for debugging:
+
+        .. code-block:: python
 
-                yield c, value
+            >>> print(Member.get_export_function().source)
+
+        .. versionadded:: 0.8.0
+
+        :param include: Dictionary keys of ``optional`` properties to export
+        :param view: View name, see :func:`BaseModel.get_export_plan`
+        :return:
+        """
+        include, view = cls.get_plan_options(include, view)
+        return plans.get(
+            cls,
+            "export_function",
+            (cls.__formatter__, include, view),
+            lambda: compile_export_function(
+                cls, cls.get_export_plan(include, view)
+            ),
+        )
 
-    def to_dict(self) -> dict:
+    def to_dict(
+        self, include=None, view: str = None, memo: DumpMemo = None
+    ) -> dict:
         """
         Convert model instance to dictionary.
 
+        :param include: Dictionary keys of ``optional`` properties to export
+        :param view: View name, see :func:`BaseModel.get_export_plan`
+        :param memo: Export related instances once, see
+            :class:`sqlalchemy_dict.memo.DumpMemo`
+        :return:
+
+        .. versionchanged:: 0.8.0
+            ``include``, ``view`` and ``memo`` arguments added.
+        """
+        return self.get_export_function(include, view)(self, None, memo)
+
+    def as_mapping(self) -> "ModelMapping":
+        """
+        Get a read-only lazy view of :func:`BaseModel.to_dict` output.
+
+        Every value will be exported on first access and cached, so
+        consumers which reads just a few keys will not pay for the others.
+
+        .. versionadded:: 0.8.0
+
         :return:
         """
-        result = {}
-        for c in self.iter_dict_columns():
-            result.setdefault(
-                *self.prepare_for_export(c, getattr(self, c.key))
+        return ModelMapping(self)
+
+    @classmethod
+    def get_json_expression(
+        cls, dialect_name: str, include=None, view: str = None
+    ):
+        """
+        Compile export plan into a SQL expression which builds the model
+        dictionary as JSON text in database.
+
+        Supported dialects are ``sqlite`` (using ``json_object`` of JSON1
+        extension) and ``postgresql`` (using ``json_build_object``). Just
+        columns, synonyms and ``sql`` hybrids can be exported by database
+        and values are formatted by database, not
+        :attr:`BaseModel.__formatter__`.
+
+        .. versionadded:: 0.8.0
+
+        :param dialect_name:
+        :param include: Dictionary keys of ``optional`` properties to export
+        :param view: View name, see :func:`BaseModel.get_export_plan`
+        :return:
+        """
+        if dialect_name == "sqlite":
+            builder = func.json_object
+        elif dialect_name == "postgresql":
+            builder = func.json_build_object
+        else:
+            raise ValueError("Unsupported dialect: %s" % dialect_name)
+
+        arguments = []
+        unsupported = []
+        for entry in cls.get_export_plan(include, view).values():
+            column = entry.column
+            if entry.info.get("export_mode") == EXPORT_SQL:
+                expression = getattr(cls, entry.attribute)
+            elif hasattr(column, "property") and isinstance(
+                column.property, ColumnProperty
+            ):
+                expression = column
+                if dialect_name == "sqlite" and isinstance(
+                    column.type, Boolean
+                ):
+                    expression = func.json(
+                        case(
+                            [(column.is_(None), None), (column, "true")],
+                            else_="false",
+                        )
+                    )
+            else:
+                unsupported.append(entry.key)
+                continue
+
+            arguments.extend((entry.key, expression))
+
+        if unsupported:
+            raise ValueError(
+                "Cannot export in database: %s" % ", ".join(unsupported)
             )
-        return result
+
+        return cast(builder(*arguments), Text)
 
     @classmethod
-    def dump_query(cls, query: Query) -> List[dict]:
+    def dump_query(
+        cls,
+        query: Query,
+        include=None,
+        as_json=False,
+        discriminator=None,
+        view: str = None,
+        memo: DumpMemo = None,
+        normalize=False,
+    ) -> Union[List[Union[dict, str]], dict]:
         """
         Dump query results in a list of model dictionaries.
 
+        Hybrids with ``sql`` export mode will be added to the query as column
+        expressions instead of evaluating in python.
+
+        Results of polymorphic queries are exported by the plan of their own
+        class, resolved once per class for whole query.
+
+        With a ``view``, just the columns needed by the view will be loaded
+        (using ``load_only``), unless the view contains python evaluated
+        hybrids or association proxies, or the model is polymorphic.
+
         :param query:
+        :param include: Dictionary keys of ``optional`` properties to export
+        :param as_json: Build rows as JSON text in database, see
+            :func:`BaseModel.get_json_expression`
+        :param discriminator: Dictionary key to emit polymorphic identity of
+            each row
+        :param view: View name, see :func:`BaseModel.get_export_plan`
+        :param memo: Export related instances once per dump, see
+            :class:`sqlalchemy_dict.memo.DumpMemo`
+        :param normalize: Export related instances once as
+            ``{'items': [...], 'included': {reference: ...}}`` and refer
+            them by reference in items
         :return:
+
+        .. versionchanged:: 0.8.0
+            ``include``, ``as_json``, ``discriminator``, ``view``, ``memo``
+            and ``normalize`` arguments added.
         """
-        return [o.to_dict() for o in query]
+        if normalize:
+            if as_json:
+                raise ValueError("Cannot normalize JSON rows")
+            memo = DumpMemo(normalize=True)
+            items = list(
+                cls.iter_dump(query, include, discriminator, view, memo)
+            )
+            return dict(items=items, included=memo.included)
+
+        if as_json:
+            dialect_name = query.session.get_bind().dialect.name
+            return [
+                row[0]
+                for row in query.with_entities(
+                    cls.get_json_expression(dialect_name, include, view)
+                )
+            ]
+
+        return list(cls.iter_dump(query, include, discriminator, view, memo))
 
     @classmethod
-    def expose(cls, func: Callable) -> Callable:
+    def paginate(
+        cls,
+        query: Query,
+        order_by: Iterable[str],
+        cursor: str = None,
+        limit: int = 20,
+        include=None,
+        view: str = None,
+    ) -> dict:
+        """
+        Dump a page of query using keyset pagination, see
+        :func:`sqlalchemy_dict.pagination.paginate`.
+
+        .. code-block:: python
+
+            >>> page = Member.paginate(session.query(Member), ('-createdAt',))
+            >>> Member.paginate(
+            ...     session.query(Member), ('-createdAt',),
+            ...     cursor=page['next_cursor']
+            ... )
+
+        .. versionadded:: 0.8.0
+
+        :param query:
+        :param order_by: Ordering dictionary keys, a leading ``-`` means
+            descending order
+        :param cursor: ``next_cursor`` of previous page
+        :param limit: Maximum items per page
+        :param include: Dictionary keys of ``optional`` properties to export
+        :param view: View name, see :func:`BaseModel.get_export_plan`
+        :return: Dictionary of ``items`` and ``next_cursor``
         """
-        A decorator to automatically convert model instance or query to
-        dictionary or list of dictionaries.
+        return paginate(cls, query, order_by, cursor, limit, include, view)
+
+    @classmethod
+    def iter_dump(
+        cls,
+        source: Union[Query, Iterable],
+        include=None,
+        discriminator=None,
+        view: str = None,
+        memo: DumpMemo = None,
+    ) -> Generator[dict, None, None]:
+        """
+        Same as :func:`BaseModel.dump_query` but yields dictionaries one by
+        one, also accepts any iterable of model instances.
+
+        .. versionadded:: 0.8.0
+
+        :param source: Query or iterable of model instances
+        :param include: Dictionary keys of ``optional`` properties to export
+        :param discriminator: Dictionary key to emit polymorphic identity of
+            each row
+        :param view: View name, see :func:`BaseModel.get_export_plan`
+        :param memo: Export related instances once per dump, see
+            :class:`sqlalchemy_dict.memo.DumpMemo`
+        :return:
+        """
+        computed = ()
+        if isinstance(source, Query):
+            plan = cls.get_export_plan(include, view)
+            computed = tuple(
+                e.attribute
+                for e in plan.values()
+                if e.info.get("export_mode") == EXPORT_SQL
+            )
+            if view is not None:
+                source = cls._load_only_view(source, include, view)
+
+        if computed:
+            source = source.add_columns(*(getattr(cls, k) for k in computed))
+            rows = ((r[0], dict(zip(computed, r[1:]))) for r in source)
+        else:
+            rows = ((o, None) for o in source)
+
+        exporters = {}
+        for o, values in rows:
+            try:
+                export = exporters[o.__class__]
+            except KeyError:
+                export = exporters[o.__class__] = o._get_dump_exporter(
+                    include, discriminator, view
+                )
+            yield export(o, values, memo)
+
+    @classmethod
+    def _get_dump_exporter(cls, include, discriminator, view) -> Callable:
+        export = cls.get_export_function(include, view)
+        if discriminator is None:
+            return export
+
+        identity = inspect(cls).polymorphic_identity
+
+        def export_with_identity(instance, computed=None, memo=None):
+            result = export(instance, computed, memo)
+            result[discriminator] = identity
+            return result
+
+        return export_with_identity
+
+    @classmethod
+    def get_view_columns(cls, include=None, view: str = None):
+        """
+        Get keys of column properties which should be loaded to export a
+        view, ``None`` if it can not be determined (the view contains python
+        evaluated hybrids or association proxies).
+
+        Many-to-one relationships add their local foreign key columns,
+        primary keys are always loaded by ``sqlalchemy``.
+
+        .. versionadded:: 0.8.0
+
+        :param include: Dictionary keys of ``optional`` properties to export
+        :param view: View name, see :func:`BaseModel.get_export_plan`
+        :return:
+        """
+        include, view = cls.get_plan_options(include, view)
+
+        def build():
+            mapper = inspect(cls)
+            result = []
+
+            def add(entry):
+                if entry.info.get("export_mode") == EXPORT_SQL:
+                    return True
+                descriptor = mapper.all_orm_descriptors[entry.attribute]
+                if descriptor.extension_type is not NOT_EXTENSION:
+                    return False
+
+                prop = getattr(entry.column, "property", None)
+                if isinstance(prop, ColumnProperty):
+                    result.append(prop.key)
+                elif isinstance(prop, CompositeProperty):
+                    result.extend(p.key for p in prop.props)
+                elif isinstance(prop, RelationshipProperty):
+                    result.extend(
+                        mapper.get_property_by_column(c).key
+                        for c in prop.local_columns
+                        if mapper.local_table.c.contains_column(c)
+                    )
+                else:
+                    return False
+                return True
+
+            for entry in cls.get_export_plan(include, view).values():
+                if not add(entry):
+                    return None
+            return tuple(OrderedDict.fromkeys(result))
+
+        return plans.get(cls, "view_columns", (include, view), build)
+
+    @classmethod
+    def _load_only_view(cls, query: Query, include, view) -> Query:
+        mapper = inspect(cls)
+        if mapper.polymorphic_map or [
+            d["entity"] for d in query.column_descriptions
+        ] != [cls]:
+            return query
+
+        keys = cls.get_view_columns(include, view)
+        if keys is None:
+            return query
+        return query.options(load_only(*keys))
+
+    @classmethod
+    def dump_rows(
+        cls, rows: Iterable, include=None, view: str = None
+    ) -> List[dict]:
+        """
+        Convert result rows of a core ``select()`` to model dictionaries
+        without creating model instances, see
+        :func:`sqlalchemy_dict.rows.iter_rows`.
+
+        .. versionadded:: 0.8.0
+
+        :param rows: Iterable of ``Row``, ``RowMapping`` or ``RowProxy``
+        :param include: Dictionary keys of ``optional`` properties to export
+        :param view: View name, see :func:`BaseModel.get_export_plan`
+        :return:
+        """
+        return dump_rows(cls, rows, include, view)
+
+    @classmethod
+    def get_dto_class(cls, include=None, view: str = None) -> type:
+        """
+        Get the generated read-only record class of model dictionaries, see
+        :func:`sqlalchemy_dict.dto.get_dto_class`.
+
+        .. versionadded:: 0.8.0
+
+        :param include: Dictionary keys of ``optional`` properties to export
+        :param view: View name, see :func:`BaseModel.get_export_plan`
+        :return:
+        """
+        return get_dto_class(cls, include, view)
+
+    def to_dto(self, include=None, view: str = None):
+        """
+        Convert model instance to a read-only record, see
+        :func:`BaseModel.get_dto_class`.
+
+        .. versionadded:: 0.8.0
+
+        :param include: Dictionary keys of ``optional`` properties to export
+        :param view: View name, see :func:`BaseModel.get_export_plan`
+        :return:
+        """
+        return self.get_dto_class(include, view).from_instance(self)
+
+    def to_msgpack(
+        self, include=None, view: str = None, field_ids: bool = False
+    ) -> bytes:
+        """
+        Encode model instance as MessagePack, see
+        :func:`sqlalchemy_dict.binary.pack_instance`.
+
+        .. versionadded:: 0.8.0
+
+        :param include: Dictionary keys of ``optional`` properties to export
+        :param view: View name, see :func:`BaseModel.get_export_plan`
+        :param field_ids: Use integer field ids as keys
+        :return:
+        """
+        return pack_instance(self, include, view, field_ids)
+
+    @classmethod
+    def dump_msgpack(
+        cls,
+        source: Iterable,
+        include=None,
+        view: str = None,
+        field_ids: bool = False,
+    ) -> bytes:
+        """
+        Encode model instances of a query as MessagePack, see
+        :func:`sqlalchemy_dict.binary.pack_query`.
+
+        .. versionadded:: 0.8.0
+
+        :param source: Query or iterable of model instances
+        :param include: Dictionary keys of ``optional`` properties to export
+        :param view: View name, see :func:`BaseModel.get_export_plan`
+        :param field_ids: Use integer field ids as keys
+        :return:
+        """
+        return pack_query(cls, source, include, view, field_ids)
+
+    def get_fingerprint(self, include=None, view: str = None) -> str:
+        """
+        Get a fingerprint (e.g. to use as ``ETag``) of exported values
+        without exporting them, see
+        :func:`sqlalchemy_dict.fingerprint.get_fingerprint`.
+
+        .. versionadded:: 0.8.0
+
+        :param include: Dictionary keys of ``optional`` properties to export
+        :param view: View name, see :func:`BaseModel.get_export_plan`
+        :return:
+        """
+        return get_fingerprint(self, include, view)
+
+    @classmethod
+    def get_query_fingerprint(
+        cls, query: Query, include=None, view: str = None
+    ) -> str:
+        """
+        Get a fingerprint of query results, see
+        :func:`sqlalchemy_dict.fingerprint.get_query_fingerprint`.
+
+        .. versionadded:: 0.8.0
+
+        :param query:
+        :param include: Dictionary keys of ``optional`` properties to export
+        :param view: View name, see :func:`BaseModel.get_export_plan`
+        :return:
+        """
+        return get_query_fingerprint(cls, query, include, view)
+
+    @classmethod
+    def expose(cls, func: Callable = None, *, etag: Callable = None):
+        """
+        A decorator to automatically convert model instance, query or core
+        result to dictionary or list of dictionaries.
+
+        With ``etag``, fingerprint of the result (see
+        :func:`BaseModel.get_fingerprint`) will be passed to it before
+        export, if it returns anything except ``None``, export will be
+        skipped and that will be returned (e.g. a ``304`` response):
+
+        .. code-block:: python
+
+            def check_etag(fingerprint):
+                tag = '"%s"' % fingerprint
+                response.headers['ETag'] = tag
+                if request.headers.get('If-None-Match') == tag:
+                    return NotModified()
+
+            @Member.expose(etag=check_etag)
+            def get_member(id):
+                return session.query(Member).get(id)
 
         :param func:
+        :param etag: Callable to check fingerprint of result
         :return:
+
+        .. versionchanged:: 0.8.0
+            ``etag`` argument added and core results are supported.
         """
+        if func is None:
+            return functools.partial(cls.expose, etag=etag)
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             result = func(*args, **kwargs)
 
             if hasattr(result, "to_dict"):
+                if etag is not None:
+                    response = etag(result.get_fingerprint())
+                    if response is not None:
+                        return response
                 return result.to_dict()
 
             if isinstance(result, Query):
+                if etag is not None:
+                    response = etag(cls.get_query_fingerprint(result))
+                    if response is not None:
+                        return response
                 return cls.dump_query(result)
+
+            if isinstance(result, Result):
+                return cls.dump_rows(result)
             return result
 
         return wrapper
@@ -0,0 +1,558 @@
+import struct
+
+from collections import namedtuple
+from collections.abc import Mapping
+from datetime import datetime, date, time, timedelta, timezone
+from decimal import Decimal
+from typing import Iterable
+
+from sqlalchemy.orm import Query
+
+from sqlalchemy_dict.codegen import compile_export_function
+from sqlalchemy_dict.constants import DECIMAL_RAW, DATETIME_ISO
+from sqlalchemy_dict.plan import plans
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+if msgpack is None:
+    #: Application specific value, same as ``msgpack.ExtType``.
+    ExtType = namedtuple("ExtType", ("code", "data"))
+else:  # pragma: no cover
+    ExtType = msgpack.ExtType
+
+#: Extension type codes of packed values.
+#:
+#: - ``datetime``: Seconds since epoch and microseconds (and UTC offset in
+#:   seconds, if aware) of wall time, big-endian ``>qi`` (``>qii``)
+#: - ``date``: Proleptic Gregorian ordinal, ``>i``
+#: - ``time``: Microseconds since midnight (and UTC offset in seconds, if
+#:   aware), ``>q`` (``>qi``)
+#: - ``Decimal``: ASCII string
+EXT_DATETIME = 1
+EXT_DATE = 2
+EXT_TIME = 3
+EXT_DECIMAL = 4
+
+_epoch = datetime(1970, 1, 1)
+_fixext = {1: 0xD4, 2: 0xD5, 4: 0xD6, 8: 0xD7, 16: 0xD8}
+
+
+def _get_offset(value) -> int:
+    offset = value.utcoffset()
+    return None if offset is None else offset // timedelta(seconds=1)
+
+
+def _get_timezone(offset: int):
+    return timezone(timedelta(seconds=offset))
+
+
+def encode_ext(value) -> ExtType:
+    """
+    Encode ``datetime``, ``date``, ``time`` and ``Decimal`` values as
+    extension types, see :data:`EXT_DATETIME`.
+
+    Time zones are encoded as fixed UTC offsets.
+
+    .. versionadded:: 0.8.0
+
+    :param value:
+    :return:
+    :raises TypeError: Value type is not supported
+    """
+    if isinstance(value, datetime):
+        delta = value.replace(tzinfo=None) - _epoch
+        seconds = delta.days * 86400 + delta.seconds
+        offset = _get_offset(value)
+        if offset is None:
+            data = struct.pack(">qi", seconds, delta.microseconds)
+        else:
+            data = struct.pack(">qii", seconds, delta.microseconds, offset)
+        return ExtType(EXT_DATETIME, data)
+
+    if isinstance(value, date):
+        return ExtType(EXT_DATE, struct.pack(">i", value.toordinal()))
+
+    if isinstance(value, time):
+        micros = (
+            (value.hour * 60 + value.minute) * 60 + value.second
+        ) * 1000000 + value.microsecond
+        offset = _get_offset(value)
+        if offset is None:
+            data = struct.pack(">q", micros)
+        else:
+            data = struct.pack(">qi", micros, offset)
+        return ExtType(EXT_TIME, data)
+
+    if isinstance(value, Decimal):
+        return ExtType(EXT_DECIMAL, str(value).encode("ascii"))
+
+    raise TypeError("Can not pack %r" % value.__class__)
+
+
+def decode_ext(code: int, data: bytes):
+    """
+    Decode extension types encoded by :func:`encode_ext`, unknown types are
+    returned as :data:`ExtType`.
+
+    .. versionadded:: 0.8.0
+
+    :param code:
+    :param data:
+    :return:
+    """
+    if code == EXT_DATETIME:
+        if len(data) == 12:
+            seconds, micros = struct.unpack(">qi", data)
+            tzinfo = None
+        else:
+            seconds, micros, offset = struct.unpack(">qii", data)
+            tzinfo = _get_timezone(offset)
+        value = _epoch + timedelta(seconds=seconds, microseconds=micros)
+        return value if tzinfo is None else value.replace(tzinfo=tzinfo)
+
+    if code == EXT_DATE:
+        return date.fromordinal(struct.unpack(">i", data)[0])
+
+    if code == EXT_TIME:
+        if len(data) == 8:
+            micros, = struct.unpack(">q", data)
+            tzinfo = None
+        else:
+            micros, offset = struct.unpack(">qi", data)
+            tzinfo = _get_timezone(offset)
+        seconds, micros = divmod(micros, 1000000)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return time(hours, minutes, seconds, micros, tzinfo)
+
+    if code == EXT_DECIMAL:
+        return Decimal(data.decode("ascii"))
+
+    return ExtType(code, data)
+
+
+def _pack_length(write, n: int, fix: int, fix_max: int, codes, name: str):
+    if n < fix_max:
+        write(struct.pack("B", fix | n))
+    elif codes[0] is not None and n < 0x100:
+        write(struct.pack(">BB", codes[0], n))
+    elif n < 0x10000:
+        write(struct.pack(">BH", codes[1], n))
+    elif n < 0x100000000:
+        write(struct.pack(">BI", codes[2], n))
+    else:
+        raise ValueError("%s is too large" % name)
+
+
+def _pack(obj, write, default):
+    if obj is None:
+        write(b"\xc0")
+    elif obj is True:
+        write(b"\xc3")
+    elif obj is False:
+        write(b"\xc2")
+    elif isinstance(obj, int):
+        if 0 <= obj < 0x80:
+            write(struct.pack("B", obj))
+        elif -0x20 <= obj < 0:
+            write(struct.pack("b", obj))
+        elif obj >= 0:
+            if obj < 0x100:
+                write(struct.pack(">BB", 0xCC, obj))
+            elif obj < 0x10000:
+                write(struct.pack(">BH", 0xCD, obj))
+            elif obj < 0x100000000:
+                write(struct.pack(">BI", 0xCE, obj))
+            elif obj < 0x10000000000000000:
+                write(struct.pack(">BQ", 0xCF, obj))
+            else:
+                raise OverflowError("Integer is too large")
+        elif obj >= -0x80:
+            write(struct.pack(">Bb", 0xD0, obj))
+        elif obj >= -0x8000:
+            write(struct.pack(">Bh", 0xD1, obj))
+        elif obj >= -0x80000000:
+            write(struct.pack(">Bi", 0xD2, obj))
+        elif obj >= -0x8000000000000000:
+            write(struct.pack(">Bq", 0xD3, obj))
+        else:
+            raise OverflowError("Integer is too small")
+    elif isinstance(obj, float):
+        write(struct.pack(">Bd", 0xCB, obj))
+    elif isinstance(obj, str):
+        data = obj.encode("utf-8")
+        _pack_length(
+            write, len(data), 0xA0, 0x20, (0xD9, 0xDA, 0xDB), "String"
+        )
+        write(data)
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        data = bytes(obj)
+        _pack_length(write, len(data), 0, 0, (0xC4, 0xC5, 0xC6), "Bytes")
+        write(data)
+    elif isinstance(obj, ExtType):
+        n = len(obj.data)
+        if n in _fixext:
+            write(struct.pack(">Bb", _fixext[n], obj.code))
+        else:
+            _pack_length(write, n, 0, 0, (0xC7, 0xC8, 0xC9), "Extension")
+            write(struct.pack("b", obj.code))
+        write(obj.data)
+    elif isinstance(obj, (list, tuple)):
+        _pack_length(write, len(obj), 0x90, 0x10, (None, 0xDC, 0xDD), "List")
+        for item in obj:
+            _pack(item, write, default)
+    elif isinstance(obj, Mapping):
+        _pack_length(write, len(obj), 0x80, 0x10, (None, 0xDE, 0xDF), "Map")
+        for key, value in obj.items():
+            _pack(key, write, default)
+            _pack(value, write, default)
+    else:
+        _pack(default(obj), write, default)
+
+
+def py_pack(obj, default=encode_ext) -> bytes:
+    """
+    Pure python MessagePack encoder, used if ``msgpack`` is not installed.
+
+    .. versionadded:: 0.8.0
+
+    :param obj:
+    :param default: Callable to convert unsupported values
+    :return:
+    """
+    chunks = []
+    _pack(obj, chunks.append, default)
+    return b"".join(chunks)
+
+
+class _Reader(object):
+    __slots__ = ("data", "offset", "ext_hook")
+
+    def __init__(self, data: bytes, ext_hook):
+        self.data = data
+        self.offset = 0
+        self.ext_hook = ext_hook
+
+    def read(self, n: int) -> bytes:
+        start = self.offset
+        end = self.offset = start + n
+        if end > len(self.data):
+            raise ValueError("Unexpected end of data")
+        return self.data[start:end]
+
+    def unpack(self, fmt: str):
+        return struct.unpack(fmt, self.read(struct.calcsize(fmt)))[0]
+
+    def read_ext(self, n: int):
+        code = self.unpack("b")
+        return self.ext_hook(code, self.read(n))
+
+    def read_list(self, n: int) -> list:
+        return [self.read_object() for _ in range(n)]
+
+    def read_map(self, n: int) -> dict:
+        result = {}
+        for _ in range(n):
+            key = self.read_object()
+            result[key] = self.read_object()
+        return result
+
+    def read_object(self):
+        b = self.unpack("B")
+        if b < 0x80:
+            return b
+        if b >= 0xE0:
+            return b - 0x100
+        if b < 0x90:
+            return self.read_map(b & 0x0F)
+        if b < 0xA0:
+            return self.read_list(b & 0x0F)
+        if b < 0xC0:
+            return self.read(b & 0x1F).decode("utf-8")
+
+        try:
+            reader = _readers[b]
+        except KeyError:
+            raise ValueError("Invalid type: 0x%x" % b)
+        return reader(self)
+
+
+_readers = {
+    0xC0: lambda r: None,
+    0xC2: lambda r: False,
+    0xC3: lambda r: True,
+    0xC4: lambda r: r.read(r.unpack("B")),
+    0xC5: lambda r: r.read(r.unpack(">H")),
+    0xC6: lambda r: r.read(r.unpack(">I")),
+    0xC7: lambda r: r.read_ext(r.unpack("B")),
+    0xC8: lambda r: r.read_ext(r.unpack(">H")),
+    0xC9: lambda r: r.read_ext(r.unpack(">I")),
+    0xCA: lambda r: r.unpack(">f"),
+    0xCB: lambda r: r.unpack(">d"),
+    0xCC: lambda r: r.unpack("B"),
+    0xCD: lambda r: r.unpack(">H"),
+    0xCE: lambda r: r.unpack(">I"),
+    0xCF: lambda r: r.unpack(">Q"),
+    0xD0: lambda r: r.unpack("b"),
+    0xD1: lambda r: r.unpack(">h"),
+    0xD2: lambda r: r.unpack(">i"),
+    0xD3: lambda r: r.unpack(">q"),
+    0xD4: lambda r: r.read_ext(1),
+    0xD5: lambda r: r.read_ext(2),
+    0xD6: lambda r: r.read_ext(4),
+    0xD7: lambda r: r.read_ext(8),
+    0xD8: lambda r: r.read_ext(16),
+    0xD9: lambda r: r.read(r.unpack("B")).decode("utf-8"),
+    0xDA: lambda r: r.read(r.unpack(">H")).decode("utf-8"),
+    0xDB: lambda r: r.read(r.unpack(">I")).decode("utf-8"),
+    0xDC: lambda r: r.read_list(r.unpack(">H")),
+    0xDD: lambda r: r.read_list(r.unpack(">I")),
+    0xDE: lambda r: r.read_map(r.unpack(">H")),
+    0xDF: lambda r: r.read_map(r.unpack(">I")),
+}
+
+
+def py_unpack(data: bytes, ext_hook=decode_ext):
+    """
+    Pure python MessagePack decoder, used if ``msgpack`` is not installed.
+
+    .. versionadded:: 0.8.0
+
+    :param data:
+    :param ext_hook: Callable of extension type code and data
+    :return:
+    :raises ValueError: Data is invalid or has extra bytes
+    """
+    reader = _Reader(bytes(data), ext_hook)
+    result = reader.read_object()
+    if reader.offset != len(reader.data):
+        raise ValueError("Extra data")
+    return result
+
+
+def pack(obj) -> bytes:
+    """
+    Encode an object as MessagePack, ``datetime``, ``date``, ``time`` and
+    ``Decimal`` values are encoded as extension types (see
+    :func:`encode_ext`).
+
+    Uses ``msgpack`` package if installed (``sqlalchemy-dict[msgpack]``),
+    otherwise :func:`py_pack`.
+
+    .. versionadded:: 0.8.0
+
+    :param obj:
+    :return:
+    """
+    if msgpack is not None:  # pragma: no cover
+        return msgpack.packb(obj, default=encode_ext, use_bin_type=True)
+    return py_pack(obj)
+
+
+def unpack(data: bytes):
+    """
+    Decode MessagePack encoded by :func:`pack`.
+
+    .. versionadded:: 0.8.0
+
+    :param data:
+    :return:
+    """
+    if msgpack is not None:  # pragma: no cover
+        kwargs = dict(ext_hook=decode_ext, raw=False)
+        if msgpack.version >= (1, 0):
+            # Allow field ids
+            kwargs["strict_map_key"] = False
+        return msgpack.unpackb(data, **kwargs)
+    return py_unpack(data)
+
+
+def _keep(value):
+    return value
+
+
+def get_raw_formatter(formatter) -> type:
+    """
+    Get a subclass of formatter which keeps ``datetime``, ``date``, ``time``
+    and ``Decimal`` values, to be encoded as extension types.
+
+    .. versionadded:: 0.8.0
+
+    :param formatter: Formatter class
+    :return:
+    """
+    return type(
+        "Raw%s" % formatter.__name__,
+        (formatter,),
+        dict(
+            decimal_mode=DECIMAL_RAW,
+            datetime_mode=DATETIME_ISO,
+            export_datetime=staticmethod(_keep),
+            export_date=staticmethod(_keep),
+            export_time=staticmethod(_keep),
+        ),
+    )
+
+
+class _BinaryMemo(object):
+    # Exports related instances by their binary function
+    __slots__ = ()
+
+    def export(self, instance):
+        if instance is None:
+            return None
+        return get_binary_function(instance.__class__)(instance, None, self)
+
+
+_memo = _BinaryMemo()
+
+
+def get_binary_function(model, include=None, view=None):
+    """
+    Get the generated export function of model which keeps ``datetime``,
+    ``date``, ``time`` and ``Decimal`` values, cached per model, ``include``
+    and ``view``, see
+    :func:`sqlalchemy_dict.codegen.compile_export_function`.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param view: View name
+    :return:
+    """
+    include, view = model.get_plan_options(include, view)
+    return plans.get(
+        model,
+        "binary_function",
+        (model.__formatter__, include, view),
+        lambda: compile_export_function(
+            model,
+            model.get_export_plan(include, view),
+            get_raw_formatter(model.__formatter__),
+        ),
+    )
+
+
+def get_field_ids(model, include=None, view=None) -> tuple:
+    """
+    Get dictionary keys of export plan, position of every key is its field
+    id.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param view: View name
+    :return:
+    """
+    return tuple(model.get_export_plan(include, view))
+
+
+def to_binary_dict(
+    instance, include=None, view=None, field_ids: bool = False
+) -> dict:
+    """
+    Convert model instance to dictionary of values to pack, same as
+    ``sqlalchemy_dict.BaseModel.to_dict`` but ``datetime``, ``date``,
+    ``time`` and ``Decimal`` values are kept.
+
+    .. versionadded:: 0.8.0
+
+    :param instance: ``sqlalchemy_dict.BaseModel`` instance
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param view: View name
+    :param field_ids: Use field ids (see :func:`get_field_ids`) instead of
+        dictionary keys, just for the instance itself
+    :return:
+    """
+    model = instance.__class__
+    result = get_binary_function(model, include, view)(instance, None, _memo)
+    if field_ids:
+        keys = get_field_ids(model, include, view)
+        return {i: result[k] for i, k in enumerate(keys) if k in result}
+    return result
+
+
+def pack_instance(
+    instance, include=None, view=None, field_ids: bool = False
+) -> bytes:
+    """
+    Encode a model instance as MessagePack map, see :func:`to_binary_dict`.
+
+    .. versionadded:: 0.8.0
+
+    :param instance: ``sqlalchemy_dict.BaseModel`` instance
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param view: View name
+    :param field_ids: Use integer field ids as keys, see
+        :func:`get_field_ids`
+    :return:
+    """
+    return pack(to_binary_dict(instance, include, view, field_ids))
+
+
+def pack_query(
+    model,
+    source: Iterable,
+    include=None,
+    view=None,
+    field_ids: bool = False,
+) -> bytes:
+    """
+    Encode model instances of a query (or any iterable) as MessagePack
+    array of maps, see :func:`pack_instance`.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param source: Query or iterable of model instances
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param view: View name
+    :param field_ids: Use integer field ids as keys, see
+        :func:`get_field_ids`
+    :return:
+    """
+    if isinstance(source, Query) and view is not None:
+        source = model._load_only_view(source, include, view)
+    return pack(
+        [to_binary_dict(o, include, view, field_ids) for o in source]
+    )
+
+
+def unpack_dict(
+    model, data: bytes, include=None, view=None, field_ids: bool = False
+):
+    """
+    Decode a model dictionary (or list of dictionaries) encoded by
+    :func:`pack_instance` or :func:`pack_query`, result can be passed to
+    ``sqlalchemy_dict.BaseModel.update_from_dict``, values which are
+    already of column type are imported as is.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param data:
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param view: View name
+    :param field_ids: Data is encoded with field ids
+    :return: Dictionary or list of dictionaries
+    """
+    result = unpack(data)
+    if not field_ids:
+        return result
+
+    keys = get_field_ids(model, include, view)
+
+    def convert(values):
+        try:
+            return {keys[i]: v for i, v in values.items()}
+        except (IndexError, TypeError):
+            raise ValueError("Invalid field id")
+
+    if isinstance(result, list):
+        return [convert(i) for i in result]
+    return convert(result)
@@ -0,0 +1,330 @@
+import keyword
+import linecache
+
+from datetime import datetime, date, time
+from decimal import Decimal
+from typing import Callable, Mapping
+
+from sqlalchemy.orm import ColumnProperty, CompositeProperty
+from sqlalchemy.orm.relationships import RelationshipProperty
+from sqlalchemy.ext.associationproxy import AssociationProxyInstance
+
+from sqlalchemy_dict.constants import EXPORT_SQL
+
+# Values of these types are exported as is
+PLAIN_TYPES = frozenset((int, float, str, bool, type(None)))
+
+
+def get_column_type(column):
+    """
+    Get ``sqlalchemy`` type of a column or synonym, ``None`` if it's unknown.
+
+    .. versionadded:: 0.8.0
+
+    :param column:
+    :return:
+    """
+    prop = getattr(column, "property", None)
+    if not isinstance(prop, ColumnProperty) or len(prop.columns) != 1:
+        return None
+    return prop.columns[0].type
+
+
+def get_python_type(column):
+    """
+    Get python type of a column or synonym, ``None`` if it's unknown.
+
+    .. versionadded:: 0.8.0
+
+    :param column:
+    :return:
+    """
+    try:
+        return get_column_type(column).python_type
+    except (AttributeError, NotImplementedError):
+        return None
+
+
+def get_type_exporters(model, formatter=None) -> dict:
+    """
+    Get exporters of well-known python types for a model, values of these
+    types will be exported by a direct call. ``Decimal`` exporter is chosen
+    per column, see ``sqlalchemy_dict.formatter.Formatter.decimal_mode``.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param formatter: Formatter class, default is model formatter
+    :return: Dictionary of python types and exporter callables
+    """
+    formatter = formatter or model.__formatter__
+    return {
+        datetime: formatter.get_datetime_exporter(),
+        date: formatter.export_date,
+        time: formatter.export_time,
+    }
+
+
+def get_attribute_expression(variable: str, attribute: str) -> str:
+    if attribute.isidentifier() and not keyword.iskeyword(attribute):
+        return "%s.%s" % (variable, attribute)
+    return "getattr(%s, %r)" % (variable, attribute)
+
+
+def is_export_customized(model) -> bool:
+    """
+    Check model overrides value exporting methods.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :return:
+    """
+    from sqlalchemy_dict.base_model import BaseModel
+
+    return any(
+        getattr(model, name).__func__ is not getattr(BaseModel, name).__func__
+        for name in ("prepare_for_export", "export_value")
+    )
+
+
+def _add_getter(lines: list, entry, name: str) -> str:
+    value = "v" + name
+    getter = get_attribute_expression("self", entry.attribute)
+    if entry.info.get("export_mode") == EXPORT_SQL:
+        # Values of ``sql`` hybrids which are not computed by the query
+        # (e.g. declared by a subclass of queried model) are read directly
+        getter = "%s if computed is None or %r not in computed else " % (
+            getter,
+            entry.attribute,
+        ) + "computed[%r]" % entry.attribute
+    lines.append("    %s = %s" % (value, getter))
+    return value
+
+
+def _compile_entry(
+    lines: list,
+    namespace: dict,
+    type_exporters: dict,
+    entry,
+    name: str,
+    formatter,
+) -> str:
+    if entry.children is not None:
+        # Composite as dictionary, read constituents directly
+        return "{%s}" % ", ".join(
+            "%r: %s"
+            % (
+                c.key,
+                _compile_entry(
+                    lines,
+                    namespace,
+                    type_exporters,
+                    c,
+                    "%s_%d" % (name, i),
+                    formatter,
+                ),
+            )
+            for i, c in enumerate(entry.children)
+        )
+
+    value = _add_getter(lines, entry, name)
+    return compile_value(
+        namespace, type_exporters, entry, name, value, formatter
+    )
+
+
+def compile_value(
+    namespace: dict,
+    type_exporters: dict,
+    entry,
+    name: str,
+    value: str,
+    formatter,
+) -> str:
+    """
+    Generate python expression which exports a value of a plan entry, the
+    exporter is chosen by column type once.
+
+    .. versionadded:: 0.8.0
+
+    :param namespace: Namespace of generated function, exporters are added
+        to it, see :func:`get_namespace`
+    :param type_exporters: See :func:`get_type_exporters`
+    :param entry: :data:`sqlalchemy_dict.plan.PlanEntry`
+    :param name: Unique suffix of names added to namespace
+    :param value: Python expression of value
+    :param formatter: Formatter class
+    :return:
+    """
+    column = entry.column
+    exporter = entry.info.get("export")
+    if exporter is not None:
+        namespace["x" + name] = exporter
+        return "x%s(%s)" % (name, value)
+
+    prop = getattr(column, "property", None)
+    python_type = get_python_type(column)
+    if isinstance(prop, RelationshipProperty):
+        if prop.uselist:
+            return (
+                "[c.to_dict() for c in %s] if memo is None "
+                "else [memo.export(c) for c in %s]" % (value, value)
+            )
+        return "export_value(%s) if memo is None else memo.export(%s)" % (
+            value,
+            value,
+        )
+
+    if isinstance(column, AssociationProxyInstance) and not column.scalar:
+        return (
+            "[c.to_dict() if hasattr(c, 'to_dict') else c for c in %s]"
+            % value
+        )
+
+    if isinstance(prop, CompositeProperty):
+        return "None if %s is None else %s.__composite_values__()" % (
+            value,
+            value,
+        )
+
+    if python_type is Decimal:
+        exporter = formatter.get_decimal_exporter(get_column_type(column))
+        if exporter is None:
+            return value
+        namespace["e" + name] = exporter
+        return "e%s(%s) if %s.__class__ is Decimal else export_value(%s)" % (
+            name,
+            value,
+            value,
+            value,
+        )
+
+    if python_type in type_exporters:
+        namespace["t" + name] = python_type
+        namespace["e" + name] = type_exporters[python_type]
+        return "e%s(%s) if %s.__class__ is t%s else export_value(%s)" % (
+            name,
+            value,
+            value,
+            name,
+            value,
+        )
+
+    return "%s if %s.__class__ in plain_types else export_value(%s)" % (
+        value,
+        value,
+        value,
+    )
+
+
+def compile_export_function(
+    model, plan: Mapping, formatter=None
+) -> Callable:
+    """
+    Generate a specialized python function which converts a model instance
+    to dictionary using the given export plan.
+
+    Dictionary keys and attribute names are inlined and the exporter of every
+    column is chosen by column type once, a type check will fall back to
+    ``sqlalchemy_dict.BaseModel.export_value`` for unexpected values. Field
+    ``export`` callables are called directly. If
+    model overrides ``prepare_for_export`` or ``export_value``, generated
+    function calls ``prepare_for_export`` for every column.
+
+    Generated function accepts the instance, an optional dictionary of
+    already computed values of ``sql`` hybrids (by attribute name) and an
+    optional ``sqlalchemy_dict.memo.DumpMemo`` to export related instances,
+    its source is available as ``source`` attribute of the function.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param plan: Export plan, see
+        ``sqlalchemy_dict.BaseModel.get_export_plan``
+    :param formatter: Formatter class, default is model formatter
+    :return:
+    """
+    formatter = formatter or model.__formatter__
+    namespace = get_namespace(model)
+    type_exporters = get_type_exporters(model, formatter)
+    customized = is_export_customized(model)
+
+    lines = ["def to_dict(self, computed=None, memo=None):"]
+    items = []
+    for i, entry in enumerate(plan.values()):
+        name = "%d" % i
+        if customized:
+            namespace["c" + name] = entry.column
+            value = _add_getter(lines, entry, name)
+            items.append("prepare_for_export(c%s, %s)" % (name, value))
+        else:
+            expression = _compile_entry(
+                lines, namespace, type_exporters, entry, name, formatter
+            )
+            items.append("%r: %s" % (entry.key, expression))
+
+    if customized:
+        lines.append("    result = {}")
+        lines.extend("    result.setdefault(*%s)" % i for i in items)
+        lines.append("    return result")
+    else:
+        lines.append("    return {")
+        lines.extend("        %s," % i for i in items)
+        lines.append("    }")
+
+    return compile_function(model, "to_dict", lines, namespace, id(plan))
+
+
+def get_namespace(model) -> dict:
+    """
+    Get initial namespace of functions generated for a model.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :return:
+    """
+    return {
+        "plain_types": PLAIN_TYPES,
+        "Decimal": Decimal,
+        "export_value": model.export_value,
+        "prepare_for_export": model.prepare_for_export,
+    }
+
+
+def compile_function(
+    model, name: str, lines: list, namespace: dict, ident: int
+) -> Callable:
+    """
+    Compile source lines of a generated function, its source is visible in
+    tracebacks and available as ``source`` attribute of the function.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param name: Function name
+    :param lines: Source lines
+    :param namespace: Global namespace, see :func:`get_namespace`
+    :param ident: Unique number of file name
+    :return:
+    """
+    source = "\n".join(lines) + "\n"
+    filename = "<sqlalchemy_dict %s %s.%s at 0x%x>" % (
+        name,
+        model.__module__,
+        model.__name__,
+        ident,
+    )
+    exec(compile(source, filename, "exec"), namespace)
+    # Make source visible in tracebacks
+    linecache.cache[filename] = (
+        len(source),
+        None,
+        source.splitlines(True),
+        filename,
+    )
+
+    function = namespace[name]
+    function.source = source
+    return function
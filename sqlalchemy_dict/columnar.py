@@ -0,0 +1,147 @@
+from datetime import datetime, date
+from itertools import islice
+from typing import Generator, Tuple
+
+from sqlalchemy.orm import Query, ColumnProperty
+
+from sqlalchemy_dict.codegen import get_python_type
+from sqlalchemy_dict.constants import EXPORT_SQL
+
+# Numpy dtypes of python types which numpy can not infer
+NUMPY_DTYPES = {datetime: "datetime64[us]", date: "datetime64[D]"}
+
+
+def _require(module_name: str):
+    from importlib import import_module
+
+    try:
+        return import_module(module_name)
+    except ImportError:
+        raise ImportError(
+            "%s is required for columnar export, install it using: "
+            "pip install %s" % (module_name, module_name)
+        )
+
+
+def get_columnar_entries(model, include=None) -> tuple:
+    """
+    Get export plan entries of a model which can be selected as a single
+    column: columns, synonyms and ``sql`` hybrids. Relationships, composites,
+    association proxies and python evaluated hybrids are skipped.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param include: Dictionary keys of ``optional`` properties to export
+    :return:
+    """
+    return tuple(
+        e
+        for e in model.get_export_plan(include).values()
+        if e.info.get("export_mode") == EXPORT_SQL
+        or (
+            isinstance(getattr(e.column, "property", None), ColumnProperty)
+            and e.children is None
+        )
+    )
+
+
+def iter_chunks(
+    model, query: Query, include=None, chunk_size: int = 10000
+) -> Generator[Tuple[tuple, ...], None, None]:
+    """
+    Select exported columns of a model query and yield them in chunks of
+    columns (a tuple of values per column), without creating model instances
+    or dictionaries.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param query: Query of model
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param chunk_size: Maximum rows per chunk
+    :return:
+    """
+    entries = get_columnar_entries(model, include)
+    rows = iter(
+        query.with_entities(
+            *(getattr(model, e.attribute) for e in entries)
+        ).yield_per(chunk_size)
+    )
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield tuple(zip(*chunk))
+
+
+def to_numpy(
+    model, query: Query, include=None, chunk_size: int = 10000
+) -> dict:
+    """
+    Export a model query as a dictionary of numpy arrays keyed by model
+    dictionary keys. ``protected`` columns are excluded and values are not
+    formatted, see :func:`get_columnar_entries` for exported columns.
+
+    .. code-block:: python
+
+        >>> import pandas
+        >>> pandas.DataFrame(to_numpy(Member, session.query(Member)))
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param query: Query of model
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param chunk_size: Maximum rows fetched per chunk
+    :return:
+    """
+    numpy = _require("numpy")
+    entries = get_columnar_entries(model, include)
+    dtypes = [NUMPY_DTYPES.get(get_python_type(e.column)) for e in entries]
+    chunks = [[] for _ in entries]
+    for columns in iter_chunks(model, query, include, chunk_size):
+        for values, dtype, arrays in zip(columns, dtypes, chunks):
+            arrays.append(numpy.array(values, dtype=dtype))
+
+    return {
+        e.key: (
+            numpy.concatenate(arrays)
+            if arrays
+            else numpy.array([], dtype=dtype)
+        )
+        for e, dtype, arrays in zip(entries, dtypes, chunks)
+    }
+
+
+def to_arrow(model, query: Query, include=None, chunk_size: int = 10000):
+    """
+    Export a model query as a ``pyarrow.Table`` with columns named by model
+    dictionary keys, every fetched chunk will be a chunk of table columns.
+    ``protected`` columns are excluded, see :func:`get_columnar_entries` for
+    exported columns.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param query: Query of model
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param chunk_size: Maximum rows fetched per chunk
+    :return:
+    """
+    pyarrow = _require("pyarrow")
+    keys = [e.key for e in get_columnar_entries(model, include)]
+    chunks = [[] for _ in keys]
+    for columns in iter_chunks(model, query, include, chunk_size):
+        for values, arrays in zip(columns, chunks):
+            arrays.append(pyarrow.array(values))
+
+    result = []
+    for arrays in chunks:
+        # Chunks of just nulls have not inferred type
+        types = [a.type for a in arrays if a.type != pyarrow.null()]
+        type_ = types[0] if types else pyarrow.null()
+        result.append(
+            pyarrow.chunked_array([a.cast(type_) for a in arrays], type_)
+        )
+    return pyarrow.Table.from_arrays(result, names=keys)
@@ -5,5 +5,43 @@ ISO_DATETIME_PATTERN = re.compile(
     r"^(?P<datetime>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})"
     r"(?:\.(\d*))?(Z|\+\d{2}:\d{2})?$"
 )
+UTC_DATETIME_PATTERN = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})"
+    r"(?:\.(\d{1,6})\d*)?(Z|[+-]\d{2}:?\d{2})?$"
+)
 ISO_DATE_FORMAT = "%Y-%m-%d"
 ISO_TIME_FORMAT = "%H:%M:%S"
+
+# Export modes
+EXPORT_DEFAULT = "default"
+EXPORT_OPTIONAL = "optional"
+EXPORT_SQL = "sql"
+EXPORT_NEVER = "never"
+EXPORT_MODES = (EXPORT_DEFAULT, EXPORT_OPTIONAL, EXPORT_SQL, EXPORT_NEVER)
+# Plan option of views which are not declared by any property, they all
+# export the same properties
+UNDECLARED_VIEW = ""
+
+# Decimal export modes
+DECIMAL_STR = "str"
+DECIMAL_FLOAT = "float"
+DECIMAL_SCALED = "scaled"
+DECIMAL_RAW = "raw"
+DECIMAL_AUTO = "auto"
+DECIMAL_MODES = (
+    DECIMAL_STR,
+    DECIMAL_FLOAT,
+    DECIMAL_SCALED,
+    DECIMAL_RAW,
+    DECIMAL_AUTO,
+)
+# Maximum decimal digits which can be exported as float without loss
+FLOAT_PRECISION = 15
+
+# Datetime export modes
+DATETIME_ISO = "iso"
+DATETIME_UTC = "utc"
+DATETIME_EPOCH_MILLIS = "epoch_millis"
+DATETIME_MODES = (DATETIME_ISO, DATETIME_UTC, DATETIME_EPOCH_MILLIS)
+# Fraction digits of exported UTC datetimes
+DATETIME_PRECISIONS = (0, 3, 6)
@@ -0,0 +1,124 @@
+from collections import namedtuple
+from typing import Iterable, List
+
+from sqlalchemy_dict.plan import plans
+from sqlalchemy_dict.rows import iter_rows
+
+
+def _get_field_name(entry) -> str:
+    # Private attributes (e.g. ``_password``) can not be namedtuple fields
+    return entry.attribute.lstrip("_") or entry.key
+
+
+def compile_dto_class(model, include=None, view=None) -> type:
+    """
+    Generate a read-only and ``__slots__`` based (namedtuple) class of model
+    dictionaries, fields are attribute names of export plan entries and
+    values are exported values.
+
+    Instances take a fraction of the memory of dictionaries or model
+    instances, to hold many cached records.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param view: View name
+    :return:
+    """
+    include, view = model.get_plan_options(include, view)
+    entries = tuple(model.get_export_plan(include, view).values())
+    keys = tuple(e.key for e in entries)
+    base = namedtuple(
+        "%sDTO" % model.__name__,
+        [_get_field_name(e) for e in entries],
+        rename=True,
+    )
+
+    def from_instance(cls, instance):
+        """
+        Create from a model instance.
+
+        :param instance:
+        :return:
+        """
+        values = instance.to_dict(include, view)
+        return cls._make(values[k] for k in keys)
+
+    def from_row(cls, row):
+        """
+        Create from a core result row, missing columns will be ``None``.
+
+        :param row: ``Row``, ``RowMapping`` or ``RowProxy``
+        :return:
+        """
+        return cls.from_rows((row,))[0]
+
+    def from_rows(cls, rows: Iterable) -> List:
+        """
+        Create from core result rows, see
+        :func:`sqlalchemy_dict.rows.iter_rows`.
+
+        :param rows: Iterable of ``Row``, ``RowMapping`` or ``RowProxy``
+        :return:
+        """
+        make = cls._make
+        return [
+            make(values.get(k) for k in keys)
+            for values in iter_rows(model, rows, include, view)
+        ]
+
+    def to_dict(self) -> dict:
+        """
+        Convert to model dictionary.
+
+        :return:
+        """
+        return dict(zip(keys, self))
+
+    return type(
+        base.__name__,
+        (base,),
+        dict(
+            __slots__=(),
+            __module__=model.__module__,
+            __doc__="Read-only record of :class:`%s.%s` dictionaries."
+            % (model.__module__, model.__name__),
+            model=model,
+            dict_keys=keys,
+            from_instance=classmethod(from_instance),
+            from_row=classmethod(from_row),
+            from_rows=classmethod(from_rows),
+            to_dict=to_dict,
+        ),
+    )
+
+
+def get_dto_class(model, include=None, view=None) -> type:
+    """
+    Same as :func:`compile_dto_class` but cached per model, ``include``
+    and ``view``.
+
+    .. code-block:: python
+
+        >>> MemberDTO = get_dto_class(Member)
+        >>> record = MemberDTO.from_instance(member)
+        >>> record.first_name
+        'John'
+        >>> record.to_dict()
+        {'id': 1, 'firstName': 'John', ...}
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param view: View name
+    :return:
+    """
+    include, view = model.get_plan_options(include, view)
+    return plans.get(
+        model,
+        "dto",
+        (model.__formatter__, include, view),
+        lambda: compile_dto_class(model, include, view),
+    )
@@ -1,9 +1,22 @@
+from typing import Callable, Iterable
+
 from sqlalchemy import Column
 from sqlalchemy.orm import (
     relationship as sa_relationship,
     composite as sa_composite,
     synonym as sa_synonym,
 )
+from sqlalchemy.ext.hybrid import hybrid_property as sa_hybrid_property
+from sqlalchemy.ext.associationproxy import (
+    association_proxy as sa_association_proxy,
+)
+
+from sqlalchemy_dict.constants import EXPORT_MODES, EXPORT_DEFAULT, EXPORT_SQL
+
+
+def _check_export_mode(export_mode, allowed=EXPORT_MODES):
+    if export_mode not in allowed:
+        raise ValueError("Invalid export mode: %r" % export_mode)
 
 
 class Field(Column):
@@ -19,6 +32,9 @@ class Field(Column):
         readonly: bool = None,
         protected: bool = None,
         info: dict = None,
+        export: Callable = None,
+        import_: Callable = None,
+        views: Iterable[str] = None,
         **kwargs
     ):
         """
@@ -35,6 +51,25 @@ class Field(Column):
             ``sqlalchemy_dict.BaseModel.update_from_dict`` input dictionary.
         :param protected: Make field protected to representation
         :param info: Pass into Column info
+        :param export: Callable to export the field value instead of
+            ``sqlalchemy_dict.BaseModel.__formatter__``, it will be called
+            with the raw value (even ``None``) and should return exported
+            value.
+
+            .. versionadded:: 0.8.0
+
+        :param import_: Callable to import the field value from input
+            dictionary, it will be called with the input value (even
+            ``None``).
+
+            .. versionadded:: 0.8.0
+
+        :param views: Names of views which export this field, see
+            ``sqlalchemy_dict.BaseModel.get_export_plan``. default is all
+            views.
+
+            .. versionadded:: 0.8.0
+
         :param kwargs: Keyword-arguments that directly pass into
             ``sqlalchemy.Column.__init__``
         """
@@ -49,11 +84,24 @@ class Field(Column):
         if protected is not None:
             info["protected"] = protected
 
+        if export is not None:
+            info["export"] = export
+
+        if import_ is not None:
+            info["import"] = import_
+
+        if views is not None:
+            info["views"] = frozenset(views)
+
         super(Field, self).__init__(*args, info=info, **kwargs)
 
 
 def relationship(
-    *args, dict_key: str = None, protected: bool = None, **kwargs
+    *args,
+    dict_key: str = None,
+    protected: bool = None,
+    views: Iterable[str] = None,
+    **kwargs
 ):
     """
     Same as ``sqlalchemy.orm.relationship`` with extra arguments to use in
@@ -65,6 +113,11 @@ def relationship(
         (using ``sqlalchemy_dict.BaseModel.__formatter__``) attribute name
         (where ``relationship`` called).
     :param protected: Make field protected to representation.
+    :param views: Names of views which export this relationship, see
+        ``sqlalchemy_dict.BaseModel.get_export_plan``. default is all views.
+
+        .. versionadded:: 0.8.0
+
     :param kwargs: Keyword-arguments that directly pass into
         ``sqlalchemy.orm.relationship``.
     :return:
@@ -77,6 +130,9 @@ def relationship(
     if protected is not None:
         info["protected"] = protected
 
+    if views is not None:
+        info["views"] = frozenset(views)
+
     return sa_relationship(*args, info=info, **kwargs)
 
 
@@ -85,6 +141,8 @@ def composite(
     dict_key: str = None,
     protected: bool = None,
     readonly: bool = None,
+    as_dict: bool = None,
+    views: Iterable[str] = None,
     **kwargs
 ):
     """
@@ -100,6 +158,18 @@ def composite(
     :param readonly: Make field read-only, it's mean this field will not accept
         any value from ``sqlalchemy_dict.BaseModel.update_from_dict`` input
         dictionary.
+    :param as_dict: Export as a dictionary of constituent columns (keyed by
+        their dictionary keys) instead of ``__composite_values__()``, also
+        accept the same dictionary (even partial) on
+        ``sqlalchemy_dict.BaseModel.update_from_dict``.
+
+        .. versionadded:: 0.8.0
+
+    :param views: Names of views which export this composite, see
+        ``sqlalchemy_dict.BaseModel.get_export_plan``. default is all views.
+
+        .. versionadded:: 0.8.0
+
     :param kwargs: Keyword-arguments that directly pass into
         ``sqlalchemy.orm.composite``.
     :return:
@@ -115,6 +185,12 @@ def composite(
     if readonly is not None:
         info["readonly"] = readonly
 
+    if as_dict is not None:
+        info["as_dict"] = as_dict
+
+    if views is not None:
+        info["views"] = frozenset(views)
+
     return sa_composite(*args, info=info, **kwargs)
 
 
@@ -123,6 +199,7 @@ def synonym(
     dict_key: str = None,
     protected: bool = None,
     readonly: bool = None,
+    views: Iterable[str] = None,
     **kwargs
 ):
     """
@@ -140,6 +217,11 @@ def synonym(
     :param readonly: Make field read-only, it's mean this field will not accept
         any value from ``sqlalchemy_dict.BaseModel.update_from_dict`` input
         dictionary.
+    :param views: Names of views which export this synonym, see
+        ``sqlalchemy_dict.BaseModel.get_export_plan``. default is all views.
+
+        .. versionadded:: 0.8.0
+
     :param kwargs: Keyword-arguments that directly pass into
         ``sqlalchemy.orm.synonym``.
     :return:
@@ -155,4 +237,145 @@ def synonym(
     if readonly is not None:
         info["readonly"] = readonly
 
+    if views is not None:
+        info["views"] = frozenset(views)
+
     return sa_synonym(*args, info=info, **kwargs)
+
+
+class HybridProperty(sa_hybrid_property):
+    """
+    An overridden class from ``sqlalchemy.ext.hybrid.hybrid_property`` which
+    keeps ``info`` across ``setter``, ``expression`` and other modifiers.
+
+    Use :func:`hybrid_property` to create it.
+
+    .. versionadded:: 0.8.0
+    """
+
+    def __init__(self, fget, *args, info: dict = None, **kwargs):
+        super(HybridProperty, self).__init__(fget, *args, **kwargs)
+        self.info = info or dict()
+
+
+def hybrid_property(
+    fget=None,
+    *,
+    dict_key: str = None,
+    protected: bool = None,
+    readonly: bool = None,
+    export_mode: str = None,
+    views: Iterable[str] = None,
+    **kwargs
+):
+    """
+    Same as ``sqlalchemy.ext.hybrid.hybrid_property`` with extra arguments to
+    use in ``sqlalchemy_dict``, can be used as decorator with or without
+    arguments:
+
+    .. code-block:: python
+
+        @hybrid_property(export_mode='optional')
+        def score(self):
+            return compute_score(self)
+
+    .. versionadded:: 0.8.0
+
+    :param fget: Getter function
+    :param dict_key: Custom dictionary key. default is formatted
+        (using ``sqlalchemy_dict.BaseModel.__formatter__``) attribute name.
+    :param protected: Make field protected to representation.
+    :param readonly: Make field read-only, it's mean this field will not accept
+        any value from ``sqlalchemy_dict.BaseModel.update_from_dict`` input
+        dictionary.
+    :param export_mode: One of:
+
+        - ``default``: Evaluate in python on every export.
+        - ``optional``: Export just when requested by ``include`` argument of
+          ``sqlalchemy_dict.BaseModel.to_dict``.
+        - ``sql``: Evaluate the hybrid expression in database on
+          ``sqlalchemy_dict.BaseModel.dump_query``.
+        - ``never``: Never export.
+
+    :param views: Names of views which export this hybrid, see
+        ``sqlalchemy_dict.BaseModel.get_export_plan``. default is all views.
+    :param kwargs: Keyword-arguments that directly pass into
+        ``sqlalchemy.ext.hybrid.hybrid_property``.
+    :return:
+    """
+    info = dict()
+
+    if dict_key is not None:
+        info["dict_key"] = dict_key
+
+    if protected is not None:
+        info["protected"] = protected
+
+    if readonly is not None:
+        info["readonly"] = readonly
+
+    if export_mode is not None:
+        _check_export_mode(export_mode)
+        info["export_mode"] = export_mode
+
+    if views is not None:
+        info["views"] = frozenset(views)
+
+    if fget is None:
+        return lambda f: HybridProperty(f, info=info, **kwargs)
+
+    return HybridProperty(fget, info=info, **kwargs)
+
+
+def association_proxy(
+    *args,
+    dict_key: str = None,
+    protected: bool = None,
+    readonly: bool = None,
+    export_mode: str = EXPORT_DEFAULT,
+    views: Iterable[str] = None,
+    **kwargs
+):
+    """
+    Same as ``sqlalchemy.ext.associationproxy.association_proxy`` with extra
+    arguments to use in ``sqlalchemy_dict``.
+
+    Unlike plain association proxies (which are always skipped), proxies
+    created by this function will be exported and imported.
+
+    .. versionadded:: 0.8.0
+
+    :param args: Positional-arguments that directly pass into
+        ``sqlalchemy.ext.associationproxy.association_proxy``.
+    :param dict_key: Custom dictionary key. default is formatted
+        (using ``sqlalchemy_dict.BaseModel.__formatter__``) attribute name
+        (where ``association_proxy`` called).
+    :param protected: Make field protected to representation.
+    :param readonly: Make field read-only, it's mean this field will not accept
+        any value from ``sqlalchemy_dict.BaseModel.update_from_dict`` input
+        dictionary.
+    :param export_mode: Same as :func:`hybrid_property` except ``sql``.
+    :param views: Names of views which export this proxy, see
+        ``sqlalchemy_dict.BaseModel.get_export_plan``. default is all views.
+    :param kwargs: Keyword-arguments that directly pass into
+        ``sqlalchemy.ext.associationproxy.association_proxy``.
+    :return:
+    """
+    _check_export_mode(
+        export_mode, tuple(m for m in EXPORT_MODES if m != EXPORT_SQL)
+    )
+    info = dict(export_mode=export_mode)
+
+    if dict_key is not None:
+        info["dict_key"] = dict_key
+
+    if protected is not None:
+        info["protected"] = protected
+
+    if readonly is not None:
+        info["readonly"] = readonly
+
+    if views is not None:
+        info["views"] = frozenset(views)
+
+    return sa_association_proxy(*args, info=info, **kwargs)
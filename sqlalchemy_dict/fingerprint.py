@@ -0,0 +1,167 @@
+import hashlib
+
+from collections import namedtuple
+
+from sqlalchemy.ext.associationproxy import AssociationProxyInstance
+from sqlalchemy.inspection import inspect
+from sqlalchemy.orm import Query, ColumnProperty, CompositeProperty
+from sqlalchemy.orm.relationships import RelationshipProperty
+
+from sqlalchemy_dict.constants import EXPORT_SQL
+from sqlalchemy_dict.plan import plans
+
+#: Fingerprint plan of a model.
+#:
+#: - ``prefix``: Hashed before values, model name and dictionary keys
+#: - ``attributes``: Names of attributes which are hashed by raw value
+#: - ``related``: Name and scalar flag pairs of attributes which are hashed
+#:   by fingerprint of their model instances (relationships and association
+#:   proxies), values of scalar attributes are not iterated
+#: - ``expressions``: Column expressions of ``attributes`` to fingerprint
+#:   queries in database, ``None`` if some values are evaluated in python
+#:   or there are ``related`` attributes
+FingerprintPlan = namedtuple(
+    "FingerprintPlan", ("prefix", "attributes", "related", "expressions")
+)
+
+
+def get_fingerprint_plan(model, include=None, view=None) -> FingerprintPlan:
+    """
+    Get fingerprint plan of a model export plan, if model has a version
+    column (``version_id_col``), just primary key and version are hashed.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param view: View name
+    :return:
+    """
+    include, view = model.get_plan_options(include, view)
+
+    def build():
+        mapper = inspect(model)
+        if mapper.version_id_col is not None:
+            columns = list(mapper.primary_key) + [mapper.version_id_col]
+            attributes = tuple(
+                mapper.get_property_by_column(c).key for c in columns
+            )
+            # Views (and included keys) are different representations
+            keys = tuple(model.get_export_plan(include, view))
+            return FingerprintPlan(
+                repr((model.__name__, keys, attributes)).encode(),
+                attributes,
+                (),
+                tuple(getattr(model, a) for a in attributes),
+            )
+
+        plan = model.get_export_plan(include, view)
+        attributes = []
+        related = []
+        expressions = []
+        for entry in plan.values():
+            prop = getattr(entry.column, "property", None)
+            if isinstance(prop, RelationshipProperty):
+                related.append((entry.attribute, not prop.uselist))
+                continue
+
+            if isinstance(entry.column, AssociationProxyInstance):
+                related.append((entry.attribute, entry.column.scalar))
+                continue
+
+            if isinstance(prop, CompositeProperty):
+                names = [p.key for p in prop.props]
+            else:
+                names = [entry.attribute]
+
+            for name in names:
+                attributes.append(name)
+                if expressions is None:
+                    continue
+
+                expression = getattr(model, name)
+                if entry.info.get("export_mode") == EXPORT_SQL or (
+                    isinstance(
+                        getattr(expression, "property", None), ColumnProperty
+                    )
+                    and mapper.all_orm_descriptors[name].is_attribute
+                ):
+                    expressions.append(expression)
+                else:
+                    expressions = None
+
+        return FingerprintPlan(
+            repr((model.__name__, tuple(plan))).encode(),
+            tuple(attributes),
+            tuple(related),
+            None if expressions is None or related else tuple(expressions),
+        )
+
+    return plans.get(model, "fingerprint", (include, view), build)
+
+
+def _get_related_fingerprint(value, scalar: bool):
+    if scalar or value is None:
+        if hasattr(value, "get_fingerprint"):
+            return value.get_fingerprint()
+        return value
+
+    return [
+        v.get_fingerprint() if hasattr(v, "get_fingerprint") else v
+        for v in value
+    ]
+
+
+def get_fingerprint(instance, include=None, view=None) -> str:
+    """
+    Get fingerprint of a model instance by hashing raw values of its export
+    plan in plan order, without exporting them. Related instances are
+    hashed by their own fingerprint.
+
+    .. versionadded:: 0.8.0
+
+    :param instance: ``sqlalchemy_dict.BaseModel`` instance
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param view: View name
+    :return: Hex digest
+    """
+    plan = get_fingerprint_plan(instance.__class__, include, view)
+    digest = hashlib.sha1(plan.prefix)
+    digest.update(
+        repr(tuple(getattr(instance, a) for a in plan.attributes)).encode()
+    )
+    for attribute, scalar in plan.related:
+        digest.update(
+            repr(
+                _get_related_fingerprint(getattr(instance, attribute), scalar)
+            ).encode()
+        )
+    return digest.hexdigest()
+
+
+def get_query_fingerprint(model, query: Query, include=None, view=None) -> str:
+    """
+    Get fingerprint of a model query (including order of rows).
+
+    If export plan has just columns, synonyms, composites and ``sql``
+    hybrids (or model has a version column), raw values will be selected
+    and hashed without loading instances, otherwise it hashes fingerprint of
+    every instance.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param query:
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param view: View name
+    :return: Hex digest
+    """
+    plan = get_fingerprint_plan(model, include, view)
+    digest = hashlib.sha1(plan.prefix)
+    if plan.expressions is not None:
+        for row in query.with_entities(*plan.expressions):
+            digest.update(repr(tuple(row)).encode())
+    else:
+        for instance in query:
+            digest.update(get_fingerprint(instance, include, view).encode())
+    return digest.hexdigest()
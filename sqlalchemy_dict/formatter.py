@@ -1,4 +1,8 @@
-from datetime import datetime, timedelta, date, time
+import functools
+
+from datetime import datetime, timedelta, timezone, date, time
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import Callable, Optional
 
 from sqlalchemy_dict.utils import to_camel_case
 from sqlalchemy_dict.constants import (
@@ -6,12 +10,171 @@ from sqlalchemy_dict.constants import (
     ISO_DATE_FORMAT,
     ISO_DATETIME_PATTERN,
     ISO_TIME_FORMAT,
+    UTC_DATETIME_PATTERN,
+    DECIMAL_STR,
+    DECIMAL_FLOAT,
+    DECIMAL_SCALED,
+    DECIMAL_RAW,
+    DECIMAL_AUTO,
+    DECIMAL_MODES,
+    FLOAT_PRECISION,
+    DATETIME_ISO,
+    DATETIME_EPOCH_MILLIS,
+    DATETIME_MODES,
+    DATETIME_PRECISIONS,
 )
 
+_epoch = datetime(1970, 1, 1)
+_millisecond = timedelta(milliseconds=1)
+_zero = timedelta()
+
+# UTC offsets of time zones by time zone, ``None`` if it is not fixed
+_offsets = {}
+# Parsed UTC offsets of imported values by their text
+_parsed_offsets = {"Z": _zero}
+
+
+def _get_fixed_offset(tzinfo) -> Optional[timedelta]:
+    # Fixed offset time zones (e.g. ``datetime.timezone``) return their
+    # offset without a datetime, so it is looked up once per time zone
+    try:
+        return _offsets[tzinfo]
+    except KeyError:
+        pass
+
+    offset = tzinfo.utcoffset(None)
+    if len(_offsets) >= 1024:  # pragma: no cover
+        _offsets.clear()
+    _offsets[tzinfo] = offset
+    return offset
+
+
+def _to_naive_utc(value: datetime, naive_timezone) -> datetime:
+    tzinfo = value.tzinfo
+    if tzinfo is None:
+        offset = _get_fixed_offset(naive_timezone)
+        if offset is None:
+            offset = value.replace(tzinfo=naive_timezone).utcoffset()
+        return value - offset
+
+    offset = _get_fixed_offset(tzinfo)
+    if offset is None:
+        offset = value.utcoffset()
+    return value.replace(tzinfo=None) - offset
+
+
+def _from_naive_utc(value: datetime, naive_timezone, naive: bool):
+    if not naive:
+        return value.replace(tzinfo=timezone.utc)
+
+    offset = _get_fixed_offset(naive_timezone)
+    if offset is not None:
+        return value + offset
+    return (
+        value.replace(tzinfo=timezone.utc)
+        .astimezone(naive_timezone)
+        .replace(tzinfo=None)
+    )
+
+
+def _parse_offset(text: str) -> timedelta:
+    try:
+        return _parsed_offsets[text]
+    except KeyError:
+        pass
+
+    digits = text[1:].replace(":", "")
+    offset = timedelta(hours=int(digits[:2]), minutes=int(digits[2:]))
+    if text[0] == "-":
+        offset = -offset
+    _parsed_offsets[text] = offset
+    return offset
+
+
+@functools.lru_cache()
+def _get_utc_exporter(mode: str, precision: int, naive_timezone) -> Callable:
+    if mode == DATETIME_EPOCH_MILLIS:
+
+        def export_epoch_millis(value):
+            value = _to_naive_utc(value, naive_timezone)
+            return (value - _epoch) // _millisecond
+
+        return export_epoch_millis
+
+    end = 19 if precision == 0 else 20 + precision
+
+    def export_utc(value):
+        value = _to_naive_utc(value, naive_timezone)
+        return (
+            "%04d-%02d-%02dT%02d:%02d:%02d.%06d"
+            % (
+                value.year,
+                value.month,
+                value.day,
+                value.hour,
+                value.minute,
+                value.second,
+                value.microsecond,
+            )
+        )[:end] + "Z"
+
+    return export_utc
+
 
 class Formatter:
     """ Model formatter abstract class """
 
+    #: Export mode of ``Decimal`` values, one of:
+    #:
+    #: - ``str``: Export as string, e.g. ``'12.50'``.
+    #: - ``float``: Export as float.
+    #: - ``scaled``: Export as integer of the smallest unit using scale of
+    #:   ``Numeric`` column, e.g. ``1250`` for ``Numeric(10, 2)``, excess
+    #:   digits are rounded half to even. Columns without scale are exported
+    #:   as string.
+    #: - ``raw``: Pass ``Decimal`` through, for JSON encoders which handle it.
+    #: - ``auto``: ``float`` if precision of ``Numeric`` column fits in a
+    #:   float without loss, otherwise ``str``.
+    #:
+    #: .. versionadded:: 0.8.0
+    decimal_mode = DECIMAL_STR
+
+    #: Export mode of ``datetime`` values, one of:
+    #:
+    #: - ``iso``: Export by :func:`Formatter.export_datetime`, naive and
+    #:   aware values are exported as they are.
+    #: - ``utc``: Convert to UTC and export as ISO 8601 string ending with
+    #:   ``Z`` and :attr:`Formatter.datetime_precision` fraction digits,
+    #:   e.g. ``'2020-01-02T03:04:05.000Z'``.
+    #: - ``epoch_millis``: Convert to UTC and export as integer milliseconds
+    #:   since epoch.
+    #:
+    #: Naive values are in :attr:`Formatter.naive_timezone`. In ``utc`` and
+    #: ``epoch_millis`` modes, :func:`DefaultFormatter.import_datetime`
+    #: imports both formats, see :func:`Formatter.import_utc_datetime`.
+    #:
+    #: .. versionadded:: 0.8.0
+    datetime_mode = DATETIME_ISO
+
+    #: Fraction digits of ``utc`` datetime mode, ``0``, ``3`` or ``6``.
+    #:
+    #: .. versionadded:: 0.8.0
+    datetime_precision = 6
+
+    #: Time zone of naive values in ``utc`` and ``epoch_millis`` datetime
+    #: modes, a fixed offset time zone is converted without calling
+    #: ``utcoffset()`` per value.
+    #:
+    #: .. versionadded:: 0.8.0
+    naive_timezone = timezone.utc
+
+    #: Import naive datetimes (in :attr:`Formatter.naive_timezone`),
+    #: otherwise aware UTC datetimes, in ``utc`` and ``epoch_millis``
+    #: datetime modes.
+    #:
+    #: .. versionadded:: 0.8.0
+    import_naive = True
+
     @classmethod
     def export_key(cls, key):
         """
@@ -52,6 +215,137 @@ class Formatter:
         """
         raise NotImplementedError  # pragma: no cover
 
+    @classmethod
+    def get_datetime_exporter(cls) -> Callable:
+        """
+        Get exporter of ``datetime`` values by
+        :attr:`Formatter.datetime_mode`, it will be called once per model
+        when export plan is compiled.
+
+        Offsets of fixed offset time zones (e.g. ``datetime.timezone``) are
+        cached per time zone, other time zones (with daylight saving time)
+        are asked per value.
+
+        .. versionadded:: 0.8.0
+
+        :return:
+        """
+        mode = cls.datetime_mode
+        if mode not in DATETIME_MODES:
+            raise ValueError("Invalid datetime mode: %r" % mode)
+
+        if mode == DATETIME_ISO:
+            return cls.export_datetime
+
+        if cls.datetime_precision not in DATETIME_PRECISIONS:
+            raise ValueError(
+                "Invalid datetime precision: %r" % cls.datetime_precision
+            )
+        return _get_utc_exporter(
+            mode, cls.datetime_precision, cls.naive_timezone
+        )
+
+    @classmethod
+    def import_utc_datetime(cls, value: [str, int]) -> datetime:
+        """
+        Import datetime exported in ``utc`` or ``epoch_millis`` datetime
+        modes, also ISO 8601 strings with any (or without) UTC offset are
+        accepted. See :attr:`Formatter.import_naive`.
+
+        .. versionadded:: 0.8.0
+
+        :param value: String, or milliseconds since epoch
+        :return:
+        """
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            result = _epoch + timedelta(milliseconds=value)
+        else:
+            match = (
+                UTC_DATETIME_PATTERN.match(value)
+                if isinstance(value, str)
+                else None
+            )
+            if match is None:
+                raise ValueError("Invalid datetime format")
+
+            year, month, day, hour, minute, second, fraction, offset = (
+                match.groups()
+            )
+            try:
+                result = datetime(
+                    int(year),
+                    int(month),
+                    int(day),
+                    int(hour),
+                    int(minute),
+                    int(second),
+                    int(fraction.ljust(6, "0")) if fraction else 0,
+                )
+            except ValueError:
+                raise ValueError("Invalid datetime format")
+
+            if offset is not None:
+                result -= _parse_offset(offset)
+            elif cls.import_naive:
+                return result
+            else:
+                result = _to_naive_utc(result, cls.naive_timezone)
+
+        return _from_naive_utc(result, cls.naive_timezone, cls.import_naive)
+
+    @classmethod
+    def get_decimal_exporter(cls, type_=None) -> Optional[Callable]:
+        """
+        Get exporter of ``Decimal`` values of a column type by
+        :attr:`Formatter.decimal_mode`, it will be called once per column
+        when export plan is compiled.
+
+        .. versionadded:: 0.8.0
+
+        :param type_: ``sqlalchemy`` column type, ``None`` if it's unknown
+        :return: A callable, or ``None`` to export values as is
+        """
+        mode = cls.decimal_mode
+        if mode not in DECIMAL_MODES:
+            raise ValueError("Invalid decimal mode: %r" % mode)
+
+        precision = getattr(type_, "precision", None)
+        scale = getattr(type_, "scale", None)
+        if mode == DECIMAL_AUTO:
+            mode = (
+                DECIMAL_FLOAT
+                if precision is not None and precision <= FLOAT_PRECISION
+                else DECIMAL_STR
+            )
+
+        if mode == DECIMAL_FLOAT:
+            return float
+
+        if mode == DECIMAL_RAW:
+            return None
+
+        if mode == DECIMAL_SCALED and scale is not None:
+            # Excess digits should not be truncated
+            return lambda v: int(
+                v.scaleb(scale).to_integral_value(ROUND_HALF_EVEN)
+            )
+
+        return str
+
+    @classmethod
+    def export_decimal(cls, value: Decimal, type_=None):
+        """
+        Export python decimal, see :func:`Formatter.get_decimal_exporter`.
+
+        .. versionadded:: 0.8.0
+
+        :param value:
+        :param type_: ``sqlalchemy`` column type, ``None`` if it's unknown
+        :return:
+        """
+        exporter = cls.get_decimal_exporter(type_)
+        return value if exporter is None else exporter(value)
+
     @classmethod
     def import_datetime(cls, value: [str, int]) -> datetime:
         """
@@ -96,6 +390,8 @@ class DefaultFormatter(Formatter):
 
     @classmethod
     def export_datetime(cls, value):
+        if cls.datetime_mode != DATETIME_ISO:
+            return cls.get_datetime_exporter()(value)
         return value.isoformat()
 
     @classmethod
@@ -108,6 +404,9 @@ class DefaultFormatter(Formatter):
 
     @classmethod
     def import_datetime(cls, value):
+        if cls.datetime_mode != DATETIME_ISO:
+            return cls.import_utc_datetime(value)
+
         match = ISO_DATETIME_PATTERN.match(value)
         if not match:
             raise ValueError("Invalid datetime format")
@@ -0,0 +1,352 @@
+import csv
+import json
+
+from collections import namedtuple, OrderedDict
+from decimal import Decimal
+from typing import Iterable, TextIO, Tuple, Any
+
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import StatementError
+from sqlalchemy.ext.associationproxy import AssociationProxyInstance
+from sqlalchemy.ext.hybrid import HYBRID_PROPERTY
+from sqlalchemy.inspection import inspect
+from sqlalchemy.orm import (
+    ColumnProperty,
+    CompositeProperty,
+    RelationshipProperty,
+    SynonymProperty,
+)
+
+from sqlalchemy_dict.codegen import get_python_type
+from sqlalchemy_dict.plan import plans
+
+#: Result of a bulk load.
+#:
+#: - ``count``: Count of inserted rows
+#: - ``errors``: List of :data:`LoadError`
+LoadResult = namedtuple("LoadResult", ("count", "errors"))
+
+#: A rejected row.
+#:
+#: - ``line``: Line number of row in file
+#: - ``data``: Raw row data
+#: - ``error``: Exception
+LoadError = namedtuple("LoadError", ("line", "data", "error"))
+
+# Python types which should parse from CSV strings
+NUMERIC_TYPES = (int, float, Decimal)
+
+
+def _get_column_key(mapper, entry):
+    prop = getattr(entry.column, "property", None)
+    if not isinstance(prop, ColumnProperty) or len(prop.columns) != 1:
+        return None
+
+    if entry.attribute != prop.key and not _is_plain_synonym(
+        mapper.attrs.get(entry.attribute), prop.key
+    ):
+        return None
+    return prop.columns[0].key
+
+
+def _is_plain_synonym(prop, name: str) -> bool:
+    # Synonyms without a user defined descriptor get a proxy property from
+    # ``sqlalchemy`` which assigns the target attribute as is
+    if not isinstance(prop, SynonymProperty) or prop.name != name:
+        return False
+    fset = getattr(prop.descriptor, "fset", None)
+    return prop.descriptor is None or getattr(
+        fset, "__module__", ""
+    ).startswith("sqlalchemy.")
+
+
+def _get_children(model, entry) -> tuple:
+    if entry.children is not None:
+        return entry.children
+    return tuple(
+        model._build_plan_entry(getattr(model, p.key))
+        for p in entry.column.property.props
+    )
+
+
+def get_load_plan(model) -> dict:
+    """
+    Get table column keys of model import plan entries which can be loaded
+    by core inserts:
+
+    - Columns and plain synonyms are mapped to their table column key.
+    - Composites are mapped to a tuple of table column keys of their
+      constituents.
+    - Read-only hybrids (without setter), relationships and association
+      proxies are mapped to an empty tuple, they are ignored, same as
+      ``readonly`` columns.
+    - Entries assigned through python code (e.g. hybrids with setter,
+      synonyms with descriptor) are mapped to ``None``.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :return: Dictionary of dictionary keys and table column keys
+    """
+
+    def build():
+        mapper = inspect(model)
+        result = {}
+        for key, entry in model.get_import_plan().items():
+            descriptor = mapper.all_orm_descriptors.get(entry.attribute)
+            if (
+                getattr(descriptor, "extension_type", None) is HYBRID_PROPERTY
+                and descriptor.fset is None
+            ) or (
+                isinstance(entry.column, AssociationProxyInstance)
+                or isinstance(
+                    getattr(entry.column, "property", None),
+                    RelationshipProperty,
+                )
+            ):
+                result[key] = ()
+                continue
+
+            if isinstance(
+                getattr(entry.column, "property", None), CompositeProperty
+            ):
+                keys = tuple(
+                    _get_column_key(mapper, c)
+                    for c in _get_children(model, entry)
+                )
+                result[key] = None if None in keys else keys
+                continue
+
+            result[key] = _get_column_key(mapper, entry)
+        return result
+
+    return plans.get(model, "load", None, build)
+
+
+def _import_value(model, entry, value, parse_strings):
+    if parse_strings and isinstance(value, str):
+        python_type = get_python_type(entry.column)
+        if value == "":
+            value = None
+        elif python_type in NUMERIC_TYPES:
+            value = python_type(value)
+    return model.import_value(entry.column, value)
+
+
+def convert_row(model, data: dict, strict=False, parse_strings=False) -> dict:
+    """
+    Convert an input dictionary to table column values using model import
+    plan, ``readonly`` columns and read-only hybrids are ignored and values
+    are imported by ``sqlalchemy_dict.BaseModel.import_value``. Composites
+    (as dictionary or as list of values) are expanded to their constituent
+    columns, see :func:`get_load_plan`.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param data: Input dictionary
+    :param strict: Raise ``ValueError`` on unknown keys
+    :param parse_strings: Values are strings (e.g. CSV), so convert empty
+        strings to ``None`` and parse numbers
+    :return:
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Row should be an object")
+
+    load_plan = get_load_plan(model)
+    result = {}
+    for entry, value in model._extract_entries(data, strict):
+        column_key = load_plan[entry.key]
+        if column_key is None:
+            raise ValueError("Cannot bulk load key: %s" % entry.key)
+
+        if not isinstance(column_key, tuple):
+            result[column_key] = _import_value(
+                model, entry, value, parse_strings
+            )
+            continue
+
+        if not column_key:
+            continue
+
+        if parse_strings and isinstance(value, str):
+            # Written as JSON, see ``sqlalchemy_dict.writers.write_csv``
+            value = json.loads(value) if value else None
+
+        if value is None:
+            continue
+
+        children = _get_children(model, entry)
+        if isinstance(value, dict):
+            pairs = [
+                (c, k, value[c.key])
+                for c, k in zip(children, column_key)
+                if c.key in value
+            ]
+        elif isinstance(value, (list, tuple)) and len(value) == len(
+            children
+        ):
+            pairs = zip(children, column_key, value)
+        else:
+            raise ValueError("Invalid value of key: %s" % entry.key)
+
+        for child, key, v in pairs:
+            result[key] = _import_value(model, child, v, parse_strings)
+    return result
+
+
+def load_dicts(
+    model,
+    bind,
+    rows: Iterable[Tuple[int, Any]],
+    batch_size: int = 1000,
+    strict=False,
+    parse_strings=False,
+) -> LoadResult:
+    """
+    Insert input dictionaries into model table in batches using core
+    ``insert`` (``executemany``), without creating model instances.
+
+    Every batch runs in a savepoint, if it fails, rows of the batch will be
+    inserted one by one to find the failed rows. Rejected rows (including
+    values which can not be bound, e.g. a text as a number) are collected
+    and the stream continues.
+
+    The outer transaction is not committed, so ``bind`` should be a
+    ``Session`` or a ``Connection`` in a transaction, a ``Connection``
+    without transaction raises ``ValueError``.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param bind: ``Session`` or ``Connection``
+    :param rows: Iterable of line number and dictionary (or an exception to
+        reject the row)
+    :param batch_size: Rows per insert
+    :param strict: Reject rows with unknown keys
+    :param parse_strings: See :func:`convert_row`
+    :return: Errors are sorted by line number
+    """
+    if isinstance(bind, Connection) and not bind.in_transaction():
+        raise ValueError("Connection should be in a transaction")
+
+    insert = model.__table__.insert()
+    count = 0
+    errors = []
+    batch = []
+
+    def execute(values_list):
+        # Rows with different keys can not share an executemany
+        groups = OrderedDict()
+        for values in values_list:
+            groups.setdefault(tuple(sorted(values)), []).append(values)
+        for group in groups.values():
+            bind.execute(insert, group)
+
+    def flush():
+        savepoint = bind.begin_nested()
+        try:
+            execute([values for _, _, values in batch])
+            savepoint.commit()
+            return len(batch)
+        except StatementError:
+            savepoint.rollback()
+
+        inserted = 0
+        for line, data, values in batch:
+            savepoint = bind.begin_nested()
+            try:
+                bind.execute(insert, values)
+                savepoint.commit()
+                inserted += 1
+            except StatementError as ex:
+                savepoint.rollback()
+                errors.append(LoadError(line, data, ex))
+        return inserted
+
+    for line, data in rows:
+        try:
+            if isinstance(data, Exception):
+                raise data
+            values = convert_row(model, data, strict, parse_strings)
+        except (ValueError, TypeError) as ex:
+            errors.append(LoadError(line, data, ex))
+            continue
+
+        batch.append((line, data, values))
+        if len(batch) >= batch_size:
+            count += flush()
+            batch = []
+
+    if batch:
+        count += flush()
+
+    errors.sort(key=lambda e: e.line)
+    return LoadResult(count, errors)
+
+
+def _iter_ndjson(fp: TextIO):
+    for line, text in enumerate(fp, 1):
+        if not text.strip():
+            continue
+        try:
+            yield line, json.loads(text)
+        except ValueError as ex:
+            yield line, ex
+
+
+def load_ndjson(
+    model, bind, fp: TextIO, batch_size: int = 1000, strict=False
+) -> LoadResult:
+    """
+    Load newline delimited JSON objects (keyed by model dictionary keys)
+    into model table, see :func:`load_dicts`.
+
+    .. code-block:: python
+
+        with open('members.ndjson') as f:
+            result = load_ndjson(Member, session, f)
+        session.commit()
+        for error in result.errors:
+            print(error.line, error.error)
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param bind: ``Session`` or ``Connection``
+    :param fp: Text file-like object
+    :param batch_size: Rows per insert
+    :param strict: Reject rows with unknown keys
+    :return:
+    """
+    return load_dicts(model, bind, _iter_ndjson(fp), batch_size, strict)
+
+
+def load_csv(
+    model,
+    bind,
+    fp: TextIO,
+    batch_size: int = 1000,
+    strict=False,
+    **kwargs
+) -> LoadResult:
+    """
+    Load CSV rows (with a header of model dictionary keys) into model table,
+    see :func:`load_dicts`. Empty values are loaded as ``NULL``.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param bind: ``Session`` or ``Connection``
+    :param fp: Text file-like object, should be opened with ``newline=''``
+    :param batch_size: Rows per insert
+    :param strict: Reject rows with unknown keys
+    :param kwargs: Keyword-arguments that directly pass into
+        ``csv.DictReader``
+    :return:
+    """
+    reader = csv.DictReader(fp, **kwargs)
+    rows = ((reader.line_num, row) for row in reader)
+    return load_dicts(
+        model, bind, rows, batch_size, strict, parse_strings=True
+    )
@@ -0,0 +1,51 @@
+from collections.abc import Mapping
+
+
+class ModelMapping(Mapping):
+    """
+    Read-only lazy dictionary view over a model instance.
+
+    Keys comes from model export plan (see
+    :func:`sqlalchemy_dict.base_model.BaseModel.get_export_plan`) and values
+    will be exported on first access.
+
+    .. versionadded:: 0.8.0
+    """
+
+    __slots__ = ("_instance", "_columns", "_cache")
+
+    def __init__(self, instance):
+        """
+        Initialize the view
+
+        :param instance: ``sqlalchemy_dict.BaseModel`` instance
+        """
+        self._instance = instance
+        self._columns = instance.get_export_plan()
+        self._cache = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        entry = self._columns[key]
+        instance = self._instance
+        value = instance.prepare_for_export(
+            entry.column, getattr(instance, entry.attribute)
+        )[1]
+        self._cache[key] = value
+        return value
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+    def __contains__(self, key):
+        return key in self._columns
+
+    def __repr__(self):
+        return "<%s of %r>" % (self.__class__.__name__, self._instance)
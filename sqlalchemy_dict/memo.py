@@ -0,0 +1,82 @@
+from collections import OrderedDict
+
+from sqlalchemy.inspection import inspect
+
+
+class DumpMemo(object):
+    """
+    Dump-scoped memo of exported related instances, keyed by their identity
+    key, so every related instance is exported once per dump.
+
+    Memoized dictionaries are shared between the rows which refer to the same
+    instance, they should not be mutated.
+
+    In ``normalize`` mode related instances are exported as a reference
+    string (e.g. ``'Customer:1'``) and their dictionaries are collected in
+    :attr:`DumpMemo.included` by reference.
+
+    .. code-block:: python
+
+        >>> memo = DumpMemo()
+        >>> Order.dump_query(session.query(Order), memo=memo)
+
+    .. versionadded:: 0.8.0
+    """
+
+    __slots__ = ("normalize", "included", "_exported")
+
+    def __init__(self, normalize: bool = False):
+        """
+        Initialize the memo
+
+        :param normalize: Export related instances as reference
+        """
+        self.normalize = normalize
+        #: Dictionaries of related instances by reference, just in
+        #: ``normalize`` mode.
+        self.included = OrderedDict()
+        self._exported = {}
+
+    @staticmethod
+    def get_reference(identity_key: tuple) -> str:
+        """
+        Get reference string of an identity key, class name and primary key
+        values separated by ``:`` and ``,``.
+
+        :param identity_key:
+        :return:
+        """
+        return "%s:%s" % (
+            identity_key[0].__name__,
+            ",".join(str(i) for i in identity_key[1]),
+        )
+
+    def export(self, instance):
+        """
+        Export a related instance, instances without identity (e.g. pending)
+        are exported on every call.
+
+        :param instance: ``sqlalchemy_dict.BaseModel`` instance or ``None``
+        :return: Dictionary, or reference in ``normalize`` mode
+        """
+        if instance is None:
+            return None
+
+        key = inspect(instance).key
+        if key is None:
+            return instance.to_dict(memo=self)
+
+        if self.normalize:
+            reference = self.get_reference(key)
+            if reference not in self.included:
+                # Reserve the reference first, instances may refer to each
+                # other
+                self.included[reference] = None
+                self.included[reference] = instance.to_dict(memo=self)
+            return reference
+
+        try:
+            return self._exported[key]
+        except KeyError:
+            result = self._exported[key] = instance.to_dict(memo=self)
+            return result
@@ -0,0 +1,224 @@
+from collections import OrderedDict
+from typing import Iterable, Tuple
+
+from sqlalchemy import tuple_
+from sqlalchemy.inspection import inspect
+from sqlalchemy.orm import object_session
+from sqlalchemy.orm.relationships import RelationshipProperty
+
+from sqlalchemy_dict.plan import plans
+
+
+def is_nested_value(entry, value) -> bool:
+    """
+    Check an import plan entry is a relationship and the value is a
+    dictionary or a list of dictionaries (other values are assigned as is).
+
+    .. versionadded:: 0.8.0
+
+    :param entry: :data:`sqlalchemy_dict.plan.PlanEntry`
+    :param value: Input value
+    :return:
+    """
+    if not isinstance(
+        getattr(entry.column, "property", None), RelationshipProperty
+    ):
+        return False
+
+    if isinstance(value, dict):
+        return True
+
+    return isinstance(value, (list, tuple)) and any(
+        isinstance(i, dict) for i in value
+    )
+
+
+def get_identity_keys(model) -> tuple:
+    """
+    Get dictionary keys and columns of model primary key.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :return: Tuple of dictionary key and column pairs
+    """
+
+    def build():
+        mapper = inspect(model)
+        result = []
+        for column in mapper.primary_key:
+            attribute = getattr(
+                model, mapper.get_property_by_column(column).key
+            )
+            result.append((model.get_dict_key(attribute), attribute))
+        return tuple(result)
+
+    return plans.get(model, "identity_keys", None, build)
+
+
+def get_identity(model, data: dict):
+    """
+    Get primary key of an input dictionary, ``None`` if it's incomplete.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param data: Input dictionary
+    :return:
+    """
+    result = []
+    for key, column in get_identity_keys(model):
+        value = data.get(key)
+        if value is None:
+            return None
+        result.append(model.import_value(column, value))
+    return tuple(result)
+
+
+def _get_instance_identity(instance):
+    identity = inspect(instance).mapper.primary_key_from_instance(instance)
+    return None if None in identity else tuple(identity)
+
+
+def _query_identities(session, model, identities: list) -> dict:
+    columns = [c for _, c in get_identity_keys(model)]
+    if len(columns) == 1:
+        criterion = columns[0].in_([i[0] for i in identities])
+    else:
+        criterion = tuple_(*columns).in_(identities)
+
+    with session.no_autoflush:
+        return {
+            _get_instance_identity(i): i
+            for i in session.query(model).filter(criterion)
+        }
+
+
+def _update_collection(collection, children: list):
+    kept = set(id(c) for c in children)
+    for child in list(collection):
+        if id(child) not in kept:
+            collection.remove(child)
+
+    existing = set(id(c) for c in collection)
+    add = getattr(collection, "append", None) or collection.add
+    for child in children:
+        if id(child) not in existing:
+            add(child)
+
+
+def import_relationships(pairs: list, strict=False, session=None):
+    """
+    Import nested dictionaries of relationships for a batch of instances.
+
+    Children referenced by primary key are matched with the current children
+    first, the rest are resolved in one ``IN`` query per relationship for
+    whole batch. Dictionaries without primary key create new children using
+    the import plan of the related model. Collections are updated by adding
+    and removing the changed children (order of existing children is kept).
+
+    .. versionadded:: 0.8.0
+
+    :param pairs: List of instance and list of relationship entry and value
+        pairs
+    :param strict: See ``sqlalchemy_dict.BaseModel.update_from_dict``
+    :param session: Session to resolve children, default is session of
+        instances
+    :return:
+    """
+    # Identities to resolve by relationship
+    missing = OrderedDict()
+    steps = []
+    for instance, entries in pairs:
+        if session is None:
+            session = object_session(instance)
+
+        for entry, value in entries:
+            prop = entry.column.property
+            model = prop.mapper.class_
+            current = getattr(instance, prop.key)
+            if prop.uselist:
+                if not isinstance(value, (list, tuple)):
+                    raise ValueError("Expected a list: %s" % entry.key)
+                items = value
+            else:
+                items = [value]
+                current = [] if current is None else [current]
+
+            current = {_get_instance_identity(c): c for c in current}
+            identities = [
+                get_identity(model, i) if isinstance(i, dict) else None
+                for i in items
+            ]
+            missing.setdefault(prop, []).extend(
+                i for i in identities if i is not None and i not in current
+            )
+            steps.append((instance, prop, items, identities, current))
+
+    resolved = {}
+    for prop, identities in missing.items():
+        if not identities:
+            continue
+
+        if session is None:
+            raise ValueError("Session is required to resolve: %s" % prop.key)
+
+        found = _query_identities(session, prop.mapper.class_, identities)
+        unknown = [",".join(map(str, i)) for i in identities if i not in found]
+        if unknown:
+            raise ValueError(
+                "Not found %s: %s" % (prop.key, ", ".join(unknown))
+            )
+        resolved[prop] = found
+
+    children_pairs = []
+    for instance, prop, items, identities, current in steps:
+        children = []
+        for item, identity in zip(items, identities):
+            if not isinstance(item, dict):
+                children.append(item)
+                continue
+
+            if identity is None:
+                child = prop.mapper.class_()
+            elif identity in current:
+                child = current[identity]
+            else:
+                child = resolved[prop][identity]
+            children.append(child)
+            children_pairs.append((child, item))
+
+        if prop.uselist:
+            _update_collection(getattr(instance, prop.key), children)
+        elif getattr(instance, prop.key) is not children[0]:
+            setattr(instance, prop.key, children[0])
+
+    update_all_from_dict(children_pairs, strict, session)
+
+
+def update_all_from_dict(
+    pairs: Iterable[Tuple[object, dict]], strict=False, session=None
+):
+    """
+    Update a batch of instances from dictionaries, same as
+    ``sqlalchemy_dict.BaseModel.update_from_dict`` but nested relationships
+    of whole batch are resolved together (see :func:`import_relationships`).
+
+    .. versionadded:: 0.8.0
+
+    :param pairs: Iterable of instance and dictionary pairs
+    :param strict: See ``sqlalchemy_dict.BaseModel.update_from_dict``
+    :param session: Session to resolve children, default is session of
+        instances
+    :return:
+    """
+    batch = []
+    for instance, context in pairs:
+        entries = instance._assign_entries(
+            instance._extract_entries(context, strict)
+        )
+        if entries:
+            batch.append((instance, entries))
+
+    if batch:
+        import_relationships(batch, strict, session)
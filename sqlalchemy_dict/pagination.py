@@ -0,0 +1,226 @@
+import base64
+import binascii
+import json
+
+from collections import namedtuple
+from typing import Iterable
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query, ColumnProperty
+
+from sqlalchemy_dict.constants import EXPORT_SQL
+from sqlalchemy_dict.nested import get_identity_keys
+from sqlalchemy_dict.plan import plans
+
+#: Single ordering key of a keyset.
+#:
+#: - ``key``: Dictionary key
+#: - ``expression``: Column or ``sql`` hybrid expression
+#: - ``column``: Column to import cursor value by
+#: - ``descending``: Descending order
+KeysetEntry = namedtuple(
+    "KeysetEntry", ("key", "expression", "column", "descending")
+)
+
+
+def encode_cursor(values: Iterable) -> str:
+    """
+    Encode exported values of ordering keys as an opaque cursor.
+
+    .. versionadded:: 0.8.0
+
+    :param values:
+    :return:
+    """
+    text = json.dumps(list(values), separators=(",", ":"))
+    return base64.urlsafe_b64encode(text.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    """
+    Decode a cursor encoded by :func:`encode_cursor`.
+
+    .. versionadded:: 0.8.0
+
+    :param cursor:
+    :return:
+    """
+    try:
+        text = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(text.decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def _is_unique(expression) -> bool:
+    prop = getattr(expression, "property", None)
+    return (
+        isinstance(prop, ColumnProperty)
+        and len(prop.columns) == 1
+        and bool(getattr(prop.columns[0], "unique", False))
+    )
+
+
+def get_keyset(model, order_by: Iterable[str], include=None, view=None):
+    """
+    Get keyset of ordering dictionary keys, a leading ``-`` means descending
+    order. Primary key is appended to make the order unique.
+
+    Values of keyset are sent to clients in cursors, so if primary key is not
+    exported (e.g. ``protected``), ordering keys should contain a ``unique``
+    column instead, otherwise ``ValueError`` is raised.
+
+    Ordering keys should be exported (see
+    ``sqlalchemy_dict.BaseModel.get_export_plan``) columns, synonyms or
+    ``sql`` hybrids, and should not be ``NULL``.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param order_by: Ordering dictionary keys, e.g. ``('-createdAt',)``
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param view: View name
+    :return: Tuple of :data:`KeysetEntry`
+    """
+    order_by = tuple(order_by)
+    include, view = model.get_plan_options(include, view)
+
+    def build():
+        plan = model.get_export_plan(include, view)
+        keys = [(k.lstrip("-"), k.startswith("-")) for k in order_by]
+        ordered = set(k for k, _ in keys)
+
+        result = []
+        for key, descending in keys:
+            entry = plan.get(key)
+            if entry is None:
+                raise ValueError("Ordering key is not exported: %s" % key)
+
+            if not (
+                entry.info.get("export_mode") == EXPORT_SQL
+                or (
+                    isinstance(
+                        getattr(entry.column, "property", None),
+                        ColumnProperty,
+                    )
+                    and entry.children is None
+                )
+            ):
+                raise ValueError("Cannot order by: %s" % key)
+
+            result.append(
+                KeysetEntry(
+                    key,
+                    getattr(model, entry.attribute),
+                    entry.column,
+                    descending,
+                )
+            )
+
+        missing = [
+            (k, a) for k, a in get_identity_keys(model) if k not in ordered
+        ]
+        if all(k in plan for k, _ in missing):
+            result.extend(KeysetEntry(k, a, a, False) for k, a in missing)
+        elif not any(_is_unique(e.expression) for e in result):
+            raise ValueError(
+                "Primary key is not exported, order by a unique key: %s"
+                % ", ".join(k for k, _ in missing if k not in plan)
+            )
+        return tuple(result)
+
+    return plans.get(model, "keyset", (order_by, include, view), build)
+
+
+def apply_keyset(model, query: Query, keyset: tuple, cursor=None) -> Query:
+    """
+    Order query by keyset and filter rows after the cursor.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param query:
+    :param keyset: See :func:`get_keyset`
+    :param cursor: Cursor of the last row of previous page
+    :return:
+    """
+    if cursor is not None:
+        values = decode_cursor(cursor)
+        if len(values) != len(keyset):
+            raise ValueError("Invalid cursor")
+
+        values = [
+            model.import_value(e.column, v) for e, v in zip(keyset, values)
+        ]
+        criteria = []
+        for i, entry in enumerate(keyset):
+            expression = entry.expression
+            criteria.append(
+                and_(
+                    *(e.expression == v for e, v in zip(keyset, values[:i])),
+                    expression < values[i]
+                    if entry.descending
+                    else expression > values[i]
+                )
+            )
+        query = query.filter(or_(*criteria))
+
+    return query.order_by(
+        *(
+            e.expression.desc() if e.descending else e.expression.asc()
+            for e in keyset
+        )
+    )
+
+
+def paginate(
+    model,
+    query: Query,
+    order_by: Iterable[str],
+    cursor: str = None,
+    limit: int = 20,
+    include=None,
+    view=None,
+) -> dict:
+    """
+    Dump a page of query using keyset pagination, cost of every page is the
+    same as the first page.
+
+    .. code-block:: python
+
+        >>> page = paginate(Member, session.query(Member), ('-createdAt',))
+        >>> page['items']
+        [...]
+        >>> paginate(
+        ...     Member, session.query(Member), ('-createdAt',),
+        ...     cursor=page['next_cursor']
+        ... )
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param query:
+    :param order_by: Ordering dictionary keys, see :func:`get_keyset`
+    :param cursor: ``next_cursor`` of previous page
+    :param limit: Maximum items per page
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param view: View name
+    :return: Dictionary of ``items`` and ``next_cursor`` (``None`` on last
+        page)
+    """
+    keyset = get_keyset(model, order_by, include, view)
+    query = apply_keyset(model, query, keyset, cursor)
+    items = model.dump_query(
+        query.limit(limit + 1), include=include, view=view
+    )
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(items[-1][e.key] for e in keyset)
+
+    return dict(items=items, next_cursor=next_cursor)
@@ -0,0 +1,77 @@
+import threading
+
+from collections import namedtuple
+
+
+#: Single exported property of a model export plan.
+#:
+#: - ``key``: Dictionary key
+#: - ``attribute``: Model attribute name
+#: - ``column``: Model column, property proxy or descriptor
+#: - ``info``: Merged column info (see
+#:   :func:`sqlalchemy_dict.base_model.BaseModel.get_column_info`)
+#: - ``children``: Entries of constituent columns of composites exported
+#:   as dictionary, otherwise ``None``
+PlanEntry = namedtuple(
+    "PlanEntry", ("key", "attribute", "column", "info", "children")
+)
+PlanEntry.__new__.__defaults__ = (None,)
+
+
+class PlanCache(object):
+    """
+    Thread-safe cache for per-model plans.
+
+    Reading an already built plan is lock-free, a lock is taken just when a
+    plan is missing, so every plan will be built and published once even if
+    many threads ask for it at the same time. Plans should be immutable.
+
+    .. versionadded:: 0.8.0
+    """
+
+    def __init__(self):
+        self._plans = {}
+        # Re-entrant, a plan builder may ask for another plan
+        self._lock = threading.RLock()
+
+    def get(self, model: type, name: str, options, builder):
+        """
+        Get a plan, build it if not exists.
+
+        :param model: Model class
+        :param name: Plan name
+        :param options: Hashable plan options
+        :param builder: Callable without arguments to build the plan
+        :return:
+        """
+        key = (model, name, options)
+        try:
+            return self._plans[key]
+        except KeyError:
+            pass
+
+        with self._lock:
+            try:
+                return self._plans[key]
+            except KeyError:
+                plan = self._plans[key] = builder()
+                return plan
+
+    def clear(self, model: type = None):
+        """
+        Drop cached plans.
+
+        :param model: Drop just plans of this model
+        :return:
+        """
+        with self._lock:
+            if model is None:
+                self._plans = {}
+            else:
+                self._plans = {
+                    k: v for k, v in self._plans.items() if k[0] is not model
+                }
+
+
+#: Global plan cache used by :class:`sqlalchemy_dict.base_model.BaseModel`
+plans = PlanCache()
@@ -0,0 +1,486 @@
+import argparse
+import sys
+import tracemalloc
+
+from collections import OrderedDict, namedtuple
+from datetime import datetime, date, time, timedelta
+from decimal import Decimal
+from importlib import import_module
+from time import perf_counter
+from typing import Callable, Iterable, List
+
+from sqlalchemy import Column, Enum, create_engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.associationproxy import AssociationProxyInstance
+from sqlalchemy.ext.hybrid import HYBRID_PROPERTY
+from sqlalchemy.inspection import inspect
+from sqlalchemy.orm import CompositeProperty, sessionmaker
+from sqlalchemy.orm.relationships import RelationshipProperty
+from sqlalchemy.types import TypeDecorator
+
+from sqlalchemy_dict.codegen import compile_export_function
+from sqlalchemy_dict._warmup import warmup
+
+#: Kinds of dictionary keys which are highlighted when they dominate the
+#: export time of their model.
+HIGHLIGHTED_KINDS = frozenset(
+    ("hybrid", "relationship", "association_proxy", "custom")
+)
+
+#: Time (seconds) and peak allocated memory (bytes) of a run.
+Measure = namedtuple("Measure", ("time", "memory"))
+
+#: Profile of a dictionary key, ``importing`` is ``None`` if key can not be
+#: imported (e.g. relationships and read-only hybrids).
+ColumnProfile = namedtuple(
+    "ColumnProfile", ("key", "kind", "exporting", "importing")
+)
+
+#: Profile of a model, ``exporting`` and ``importing`` are measures of the
+#: whole dictionaries, ``columns`` is a list of :data:`ColumnProfile`.
+ModelProfile = namedtuple(
+    "ModelProfile", ("model", "rows", "exporting", "importing", "columns")
+)
+
+_start = datetime(2020, 1, 1)
+
+
+def _get_python_type(type_):
+    while True:
+        try:
+            return type_.python_type
+        except NotImplementedError:
+            if not isinstance(type_, TypeDecorator):
+                return None
+            type_ = type_.impl
+
+
+def generate_value(column: Column, index: int):
+    """
+    Generate a synthetic value of a table column by its type, integers are
+    ``index + 1`` so foreign keys refer to generated rows of the same
+    index. Unknown types are ``None``.
+
+    .. versionadded:: 0.8.0
+
+    :param column:
+    :param index: Row index
+    :return:
+    """
+    type_ = column.type
+    if isinstance(type_, Enum):
+        values = list(type_.enum_class or type_.enums)
+        return values[index % len(values)]
+
+    python_type = _get_python_type(type_)
+    if python_type is bool:
+        return index % 2 == 0
+    if python_type is int:
+        return index + 1
+    if python_type is float:
+        return index + 0.5
+    if python_type is Decimal:
+        return Decimal(index) + Decimal("0.25")
+    if python_type is str:
+        value = "%s %d" % (column.name, index)
+        length = getattr(type_, "length", None)
+        return value[-length:] if length else value
+    if python_type is bytes:
+        return str(index).encode()
+    if python_type is datetime:
+        return _start + timedelta(minutes=index)
+    if python_type is date:
+        return _start.date() + timedelta(days=index)
+    if python_type is time:
+        return time(index % 24, index % 60)
+    if python_type is timedelta:
+        return timedelta(seconds=index)
+    if python_type is dict:
+        return {"index": index}
+    if python_type is list:
+        return [index]
+    return None
+
+
+def populate(engine, models: Iterable[type], rows: int) -> None:
+    """
+    Create tables of models and insert synthetic rows, see
+    :func:`generate_value`. Foreign keys referring to their own table are
+    ``NULL`` (to avoid cycles), tables which can not be populated are
+    reported on ``stderr`` and left empty.
+
+    .. versionadded:: 0.8.0
+
+    :param engine:
+    :param models: ``sqlalchemy_dict.BaseModel`` subclasses
+    :param rows: Rows per table
+    :return:
+    """
+    identities = {}
+    metadata = None
+    for model in models:
+        mapper = inspect(model)
+        metadata = model.metadata
+        if mapper.polymorphic_on is not None:
+            identities.setdefault(
+                mapper.polymorphic_on, mapper.polymorphic_identity
+            )
+
+    if metadata is None:
+        return
+
+    metadata.create_all(engine)
+    for table in metadata.sorted_tables:
+        # Foreign keys referring to their own table are left empty
+        fixed = dict(identities)
+        fixed.update(
+            (c, None)
+            for c in table.columns
+            if not c.primary_key
+            and any(fk.column.table is table for fk in c.foreign_keys)
+        )
+        values = [
+            {
+                c.key: fixed[c] if c in fixed else generate_value(c, i)
+                for c in table.columns
+            }
+            for i in range(rows)
+        ]
+        try:
+            with engine.begin() as connection:
+                connection.execute(table.insert(), values)
+        except SQLAlchemyError as ex:
+            print(
+                "Can not populate %s: %s" % (table.name, ex), file=sys.stderr
+            )
+
+
+def get_entry_kind(model, entry) -> str:
+    """
+    Get kind of an export plan entry, one of ``column``, ``composite``,
+    ``relationship``, ``hybrid``, ``association_proxy`` and ``custom``
+    (custom column types and field ``export`` callables).
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param entry: :data:`sqlalchemy_dict.plan.PlanEntry`
+    :return:
+    """
+    if isinstance(entry.column, AssociationProxyInstance):
+        return "association_proxy"
+
+    descriptor = inspect(model).all_orm_descriptors.get(entry.attribute)
+    if getattr(descriptor, "extension_type", None) is HYBRID_PROPERTY:
+        return "hybrid"
+
+    prop = getattr(entry.column, "property", None)
+    if isinstance(prop, RelationshipProperty):
+        return "relationship"
+    if isinstance(prop, CompositeProperty):
+        return "composite"
+
+    type_ = getattr(entry.column, "type", None)
+    if entry.info.get("export") is not None or (
+        type_ is not None
+        and (
+            isinstance(type_, TypeDecorator)
+            or not type_.__class__.__module__.startswith("sqlalchemy.")
+        )
+    ):
+        return "custom"
+    return "column"
+
+
+def measure(function: Callable, repeat: int = 3) -> Measure:
+    """
+    Measure best time of ``repeat`` runs of a function and peak memory
+    allocated by a run (``tracemalloc``), after a warm up run (e.g. to
+    lazy load relationships).
+
+    .. versionadded:: 0.8.0
+
+    :param function: Callable without arguments
+    :param repeat:
+    :return:
+    """
+    function()
+    best = None
+    for _ in range(max(repeat, 1)):
+        start = perf_counter()
+        function()
+        elapsed = perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+
+    tracemalloc.start()
+    try:
+        function()
+        memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return Measure(best, memory)
+
+
+def _try_measure(function: Callable, repeat: int):
+    try:
+        return measure(function, repeat)
+    except Exception:
+        return None
+
+
+def profile_model(model, instances: list, repeat: int = 3) -> ModelProfile:
+    """
+    Profile exporting model instances to dictionaries and importing the
+    dictionaries into new instances, per model and per dictionary key.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param instances: Loaded model instances
+    :param repeat:
+    :return:
+    """
+    dictionaries = [o.to_dict() for o in instances]
+    import_plan = model.get_import_plan()
+    try:
+        targets = [o.__class__() for o in instances]
+    except TypeError:
+        # Models without a default constructor
+        targets = None
+
+    columns = []
+    importable = []
+    for key, entry in model.get_export_plan().items():
+        kind = get_entry_kind(model, entry)
+        export = compile_export_function(model, OrderedDict([(key, entry)]))
+        exporting = measure(
+            lambda: [export(o) for o in instances], repeat=repeat
+        )
+
+        importing = None
+        if (
+            targets is not None
+            and key in import_plan
+            and kind != "relationship"
+        ):
+            pairs = [
+                (t, {key: d[key]}) for t, d in zip(targets, dictionaries)
+            ]
+            importing = _try_measure(
+                lambda: [t.update_from_dict(v) for t, v in pairs], repeat
+            )
+            if importing is not None:
+                importable.append(key)
+
+        columns.append(ColumnProfile(key, kind, exporting, importing))
+
+    importing = None
+    if importable:
+        pairs = [
+            (t, {k: d[k] for k in importable})
+            for t, d in zip(targets, dictionaries)
+        ]
+        importing = measure(
+            lambda: [t.update_from_dict(v) for t, v in pairs], repeat
+        )
+
+    return ModelProfile(
+        model,
+        len(instances),
+        measure(lambda: [o.to_dict() for o in instances], repeat),
+        importing,
+        columns,
+    )
+
+
+def profile(
+    base: type, rows: int = 100, repeat: int = 3, names: Iterable[str] = None
+) -> List[ModelProfile]:
+    """
+    Profile models of a declarative base using synthetic rows in an
+    in-memory SQLite database, see :func:`profile_model`. Models which can
+    not be profiled are reported on ``stderr`` and skipped.
+
+    .. versionadded:: 0.8.0
+
+    :param base: Declarative base class
+    :param rows: Rows per table
+    :param repeat: Runs to measure time
+    :param names: Profile just these model names
+    :return:
+    """
+    models = warmup(base)
+    if names:
+        names = set(names)
+        models = [m for m in models if m.__name__ in names]
+
+    engine = create_engine("sqlite://")
+    populate(engine, models, rows)
+    session = sessionmaker(bind=engine)()
+    result = []
+    try:
+        for model in models:
+            try:
+                instances = session.query(model).limit(rows).all()
+                result.append(profile_model(model, instances, repeat))
+            except Exception as ex:
+                session.rollback()
+                print(
+                    "Can not profile %s: %s" % (model.__name__, ex),
+                    file=sys.stderr,
+                )
+        return result
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _format_measure(value, rows: int) -> str:
+    if value is None:
+        return "%10s %9s %10s" % ("-", "-", "-")
+    return "%8.3fms %7.2fus %8.1fKB" % (
+        value.time * 1000,
+        value.time * 1000000 / max(rows, 1),
+        value.memory / 1024,
+    )
+
+
+def format_report(profiles: Iterable[ModelProfile], threshold=0.2) -> str:
+    """
+    Format profiles as text, keys are sorted by export time and highlighted
+    keys (see :data:`HIGHLIGHTED_KINDS`) which take at least ``threshold``
+    of export time of their model are marked by ``!``.
+
+    .. versionadded:: 0.8.0
+
+    :param profiles:
+    :param threshold: Ratio of export time of model
+    :return:
+    """
+    lines = []
+    for p in profiles:
+        lines.append("%s (%d rows)" % (p.model.__name__, p.rows))
+        lines.append(
+            "  %-28s %-18s %10s %9s %10s   %10s %9s %10s"
+            % (
+                "key",
+                "kind",
+                "export",
+                "per row",
+                "memory",
+                "import",
+                "per row",
+                "memory",
+            )
+        )
+        lines.append(
+            "  %-28s %-18s %s   %s"
+            % (
+                "*",
+                "",
+                _format_measure(p.exporting, p.rows),
+                _format_measure(p.importing, p.rows),
+            )
+        )
+
+        total = sum(c.exporting.time for c in p.columns) or 1
+        for c in sorted(
+            p.columns, key=lambda c: c.exporting.time, reverse=True
+        ):
+            share = c.exporting.time / total
+            mark = (
+                "!"
+                if c.kind in HIGHLIGHTED_KINDS and share >= threshold
+                else " "
+            )
+            lines.append(
+                "%s %-28s %-12s %4.0f%% %s   %s"
+                % (
+                    mark,
+                    c.key,
+                    c.kind,
+                    share * 100,
+                    _format_measure(c.exporting, p.rows),
+                    _format_measure(c.importing, p.rows),
+                )
+            )
+        lines.append("")
+    return "\n".join(lines)
+
+
+def load_base(path: str) -> type:
+    """
+    Import a declarative base by ``module:name`` or ``module.name`` path.
+
+    .. versionadded:: 0.8.0
+
+    :param path:
+    :return:
+    """
+    if ":" in path:
+        module_name, name = path.split(":", 1)
+    else:
+        module_name, _, name = path.rpartition(".")
+
+    if not module_name or not name:
+        raise ValueError("Invalid path: %s" % path)
+    return getattr(import_module(module_name), name)
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Command line entry point, profile models of a declarative base, see
+    :func:`profile`.
+
+    .. code-block:: console
+
+        $ python -m sqlalchemy_dict.profile myapp.models:DeclarativeBase
+
+    .. versionadded:: 0.8.0
+
+    :param argv: Arguments, default is ``sys.argv[1:]``
+    :return: Exit code
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m sqlalchemy_dict.profile",
+        description="Profile export and import cost of models.",
+    )
+    parser.add_argument(
+        "base", help="Declarative base, e.g. myapp.models:DeclarativeBase"
+    )
+    parser.add_argument(
+        "-n", "--rows", type=int, default=100, help="Rows per table"
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=3, help="Runs to measure time"
+    )
+    parser.add_argument(
+        "-m",
+        "--model",
+        action="append",
+        dest="models",
+        help="Profile just this model, can be repeated",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Export time ratio to highlight hybrids, relationships, "
+        "association proxies and custom types",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        base = load_base(args.base)
+    except (ImportError, AttributeError, ValueError) as ex:
+        parser.error("Can not import %s: %s" % (args.base, ex))
+
+    profiles = profile(base, args.rows, args.repeat, args.models)
+    print(format_report(profiles, args.threshold))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
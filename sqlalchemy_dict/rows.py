@@ -0,0 +1,221 @@
+import json
+
+from collections.abc import Mapping
+from typing import Callable, Generator, Iterable
+
+from sqlalchemy.orm import ColumnProperty
+
+try:
+    from sqlalchemy.engine import Result
+except ImportError:
+    # SQLAlchemy < 1.4
+    from sqlalchemy.engine import ResultProxy as Result
+
+from sqlalchemy_dict.codegen import (
+    compile_function,
+    compile_value,
+    get_namespace,
+    get_type_exporters,
+    is_export_customized,
+)
+from sqlalchemy_dict.plan import plans
+
+
+def get_row_keys(row) -> tuple:
+    """
+    Get column keys of a result row, ``sqlalchemy`` ``RowProxy`` (1.3),
+    ``Row`` and ``RowMapping`` (1.4+) are supported.
+
+    .. versionadded:: 0.8.0
+
+    :param row:
+    :return:
+    """
+    fields = getattr(row, "_fields", None)
+    if fields is not None:
+        return tuple(fields)
+    return tuple(row.keys())
+
+
+def get_row_columns(model, include=None, view=None) -> dict:
+    """
+    Get export plan entries of model columns by their table column name and
+    key. Table columns which are not exported (e.g. ``protected``) are mapped
+    to ``None``.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param view: View name
+    :return:
+    """
+    include, view = model.get_plan_options(include, view)
+
+    def build():
+        result = {}
+        for column in model.__table__.columns:
+            result[column.name] = result[column.key] = None
+
+        for entry in model.get_export_plan(include, view).values():
+            prop = getattr(entry.column, "property", None)
+            if (
+                not isinstance(prop, ColumnProperty)
+                or len(prop.columns) != 1
+                or entry.children is not None
+            ):
+                continue
+
+            column = prop.columns[0]
+            for key in (entry.attribute, column.name, column.key):
+                if result.get(key) is None:
+                    result[key] = entry
+        return result
+
+    return plans.get(model, "row_columns", (include, view), build)
+
+
+def compile_row_function(model, keys: tuple, include=None, view=None):
+    """
+    Generate a python function which converts a result row (by position) to
+    model dictionary, columns of model are exported same as
+    ``sqlalchemy_dict.BaseModel.to_dict`` and other columns (e.g. labels)
+    are exported by ``sqlalchemy_dict.BaseModel.export_value`` with
+    formatted key.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param keys: Column keys of rows, see :func:`get_row_keys`
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param view: View name
+    :return:
+    """
+    columns = get_row_columns(model, include, view)
+    formatter = model.__formatter__
+    namespace = get_namespace(model)
+    type_exporters = get_type_exporters(model, formatter)
+    customized = is_export_customized(model)
+
+    lines = ["def row_to_dict(row):"]
+    items = []
+    for i, key in enumerate(keys):
+        name = "%d" % i
+        value = "v" + name
+        if key not in columns:
+            lines.append("    %s = row[%d]" % (value, i))
+            expression = "export_value(%s)" % value
+            items.append("%r: %s" % (formatter.export_key(key), expression))
+            continue
+
+        entry = columns[key]
+        if entry is None:
+            continue
+
+        lines.append("    %s = row[%d]" % (value, i))
+        if customized:
+            namespace["c" + name] = entry.column
+            expression = "prepare_for_export(c%s, %s)[1]" % (name, value)
+        else:
+            expression = compile_value(
+                namespace, type_exporters, entry, name, value, formatter
+            )
+        items.append("%r: %s" % (entry.key, expression))
+
+    lines.append("    return {")
+    lines.extend("        %s," % i for i in items)
+    lines.append("    }")
+
+    return compile_function(
+        model, "row_to_dict", lines, namespace, id(columns) ^ hash(keys)
+    )
+
+
+def get_row_function(model, keys: tuple, include=None, view=None) -> Callable:
+    """
+    Same as :func:`compile_row_function` but cached per model, keys,
+    ``include`` and ``view``.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param keys: Column keys of rows, see :func:`get_row_keys`
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param view: View name
+    :return:
+    """
+    include, view = model.get_plan_options(include, view)
+    return plans.get(
+        model,
+        "row_function",
+        (model.__formatter__, keys, include, view),
+        lambda: compile_row_function(model, keys, include, view),
+    )
+
+
+def iter_rows(
+    model, rows: Iterable, include=None, view=None
+) -> Generator[dict, None, None]:
+    """
+    Convert result rows of a core ``select()`` (or a ``Result``) to model
+    dictionaries without creating model instances. Result columns are mapped
+    to model columns by their name, so dictionary keys, ``protected``
+    columns, field ``export`` hooks and formatter are applied.
+
+    .. code-block:: python
+
+        >>> result = session.execute(select([Member.__table__]))
+        >>> list(iter_rows(Member, result))
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param rows: Iterable of ``Row``, ``RowMapping`` or ``RowProxy``
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param view: View name
+    :return:
+    """
+    function = None
+    for row in rows:
+        if function is None:
+            function = get_row_function(
+                model, get_row_keys(row), include, view
+            )
+
+        if isinstance(row, Mapping):
+            row = tuple(row.values())
+        yield function(row)
+
+
+def dump_rows(model, rows: Iterable, include=None, view=None) -> list:
+    """
+    Same as :func:`iter_rows` but returns a list.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param rows: Iterable of ``Row``, ``RowMapping`` or ``RowProxy``
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param view: View name
+    :return:
+    """
+    return list(iter_rows(model, rows, include, view))
+
+
+def dump_rows_json(
+    model, rows: Iterable, include=None, view=None, **kwargs
+) -> str:
+    """
+    Convert result rows to a JSON array of model dictionaries, see
+    :func:`iter_rows`.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param rows: Iterable of ``Row``, ``RowMapping`` or ``RowProxy``
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param view: View name
+    :param kwargs: Keyword-arguments that directly pass into ``json.dumps``
+    :return:
+    """
+    return json.dumps(dump_rows(model, rows, include, view), **kwargs)
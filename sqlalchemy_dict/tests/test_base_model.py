@@ -405,3 +405,53 @@ def test_time_format():
         member_dict = dict(member_dict_sample)
         member_dict.update({"breakfastTime": "08-08-08"})
         member.update_from_dict(member_dict)
+
+
+def test_as_mapping():
+    member = Member()
+    member.update_from_dict(member_dict_sample)
+    member_dict = member.to_dict()
+
+    mapping = member.as_mapping()
+    assert list(mapping.keys()) == list(member_dict.keys())
+    assert len(mapping) == len(member_dict)
+    assert "password" not in mapping
+    assert mapping["birth"] == "2001-01-01"
+    assert mapping.get("notExists") is None
+    assert dict(mapping) == member_dict
+
+    with pytest.raises(KeyError):
+        mapping["password"]
+
+    with pytest.raises(TypeError):
+        mapping["title"] = "other"
+
+    # Values are cached after first access
+    member.title = "changed"
+    assert mapping["title"] == member_dict_sample["title"]
+    assert member.as_mapping()["title"] == "changed"
+
+
+def test_update_from_dict_strict():
+    member = Member()
+    member.update_from_dict({"title": "test", "unknown": 1})
+    assert member.title == "test"
+
+    with pytest.raises(ValueError) as info:
+        member.update_from_dict(
+            {"title": "other", "unknown": 1, "another": 2}, strict=True
+        )
+    assert str(info.value) == "Unknown keys: another, unknown"
+    assert member.title == "test"
+
+    # Readonly keys are known but ignored
+    member.update_from_dict(
+        {"title": "other", "isActive": True, "password": "1"}, strict=True
+    )
+    assert member.title == "other"
+    assert member.is_active is None
+    assert member.password == "hashed:1"
+
+    assert list(Member.extract_data_from_dict({"phone": "1", "x": 1})) == [
+        (Member.phone, "1")
+    ]
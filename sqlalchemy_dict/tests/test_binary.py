@@ -0,0 +1,173 @@
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from sqlalchemy import (
+    Integer,
+    Unicode,
+    Date,
+    DateTime,
+    Time,
+    Numeric,
+    ForeignKey,
+)
+
+from sqlalchemy_dict import Field, relationship
+from sqlalchemy_dict.binary import (
+    ExtType,
+    decode_ext,
+    encode_ext,
+    py_pack,
+    py_unpack,
+    pack,
+    unpack,
+    unpack_dict,
+    get_field_ids,
+)
+from sqlalchemy_dict.tests.db import DeclarativeBase
+
+
+class Shipment(DeclarativeBase):
+    __tablename__ = "shipment"
+
+    id = Field(Integer, primary_key=True)
+    title = Field(Unicode(50))
+    shipped_at = Field(DateTime)
+    due_on = Field(Date)
+    pickup = Field(Time)
+    weight = Field(Numeric(10, 3))
+    parcels = relationship("Parcel")
+
+
+class Parcel(DeclarativeBase):
+    __tablename__ = "parcel"
+
+    id = Field(Integer, primary_key=True)
+    shipment_id = Field(Integer, ForeignKey("shipment.id"))
+    received_at = Field(DateTime)
+
+
+@pytest.mark.parametrize(
+    "value, data",
+    [
+        (None, b"\xc0"),
+        (True, b"\xc3"),
+        (-1, b"\xff"),
+        (200, b"\xcc\xc8"),
+        (-200, b"\xd1\xff\x38"),
+        (2 ** 32, b"\xcf\x00\x00\x00\x01\x00\x00\x00\x00"),
+        (1.5, b"\xcb\x3f\xf8\x00\x00\x00\x00\x00\x00"),
+        ("a" * 40, b"\xd9\x28" + b"a" * 40),
+        (b"\x01", b"\xc4\x01\x01"),
+        ([1, 2], b"\x92\x01\x02"),
+        ({"a": 1}, b"\x81\xa1a\x01"),
+        (ExtType(5, b"ab"), b"\xd5\x05ab"),
+        (ExtType(5, b"abc"), b"\xc7\x03\x05abc"),
+    ],
+)
+def test_py_pack(value, data):
+    assert py_pack(value) == data
+    assert py_unpack(data) == value
+
+
+def test_py_unpack():
+    assert py_unpack(b"\xca\x3f\xc0\x00\x00") == 1.5
+    assert py_unpack(b"\xdc\x00\x01\x01") == [1]
+
+    for data in (b"\xc1", b"\xa2a", b"\x01\x02"):
+        with pytest.raises(ValueError):
+            py_unpack(data)
+
+    with pytest.raises(TypeError):
+        py_pack(object())
+
+
+@pytest.mark.parametrize("dumps, loads", [(pack, unpack), (py_pack, unpack)])
+def test_ext_types(dumps, loads):
+    tz = timezone(timedelta(hours=3, minutes=30))
+    values = [
+        datetime(2020, 1, 2, 3, 4, 5, 6),
+        datetime(1900, 1, 2, 3, 4, 5, 6, tz),
+        date(2020, 1, 2),
+        time(3, 4, 5, 6),
+        time(3, 4, 5, 6, tz),
+        Decimal("-1.250"),
+    ]
+    result = loads(dumps(values))
+    assert result == values
+    assert result[1].utcoffset() == timedelta(hours=3, minutes=30)
+    assert str(result[5]) == "-1.250"
+
+
+def test_msgpack_interoperability():
+    msgpack = pytest.importorskip("msgpack")
+    values = [
+        None,
+        2 ** 32,
+        "a" * 40,
+        b"\x01",
+        {"a": [1, 1.5]},
+        datetime(2020, 1, 2, 3, 4, 5, 6),
+        date(2020, 1, 2),
+        time(3, 4, 5, 6, timezone.utc),
+        Decimal("-1.250"),
+    ]
+    assert (
+        msgpack.unpackb(py_pack(values), ext_hook=decode_ext, raw=False)
+        == values
+    )
+    assert (
+        py_unpack(msgpack.packb(values, default=encode_ext, use_bin_type=True))
+        == values
+    )
+
+
+def test_pack_instance(db):
+    shipment = Shipment(
+        title="first",
+        shipped_at=datetime(2020, 1, 2, 3, 4, 5),
+        due_on=date(2020, 1, 3),
+        pickup=time(9, 30),
+        weight=Decimal("1.500"),
+        parcels=[Parcel(received_at=datetime(2020, 1, 3, 10))],
+    )
+    db.session.add(shipment)
+    db.session.commit()
+
+    result = unpack(shipment.to_msgpack())
+    assert result == {
+        "id": 1,
+        "title": "first",
+        "shippedAt": datetime(2020, 1, 2, 3, 4, 5),
+        "dueOn": date(2020, 1, 3),
+        "pickup": time(9, 30),
+        "weight": Decimal("1.500"),
+        "parcels": [
+            {
+                "id": 1,
+                "shipmentId": 1,
+                "receivedAt": datetime(2020, 1, 3, 10),
+            }
+        ],
+    }
+    # Text export is not affected
+    assert shipment.to_dict()["shippedAt"] == "2020-01-02T03:04:05"
+
+    keys = get_field_ids(Shipment)
+    data = shipment.to_msgpack(field_ids=True)
+    assert len(data) < len(shipment.to_msgpack())
+    assert unpack(data)[keys.index("dueOn")] == date(2020, 1, 3)
+    assert unpack_dict(Shipment, data, field_ids=True) == result
+    with pytest.raises(ValueError):
+        unpack_dict(Shipment, pack({99: 1}), field_ids=True)
+
+    # Decoded values are imported as is
+    result.update(title="second", weight=Decimal("2.250"))
+    del result["parcels"]
+    shipment.update_from_dict(result)
+    assert shipment.due_on == date(2020, 1, 3)
+    assert shipment.weight == Decimal("2.250")
+
+    data = Shipment.dump_msgpack(db.session.query(Shipment), field_ids=True)
+    assert unpack_dict(Shipment, data, field_ids=True)[0]["title"] == "second"
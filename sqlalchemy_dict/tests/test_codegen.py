@@ -0,0 +1,230 @@
+from decimal import Decimal
+
+import pytest
+
+from sqlalchemy import (
+    Integer,
+    Unicode,
+    Numeric,
+    Boolean,
+    Date,
+    DateTime,
+    Time,
+    Float,
+    Enum,
+    ForeignKey,
+)
+
+from sqlalchemy_dict import (
+    Field,
+    DefaultFormatter,
+    composite,
+    hybrid_property,
+    relationship,
+    synonym,
+)
+from sqlalchemy_dict.plan import plans
+from sqlalchemy_dict.tests.db import DeclarativeBase
+
+
+class Name(object):
+    def __init__(self, first, last):
+        self.first = first
+        self.last = last
+
+    def __composite_values__(self):
+        return "%s %s" % (self.first, self.last)
+
+
+class Contact(DeclarativeBase):
+    __tablename__ = "contact"
+
+    id = Field(Integer, primary_key=True)
+    first_name = Field(Unicode(50))
+    last_name = Field(Unicode(50), dict_key="surname")
+    name = composite(Name, first_name, last_name, readonly=True)
+    _email = Field("email", Unicode(100), protected=True)
+    email = synonym("_email", protected=False)
+    birth = Field(Date)
+    breakfast_time = Field(Time, nullable=True)
+    weight = Field(Float(asdecimal=True))
+    visible = Field(Boolean, nullable=True)
+    last_login_time = Field(DateTime)
+    role = Field(Enum("admin", "normal", name="contact_role"))
+    referrer_id = Field(Integer, ForeignKey("contact.id"))
+    referrer = relationship("Contact", remote_side=[id])
+
+    @hybrid_property
+    def is_visible(self):
+        return self.visible
+
+    @is_visible.expression
+    def is_visible(cls):
+        return cls.visible.is_(True)
+
+
+contact_dict_sample = {
+    "firstName": "john",
+    "surname": "doe",
+    "email": "john@example.com",
+    "birth": "2001-01-01",
+    "breakfastTime": "08:30:00",
+    "visible": True,
+    "lastLoginTime": "2017-10-10T10:10:00.12313",
+    "role": "admin",
+}
+
+
+class Invoice(DeclarativeBase):
+    __tablename__ = "invoice"
+
+    id = Field(Integer, primary_key=True)
+    title = Field(Unicode(50))
+    amount = Field(Numeric(10, 2))
+
+    @classmethod
+    def prepare_for_export(cls, column, v):
+        key, value = super().prepare_for_export(column, v)
+        if isinstance(value, str):
+            value = value.upper()
+        return key, value
+
+
+def test_export_function():
+    contact = Contact()
+    contact.update_from_dict(contact_dict_sample)
+    contact.weight = Decimal("1.5")
+
+    expected = {}
+    for entry in Contact.get_export_plan().values():
+        expected.setdefault(
+            *Contact.prepare_for_export(
+                entry.column, getattr(contact, entry.attribute)
+            )
+        )
+
+    function = Contact.get_export_function()
+    assert function is Contact.get_export_function()
+    assert function(contact) == expected == contact.to_dict()
+    assert contact.to_dict()["weight"] == "1.5"
+    assert contact.to_dict()["name"] == "john doe"
+
+    source = function.source
+    assert source.startswith("def to_dict(self, computed=None, memo=None):")
+    assert "'surname'" in source
+    assert "self.last_login_time" in source
+
+
+def test_export_function_customized():
+    invoice = Invoice(title="abc", amount=Decimal("2.50"))
+    assert invoice.to_dict() == {"id": None, "title": "ABC", "amount": "2.50"}
+    assert "prepare_for_export(" in Invoice.get_export_function().source
+
+
+class Account(DeclarativeBase):
+    __tablename__ = "account"
+
+    id = Field(Integer, primary_key=True)
+    card_number = Field(
+        Unicode(16),
+        export=lambda v: v and "*" * 12 + v[-4:],
+        import_=lambda v: v and v.replace(" ", ""),
+    )
+    balance = Field(
+        Numeric(10, 2),
+        export=lambda v: None if v is None else round(float(v)),
+        import_=lambda v: None if v is None else Decimal(v) / 100,
+    )
+
+
+def test_field_hooks():
+    account = Account()
+    account.update_from_dict(
+        {"cardNumber": "1234 5678 9012 3456", "balance": 12345}
+    )
+    assert account.card_number == "1234567890123456"
+    assert account.balance == Decimal("123.45")
+
+    result = account.to_dict()
+    assert result == {
+        "id": None,
+        "cardNumber": "************3456",
+        "balance": 123,
+    }
+    assert dict(account.as_mapping()) == result
+    assert "x1(v1)" in Account.get_export_function().source
+
+    account.update_from_dict({"cardNumber": None, "balance": None})
+    assert account.to_dict()["cardNumber"] is None
+
+
+class Price(DeclarativeBase):
+    __tablename__ = "price"
+
+    id = Field(Integer, primary_key=True)
+    amount = Field(Numeric(10, 2))
+    rate = Field(Numeric(30, 10))
+    ratio = Field(Numeric())
+
+
+@pytest.mark.parametrize(
+    "mode,expected",
+    [
+        ("str", {"amount": "12.50", "rate": "0.1000000000", "ratio": "0.5"}),
+        ("float", {"amount": 12.5, "rate": 0.1, "ratio": 0.5}),
+        ("scaled", {"amount": 1250, "rate": 1000000000, "ratio": "0.5"}),
+        (
+            "raw",
+            {
+                "amount": Decimal("12.50"),
+                "rate": Decimal("0.1000000000"),
+                "ratio": Decimal("0.5"),
+            },
+        ),
+        ("auto", {"amount": 12.5, "rate": "0.1000000000", "ratio": "0.5"}),
+    ],
+)
+def test_decimal_mode(mode, expected):
+    class Formatter(DefaultFormatter):
+        decimal_mode = mode
+
+    Price.__formatter__ = Formatter
+    try:
+        price = Price(
+            id=1,
+            amount=Decimal("12.50"),
+            rate=Decimal("0.1000000000"),
+            ratio=Decimal("0.5"),
+        )
+        expected["id"] = 1
+        result = price.to_dict()
+        assert result == expected
+        assert {k: type(v) for k, v in result.items()} == {
+            k: type(v) for k, v in expected.items()
+        }
+        assert dict(price.as_mapping()) == expected
+
+        price.amount = None
+        assert price.to_dict()["amount"] is None
+
+        if mode == "scaled":
+            # Excess digits are rounded, not truncated
+            for value, result in (
+                ("1.999", 200),
+                ("-1.999", -200),
+                ("1.005", 100),
+                ("1.015", 102),
+            ):
+                price.amount = Decimal(value)
+                assert price.to_dict()["amount"] == result
+    finally:
+        del Price.__formatter__
+        plans.clear(Price)
+
+
+def test_invalid_decimal_mode():
+    class Formatter(DefaultFormatter):
+        decimal_mode = "double"
+
+    with pytest.raises(ValueError):
+        Formatter.export_decimal(Decimal("1"))
@@ -0,0 +1,90 @@
+from datetime import date
+
+import pytest
+
+from sqlalchemy import Integer, Unicode, Boolean, Date, func
+
+from sqlalchemy_dict import Field, hybrid_property, synonym
+from sqlalchemy_dict.columnar import get_columnar_entries, iter_chunks
+from sqlalchemy_dict.tests.db import DeclarativeBase
+
+
+class Gadget(DeclarativeBase):
+    __tablename__ = "gadget"
+
+    id = Field(Integer, primary_key=True)
+    title = Field(Unicode(50))
+    _code = Field("code", Unicode(10), protected=True)
+    code = synonym("_code", dict_key="productCode", protected=False)
+    available = Field(Boolean, nullable=True)
+    released = Field(Date, nullable=True)
+
+    @hybrid_property(export_mode="sql")
+    def title_length(self):  # pragma: no cover
+        return len(self.title)
+
+    @title_length.expression
+    def title_length(cls):
+        return func.length(cls.title)
+
+
+def add_gadgets(db):
+    db.session.add_all(
+        [
+            Gadget(title="p%d" % i, available=i % 2 == 0, code="c%d" % i)
+            for i in range(5)
+        ]
+    )
+    db.session.add(Gadget(title="dated", released=date(2019, 1, 2)))
+    db.session.commit()
+
+
+def test_iter_chunks(db):
+    add_gadgets(db)
+    keys = [e.key for e in get_columnar_entries(Gadget)]
+    assert keys == [
+        "id",
+        "title",
+        "productCode",
+        "available",
+        "released",
+        "titleLength",
+    ]
+
+    query = db.session.query(Gadget).order_by(Gadget.id)
+    chunks = list(iter_chunks(Gadget, query, chunk_size=4))
+    assert [len(c[0]) for c in chunks] == [4, 2]
+    assert chunks[0][1] == ("p0", "p1", "p2", "p3")
+    assert chunks[1][5] == (2, 5)
+
+
+def test_to_numpy(db):
+    numpy = pytest.importorskip("numpy")
+    from sqlalchemy_dict.columnar import to_numpy
+
+    add_gadgets(db)
+    query = db.session.query(Gadget).order_by(Gadget.id)
+    result = to_numpy(Gadget, query, chunk_size=4)
+    assert list(result["id"]) == [1, 2, 3, 4, 5, 6]
+    assert result["released"].dtype == numpy.dtype("datetime64[D]")
+    assert str(result["released"][5]) == "2019-01-02"
+    assert numpy.isnat(result["released"][0])
+
+    result = to_numpy(Gadget, query.filter(Gadget.id > 100))
+    assert len(result["title"]) == 0
+
+
+def test_to_arrow(db):
+    pytest.importorskip("pyarrow")
+    from sqlalchemy_dict.columnar import to_arrow
+
+    add_gadgets(db)
+    query = db.session.query(Gadget).order_by(Gadget.id)
+    table = to_arrow(Gadget, query, chunk_size=4)
+    assert table.num_rows == 6
+    assert table.column_names[:3] == ["id", "title", "productCode"]
+    assert table.column("title").to_pylist()[0] == "p0"
+    assert table.column("available").to_pylist()[:2] == [True, False]
+
+    table = to_arrow(Gadget, query.filter(Gadget.id > 100))
+    assert table.num_rows == 0
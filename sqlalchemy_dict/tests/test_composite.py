@@ -0,0 +1,98 @@
+from datetime import date
+
+from sqlalchemy import Integer, Unicode, Date
+
+from sqlalchemy_dict import Field, composite
+from sqlalchemy_dict.tests.db import DeclarativeBase
+
+
+class Period(object):
+    def __init__(self, start, end):
+        self.start = start
+        self.end = end
+
+    def __composite_values__(self):
+        return self.start, self.end
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, Period)
+            and other.start == self.start
+            and other.end == self.end
+        )
+
+    def __ne__(self, other):  # pragma: no cover
+        return not self.__eq__(other)
+
+
+class Campaign(DeclarativeBase):
+    __tablename__ = "campaign"
+
+    id = Field(Integer, primary_key=True)
+    title = Field(Unicode(50))
+    start_date = Field(Date, dict_key="from")
+    end_date = Field(Date, dict_key="to")
+    period = composite(Period, start_date, end_date, as_dict=True)
+
+
+class Term(DeclarativeBase):
+    __tablename__ = "term"
+
+    id = Field(Integer, primary_key=True)
+    start_date = Field(Date)
+    end_date = Field(Date)
+    period = composite(Period, start_date, end_date)
+
+
+def test_composite_as_dict(db):
+    campaign = Campaign(title="summer")
+    campaign.update_from_dict(
+        {"period": {"from": "2019-06-01", "to": "2019-09-01"}}
+    )
+    assert campaign.period == Period(date(2019, 6, 1), date(2019, 9, 1))
+    db.session.add(campaign)
+    db.session.commit()
+
+    result = campaign.to_dict()
+    assert result["period"] == {"from": "2019-06-01", "to": "2019-09-01"}
+
+    # Round trip
+    campaign.update_from_dict(result)
+    assert campaign.period == Period(date(2019, 6, 1), date(2019, 9, 1))
+
+    # Partial update keeps missing constituents
+    campaign.update_from_dict({"period": {"to": "2019-10-01"}})
+    db.session.commit()
+    assert campaign.period == Period(date(2019, 6, 1), date(2019, 10, 1))
+    assert campaign.end_date == date(2019, 10, 1)
+
+    # Generic export path (used by lazy mapping) gives the same output
+    assert campaign.as_mapping()["period"] == {
+        "from": "2019-06-01",
+        "to": "2019-10-01",
+    }
+
+    entry = Campaign.get_export_plan()["period"]
+    assert [c.attribute for c in entry.children] == ["start_date", "end_date"]
+    assert "self.start_date" in Campaign.get_export_function().source
+
+
+def test_missing_composite_as_dict():
+    campaign = Campaign(title="x")
+    expected = {"from": None, "to": None}
+    assert campaign.to_dict()["period"] == expected
+    assert campaign.as_mapping()["period"] == expected
+    assert Campaign.prepare_for_export(Campaign.period, None) == (
+        "period",
+        expected,
+    )
+
+
+def test_missing_composite():
+    term = Term(id=1)
+    assert term.to_dict()["period"] is None
+    assert term.as_mapping()["period"] is None
+    assert Term.prepare_for_export(Term.period, None) == ("period", None)
+
+    term.period = Period(date(2019, 1, 1), date(2019, 2, 1))
+    assert term.to_dict()["period"] == term.as_mapping()["period"]
@@ -0,0 +1,59 @@
+import sys
+
+from datetime import date
+
+import pytest
+
+from sqlalchemy import Integer, Unicode, Date, Numeric, select
+
+from sqlalchemy_dict import Field
+from sqlalchemy_dict.dto import get_dto_class
+from sqlalchemy_dict.tests.db import DeclarativeBase
+
+
+class Purchase(DeclarativeBase):
+    __tablename__ = "purchase"
+
+    id = Field(Integer, primary_key=True)
+    sold_on = Field(Date)
+    _amount = Field("amount", Numeric(10, 2), dict_key="total")
+    token = Field(Unicode(50), protected=True)
+    note = Field(Unicode(50), export=lambda v: v and v.upper())
+
+
+def test_dto(db):
+    purchase = Purchase(sold_on=date(2020, 1, 2), token="secret", note="abc")
+    db.session.add(purchase)
+    db.session.commit()
+
+    PurchaseDTO = Purchase.get_dto_class()
+    assert PurchaseDTO is get_dto_class(Purchase)
+    assert PurchaseDTO.__name__ == "PurchaseDTO"
+    assert PurchaseDTO._fields == ("id", "sold_on", "amount", "note")
+    assert PurchaseDTO.dict_keys == ("id", "soldOn", "total", "note")
+
+    record = purchase.to_dto()
+    assert record.sold_on == "2020-01-02"
+    assert record.to_dict() == purchase.to_dict()
+    assert not hasattr(record, "__dict__")
+    assert sys.getsizeof(record) < sys.getsizeof(purchase.to_dict())
+    with pytest.raises(AttributeError):
+        record.note = "changed"
+
+    rows = db.session.execute(select([Purchase.__table__])).fetchall()
+    assert PurchaseDTO.from_row(rows[0]) == record
+    assert PurchaseDTO.from_rows(rows) == [record]
+
+    rows = db.session.execute(select([Purchase.id]))
+    assert PurchaseDTO.from_rows(rows)[0].to_dict() == {
+        "id": 1,
+        "soldOn": None,
+        "total": None,
+        "note": None,
+    }
+
+
+def test_dto_view(db):
+    record = Purchase(id=1, note="abc").to_dto(view="list")
+    assert record.note == "ABC"
+    assert Purchase.get_dto_class(view="list") is not Purchase.get_dto_class()
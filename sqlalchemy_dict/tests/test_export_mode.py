@@ -0,0 +1,104 @@
+import pytest
+
+from sqlalchemy import Integer, Unicode, ForeignKey, func
+
+from sqlalchemy_dict import (
+    Field,
+    relationship,
+    hybrid_property,
+    association_proxy,
+)
+from sqlalchemy_dict.tests.db import DeclarativeBase
+
+
+class Tag(DeclarativeBase):
+    __tablename__ = "tag"
+    id = Field(Integer, primary_key=True)
+    article_id = Field(Integer, ForeignKey("article.id"))
+    name = Field(Unicode(50))
+
+
+class Article(DeclarativeBase):
+    __tablename__ = "article"
+
+    id = Field(Integer, primary_key=True)
+    title = Field(Unicode(50))
+    body = Field(Unicode(500), default="")
+    _tags = relationship("Tag", protected=True)
+    tag_names = association_proxy(
+        "_tags", "name", creator=lambda n: Tag(name=n)
+    )
+    hidden_tag_names = association_proxy("_tags", "name", export_mode="never")
+
+    @hybrid_property(export_mode="optional", dict_key="score")
+    def expensive_score(self):
+        return len(self.body) * 10
+
+    @expensive_score.expression
+    def expensive_score(cls):
+        return func.length(cls.body) * 10
+
+    @hybrid_property(export_mode="sql")
+    def body_length(self):
+        return len(self.body)
+
+    @body_length.expression
+    def body_length(cls):
+        return func.length(cls.body)
+
+    @hybrid_property(export_mode="never")
+    def secret(self):  # pragma: no cover
+        return "secret"
+
+
+def test_invalid_export_mode():
+    with pytest.raises(ValueError):
+        hybrid_property(export_mode="sometimes")
+
+    with pytest.raises(ValueError):
+        association_proxy("_tags", "name", export_mode="sql")
+
+
+def test_export_mode(db):
+    article = Article()
+    article.update_from_dict(
+        {"title": "hello", "body": "abc", "tagNames": ["a", "b"]}
+    )
+    assert [t.name for t in article._tags] == ["a", "b"]
+    db.session.add(article)
+    db.session.commit()
+
+    result = article.to_dict()
+    assert result["tagNames"] == ["a", "b"]
+    assert result["bodyLength"] == 3
+    assert "hiddenTagNames" not in result
+    assert "score" not in result
+    assert "secret" not in result
+
+    result = article.to_dict(include=("score",))
+    assert result["score"] == 30
+
+    # Hybrid ``.expression`` keeps info
+    assert Article.body_length.info["export_mode"] == "sql"
+
+
+def test_dump_query_sql_hybrid(db):
+    db.session.add(Article(title="first", body="12345"))
+    db.session.commit()
+
+    def evaluate_in_python(self):  # pragma: no cover
+        raise AssertionError("Should be computed in database")
+
+    original = Article.__dict__["body_length"].fget
+    Article.__dict__["body_length"].fget = evaluate_in_python
+    try:
+        result = Article.dump_query(db.session.query(Article))
+    finally:
+        Article.__dict__["body_length"].fget = original
+
+    assert result[0]["bodyLength"] == 5
+    assert result[0]["title"] == "first"
+    assert "score" not in result[0]
+
+    result = Article.dump_query(db.session.query(Article), include={"score"})
+    assert result[0]["score"] == 50
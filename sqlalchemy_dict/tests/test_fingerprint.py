@@ -0,0 +1,155 @@
+from sqlalchemy import Integer, Unicode, ForeignKey
+from sqlalchemy.ext.associationproxy import association_proxy
+
+from sqlalchemy_dict import Field, relationship
+from sqlalchemy_dict.fingerprint import get_fingerprint_plan
+from sqlalchemy_dict.tests.db import DeclarativeBase
+
+
+class Label(DeclarativeBase):
+    __tablename__ = "label"
+
+    id = Field(Integer, primary_key=True)
+    document_id = Field(Integer, ForeignKey("document.id"))
+    name = Field(Unicode(50))
+
+
+class Document(DeclarativeBase):
+    __tablename__ = "document"
+
+    id = Field(Integer, primary_key=True)
+    title = Field(Unicode(50))
+    secret = Field(Unicode(50), views={"admin"})
+    labels = relationship("Label", views={"full"})
+
+
+class Page(DeclarativeBase):
+    __tablename__ = "page"
+
+    id = Field(Integer, primary_key=True)
+    body = Field(Unicode(500))
+    note = Field(Unicode(50), views={"admin"})
+    version = Field(Integer, nullable=False)
+
+    __mapper_args__ = {"version_id_col": version}
+
+
+class Owner(DeclarativeBase):
+    __tablename__ = "owner"
+
+    id = Field(Integer, primary_key=True)
+    age = Field(Integer)
+
+
+class Pet(DeclarativeBase):
+    __tablename__ = "pet"
+
+    id = Field(Integer, primary_key=True)
+    owner_id = Field(Integer, ForeignKey("owner.id"))
+    owner = relationship("Owner")
+    owner_age = association_proxy("owner", "age")
+
+
+def test_fingerprint(db):
+    document = Document(title="a", secret="s", labels=[Label(name="x")])
+    db.session.add(document)
+    db.session.commit()
+
+    fingerprint = document.get_fingerprint()
+    assert fingerprint == document.get_fingerprint()
+    assert fingerprint != document.get_fingerprint(view="full")
+
+    # Not exported values do not change the fingerprint of a view
+    public = document.get_fingerprint(view="public")
+    document.secret = "changed"
+    assert document.get_fingerprint(view="public") == public
+    assert document.get_fingerprint() != fingerprint
+
+    full = document.get_fingerprint(view="full")
+    document.labels[0].name = "y"
+    assert document.get_fingerprint(view="full") != full
+
+
+def test_query_fingerprint(db):
+    db.session.add_all(Document(title="d%d" % i) for i in range(3))
+    db.session.commit()
+
+    query = db.session.query(Document).order_by(Document.id)
+    assert get_fingerprint_plan(Document, view="public").expressions
+    assert get_fingerprint_plan(Document, view="full").expressions is None
+
+    public = Document.get_query_fingerprint(query, view="public")
+    full = Document.get_query_fingerprint(query, view="full")
+    assert public == Document.get_query_fingerprint(query, view="public")
+    assert public != full
+
+    query.first().title = "changed"
+    db.session.commit()
+    assert Document.get_query_fingerprint(query, view="public") != public
+    assert Document.get_query_fingerprint(query, view="full") != full
+
+
+def test_version_fingerprint(db):
+    page = Page(body="a")
+    db.session.add(page)
+    db.session.commit()
+
+    assert get_fingerprint_plan(Page).attributes == ("id", "version")
+    fingerprint = page.get_fingerprint()
+    query = db.session.query(Page)
+    query_fingerprint = Page.get_query_fingerprint(query)
+
+    page.body = "b"
+    db.session.commit()
+    assert page.get_fingerprint() != fingerprint
+    assert Page.get_query_fingerprint(query) != query_fingerprint
+
+    # Views are still different representations
+    assert page.get_fingerprint(view="admin") != page.get_fingerprint(
+        view="public"
+    )
+    assert page.get_fingerprint(view="public") != page.get_fingerprint()
+    admin = Page.get_query_fingerprint(query, view="admin")
+    assert admin != Page.get_query_fingerprint(query, view="public")
+
+
+def test_scalar_related_fingerprint(db):
+    pet = Pet(owner=Owner(age=3))
+    db.session.add(pet)
+    db.session.commit()
+
+    fingerprint = pet.get_fingerprint()
+    query_fingerprint = Pet.get_query_fingerprint(db.session.query(Pet))
+    pet.owner.age = 4
+    assert pet.get_fingerprint() != fingerprint
+    assert (
+        Pet.get_query_fingerprint(db.session.query(Pet)) != query_fingerprint
+    )
+
+    pet.owner = None
+    assert pet.get_fingerprint()
+
+
+def test_expose_etag(db):
+    db.session.add(Document(title="a"))
+    db.session.commit()
+    tags = []
+
+    def check_etag(fingerprint):
+        tags.append(fingerprint)
+        if len(tags) > 1 and tags[-2] == fingerprint:
+            return "not modified"
+
+    @Document.expose(etag=check_etag)
+    def get_document():
+        return db.session.query(Document).first()
+
+    @Document.expose(etag=check_etag)
+    def get_documents():
+        return db.session.query(Document)
+
+    expected = {"id": 1, "title": "a", "secret": None, "labels": []}
+    assert get_document() == expected
+    assert get_document() == "not modified"
+    assert get_documents() == [expected]
+    assert get_documents() == "not modified"
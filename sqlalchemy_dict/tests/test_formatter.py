@@ -0,0 +1,164 @@
+from datetime import datetime, timedelta, timezone, tzinfo
+
+import pytest
+
+from sqlalchemy import Integer, DateTime
+
+from sqlalchemy_dict import DefaultFormatter, Field
+from sqlalchemy_dict.plan import plans
+from sqlalchemy_dict.tests.db import DeclarativeBase
+
+tehran = timezone(timedelta(hours=3, minutes=30))
+
+
+class SummerTime(tzinfo):
+    """ UTC+1, UTC+2 from April to September """
+
+    def utcoffset(self, dt):
+        if dt is None:
+            return None
+        return timedelta(hours=2 if 4 <= dt.month <= 9 else 1)
+
+    def dst(self, dt):
+        return self.utcoffset(dt) - timedelta(hours=1)
+
+
+class Delivery(DeclarativeBase):
+    __tablename__ = "delivery"
+
+    id = Field(Integer, primary_key=True)
+    shipped_at = Field(DateTime)
+
+
+class UTCFormatter(DefaultFormatter):
+    datetime_mode = "utc"
+    datetime_precision = 3
+
+
+class MillisFormatter(DefaultFormatter):
+    datetime_mode = "epoch_millis"
+
+
+class LocalFormatter(UTCFormatter):
+    naive_timezone = SummerTime()
+
+
+@pytest.mark.parametrize(
+    "formatter,value,expected",
+    [
+        (
+            DefaultFormatter,
+            datetime(2020, 1, 2, 3, 4, 5),
+            "2020-01-02T03:04:05",
+        ),
+        (
+            UTCFormatter,
+            datetime(2020, 1, 2, 3, 4, 5, 123456),
+            "2020-01-02T03:04:05.123Z",
+        ),
+        (
+            UTCFormatter,
+            datetime(2020, 1, 2, 3, 4, 5, tzinfo=tehran),
+            "2020-01-01T23:34:05.000Z",
+        ),
+        (
+            UTCFormatter,
+            datetime(2020, 7, 1, 12, tzinfo=SummerTime()),
+            "2020-07-01T10:00:00.000Z",
+        ),
+        (
+            LocalFormatter,
+            datetime(2020, 1, 1, 12),
+            "2020-01-01T11:00:00.000Z",
+        ),
+        (MillisFormatter, datetime(1970, 1, 1, 0, 0, 1, 5000), 1005),
+        (MillisFormatter, datetime(1970, 1, 1, 3, 30, tzinfo=tehran), 0),
+    ],
+)
+def test_export_datetime(formatter, value, expected):
+    assert formatter.export_datetime(value) == expected
+    assert formatter.get_datetime_exporter()(value) == expected
+
+
+def test_datetime_precision():
+    value = datetime(2020, 1, 2, 3, 4, 5, 120000)
+    for precision, expected in (
+        (0, "2020-01-02T03:04:05Z"),
+        (3, "2020-01-02T03:04:05.120Z"),
+        (6, "2020-01-02T03:04:05.120000Z"),
+    ):
+
+        class Formatter(DefaultFormatter):
+            datetime_mode = "utc"
+            datetime_precision = precision
+
+        assert Formatter.export_datetime(value) == expected
+
+    Formatter.datetime_precision = 2
+    with pytest.raises(ValueError):
+        Formatter.get_datetime_exporter()
+
+    Formatter.datetime_mode = "local"
+    with pytest.raises(ValueError):
+        Formatter.get_datetime_exporter()
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("2020-01-02T03:04:05Z", datetime(2020, 1, 2, 3, 4, 5)),
+        ("2020-01-02T03:04:05.12Z", datetime(2020, 1, 2, 3, 4, 5, 120000)),
+        ("2020-01-02 03:04:05.1234567", datetime(2020, 1, 2, 3, 4, 5, 123456)),
+        ("2020-01-02T03:04:05+03:30", datetime(2020, 1, 1, 23, 34, 5)),
+        ("2020-01-02T03:04:05-0100", datetime(2020, 1, 2, 4, 4, 5)),
+        (1005, datetime(1970, 1, 1, 0, 0, 1, 5000)),
+    ],
+)
+def test_import_datetime(value, expected):
+    assert UTCFormatter.import_datetime(value) == expected
+    assert MillisFormatter.import_datetime(value) == expected
+
+
+def test_import_datetime_timezone():
+    class AwareFormatter(UTCFormatter):
+        import_naive = False
+
+    assert AwareFormatter.import_datetime("2020-01-02T03:04:05+03:30") == (
+        datetime(2020, 1, 1, 23, 34, 5, tzinfo=timezone.utc)
+    )
+    assert AwareFormatter.import_datetime(0).tzinfo is timezone.utc
+
+    # Naive values are in naive time zone
+    assert LocalFormatter.import_datetime("2020-07-01T12:00:00") == datetime(
+        2020, 7, 1, 12
+    )
+    assert LocalFormatter.import_datetime(
+        "2020-07-01T12:00:00Z"
+    ) == datetime(2020, 7, 1, 14)
+
+    value = datetime(2020, 7, 1, 12, 30, 15, 250000)
+    for formatter in (UTCFormatter, MillisFormatter, LocalFormatter):
+        assert (
+            formatter.import_datetime(formatter.export_datetime(value))
+            == value
+        )
+
+    for value in ("2020-01-02", "2020-13-02T03:04:05Z", True, None):
+        with pytest.raises(ValueError):
+            UTCFormatter.import_datetime(value)
+
+
+def test_export_utc():
+    Delivery.__formatter__ = MillisFormatter
+    try:
+        delivery = Delivery(
+            id=1, shipped_at=datetime(2020, 1, 2, 3, 4, 5, tzinfo=tehran)
+        )
+        assert delivery.to_dict()["shippedAt"] == 1577921645000
+        assert Delivery.export_value(delivery.shipped_at) == 1577921645000
+
+        delivery.update_from_dict({"shippedAt": 1577921645000})
+        assert delivery.shipped_at == datetime(2020, 1, 1, 23, 34, 5)
+    finally:
+        del Delivery.__formatter__
+        plans.clear(Delivery)
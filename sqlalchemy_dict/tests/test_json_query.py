@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from sqlalchemy import Integer, Unicode, Boolean, Date, func
+from datetime import date
+
+from sqlalchemy_dict import Field, hybrid_property, synonym
+from sqlalchemy_dict.tests.db import DeclarativeBase
+
+
+class Product(DeclarativeBase):
+    __tablename__ = "product"
+
+    id = Field(Integer, primary_key=True)
+    title = Field(Unicode(50))
+    _code = Field("code", Unicode(10), protected=True)
+    code = synonym("_code", dict_key="productCode", protected=False)
+    available = Field(Boolean, nullable=True)
+    released = Field(Date, nullable=True)
+
+    @hybrid_property(export_mode="sql")
+    def title_length(self):  # pragma: no cover
+        return len(self.title)
+
+    @title_length.expression
+    def title_length(cls):
+        return func.length(cls.title)
+
+
+class Coupon(DeclarativeBase):
+    __tablename__ = "coupon"
+
+    id = Field(Integer, primary_key=True)
+    code = Field(Unicode(10))
+
+    @hybrid_property
+    def label(self):  # pragma: no cover
+        return "#%s" % self.code
+
+
+def test_dump_query_as_json(db):
+    db.session.add(
+        Product(
+            title="phone",
+            code="P1",
+            available=True,
+            released=date(2019, 1, 2),
+        )
+    )
+    db.session.add(Product(title="tablet", available=False))
+    db.session.commit()
+
+    query = db.session.query(Product).order_by(Product.id)
+    result = Product.dump_query(query, as_json=True)
+    assert all(isinstance(r, str) for r in result)
+    assert [json.loads(r) for r in result] == [
+        {
+            "id": 1,
+            "title": "phone",
+            "productCode": "P1",
+            "available": True,
+            "released": "2019-01-02",
+            "titleLength": 5,
+        },
+        {
+            "id": 2,
+            "title": "tablet",
+            "productCode": None,
+            "available": False,
+            "released": None,
+            "titleLength": 6,
+        },
+    ]
+
+    # Python-side export gives the same keys
+    assert set(json.loads(result[0])) == set(Product.dump_query(query)[0])
+
+    # Filters are kept
+    result = Product.dump_query(query.filter(Product.id == 2), as_json=True)
+    assert len(result) == 1
+
+
+def test_json_expression_errors():
+    with pytest.raises(ValueError):
+        Product.get_json_expression("mysql")
+
+    # Python hybrids can not export in database
+    with pytest.raises(ValueError):
+        Coupon.get_json_expression("sqlite")
+
+    assert Product.get_json_expression("postgresql") is not None
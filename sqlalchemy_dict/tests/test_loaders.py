@@ -0,0 +1,215 @@
+import io
+import json
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from sqlalchemy import (
+    Integer,
+    Unicode,
+    Boolean,
+    Date,
+    Numeric,
+    ForeignKey,
+    func,
+)
+from sqlalchemy.exc import StatementError
+
+from sqlalchemy_dict import (
+    Field,
+    composite,
+    hybrid_property,
+    relationship,
+    synonym,
+)
+from sqlalchemy_dict.loaders import load_csv, load_ndjson, get_load_plan
+from sqlalchemy_dict.writers import write_csv, write_ndjson
+from sqlalchemy_dict.tests.db import DeclarativeBase
+
+
+class Bill(DeclarativeBase):
+    __tablename__ = "bill"
+
+    id = Field(Integer, primary_key=True)
+    title = Field(Unicode(50))
+    amount = Field(Numeric(10, 2))
+
+
+class Interval(object):
+    def __init__(self, start, end):
+        self.start = start
+        self.end = end
+
+    def __composite_values__(self):
+        return self.start, self.end
+
+
+class Event(DeclarativeBase):
+    __tablename__ = "event"
+
+    id = Field(Integer, primary_key=True)
+    title = Field(Unicode(50))
+    start_date = Field(Date, dict_key="from")
+    end_date = Field(Date, dict_key="to")
+    period = composite(Interval, start_date, end_date, as_dict=True)
+
+
+class Item(DeclarativeBase):
+    __tablename__ = "item"
+
+    id = Field(Integer, primary_key=True)
+    title = Field(Unicode(50))
+    _code = Field("code", Unicode(10), protected=True)
+    code = synonym("_code", dict_key="productCode", protected=False)
+    available = Field(Boolean, nullable=True)
+    released = Field(Date, nullable=True)
+
+    @hybrid_property(export_mode="sql")
+    def title_length(self):  # pragma: no cover
+        return len(self.title)
+
+    @title_length.expression
+    def title_length(cls):
+        return func.length(cls.title)
+
+
+class Shelf(DeclarativeBase):
+    __tablename__ = "shelf"
+
+    id = Field(Integer, primary_key=True)
+    name = Field(Unicode(50))
+    volumes = relationship("Volume")
+
+
+class Volume(DeclarativeBase):
+    __tablename__ = "volume"
+
+    id = Field(Integer, primary_key=True)
+    shelf_id = Field(Integer, ForeignKey("shelf.id"))
+
+
+def test_load_plan():
+    assert get_load_plan(Item) == {
+        "id": "id",
+        "title": "title",
+        # Plain synonyms
+        "Code": "code",
+        "productCode": "code",
+        "available": "available",
+        "released": "released",
+        # Read-only hybrid is ignored
+        "titleLength": (),
+    }
+    assert get_load_plan(Event)["period"] == ("start_date", "end_date")
+    # Relationships are ignored
+    assert get_load_plan(Shelf)["volumes"] == ()
+
+
+def test_load_ndjson(db):
+    lines = [
+        {"id": 1, "title": "a", "from": "2019-01-01", "to": "2019-02-01"},
+        {"id": 2, "title": "b", "from": "2019-13-01"},
+        "not a json",
+        {"id": 3, "title": "c", "unknown": 1},
+        [1, 2],
+        {"id": 1, "title": "duplicated"},
+        {"id": 4, "title": "d", "period": {"from": "2019-01-01"}},
+        {"id": 5, "title": "e"},
+    ]
+    fp = io.StringIO(
+        "\n".join(l if isinstance(l, str) else json.dumps(l) for l in lines)
+        + "\n\n"
+    )
+    result = load_ndjson(Event, db.session, fp, batch_size=3, strict=True)
+    db.session.commit()
+
+    assert result.count == 3
+    assert [e.line for e in result.errors] == [2, 3, 4, 5, 6]
+    assert str(result.errors[2].error) == "Unknown keys: unknown"
+    assert result.errors[4].data == {"id": 1, "title": "duplicated"}
+
+    events = db.session.query(Event).order_by(Event.id).all()
+    assert [c.id for c in events] == [1, 4, 5]
+    assert events[0].end_date == date(2019, 2, 1)
+    # Partial composite
+    assert events[1].start_date == date(2019, 1, 1)
+    assert events[1].end_date is None
+
+
+def test_load_csv(db):
+    fp = io.StringIO(
+        "id,title,amount,unknown\n"
+        "1,first,1.50,x\n"
+        "2,,,x\n"
+        "x,third,1,x\n"
+    )
+    result = load_csv(Bill, db.session, fp)
+    db.session.commit()
+
+    assert result.count == 2
+    assert [e.line for e in result.errors] == [4]
+    bills = db.session.query(Bill).order_by(Bill.id).all()
+    assert bills[0].amount == Decimal("1.50")
+    assert bills[1].title is None
+    assert bills[1].amount is None
+
+
+def test_load_bind_errors(db):
+    # Values which can not be bound reject just their row
+    fp = io.StringIO('{"id": 1}\n{"id": 2, "amount": "abc"}\n{"id": 3}\n')
+    result = load_ndjson(Bill, db.session, fp, batch_size=2)
+    db.session.commit()
+
+    assert result.count == 2
+    assert [e.line for e in result.errors] == [2]
+    assert isinstance(result.errors[0].error, StatementError)
+    assert [b.id for b in db.session.query(Bill).order_by(Bill.id)] == [1, 3]
+
+    connection = db.engine.connect()
+    try:
+        with pytest.raises(ValueError):
+            load_ndjson(Bill, connection, io.StringIO('{"id": 4}\n'))
+
+        with connection.begin():
+            result = load_ndjson(Bill, connection, io.StringIO('{"id": 4}'))
+        assert result.count == 1
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize(
+    "write, load",
+    [(write_ndjson, load_ndjson), (write_csv, load_csv)],
+)
+def test_round_trip(db, write, load):
+    db.session.add_all(
+        [
+            Item(title="phone", code="P1", released=date(2019, 1, 2)),
+            Item(title="tablet", available=False),
+            Event(
+                title="summer",
+                start_date=date(2019, 6, 1),
+                end_date=date(2019, 9, 1),
+            ),
+            Event(title="winter"),
+            Shelf(name="a", volumes=[Volume(), Volume()]),
+            Shelf(name="b"),
+        ]
+    )
+    db.session.commit()
+
+    for model in (Item, Event, Shelf):
+        query = db.session.query(model).order_by(model.id)
+        expected = model.dump_query(query)
+        fp = io.StringIO(newline="")
+        write(model, query, fp)
+        db.session.query(model).delete()
+
+        fp.seek(0)
+        result = load(model, db.session, fp, strict=True)
+        db.session.commit()
+        assert result.errors == []
+        assert result.count == 2
+        assert model.dump_query(query) == expected
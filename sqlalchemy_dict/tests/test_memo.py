@@ -0,0 +1,82 @@
+import pytest
+
+from sqlalchemy import Integer, Unicode, ForeignKey
+
+from sqlalchemy_dict import Field, relationship, DumpMemo
+from sqlalchemy_dict.tests.db import DeclarativeBase
+
+
+class Customer(DeclarativeBase):
+    __tablename__ = "customer"
+
+    id = Field(Integer, primary_key=True)
+    name = Field(Unicode(50))
+    notes = relationship("Note")
+
+
+class Note(DeclarativeBase):
+    __tablename__ = "note"
+
+    id = Field(Integer, primary_key=True)
+    customer_id = Field(Integer, ForeignKey("customer.id"))
+    text = Field(Unicode(50))
+
+
+class Order(DeclarativeBase):
+    __tablename__ = "order"
+
+    id = Field(Integer, primary_key=True)
+    customer_id = Field(Integer, ForeignKey("customer.id"))
+    customer = relationship("Customer")
+
+
+@pytest.fixture
+def orders(db):
+    customers = [
+        Customer(name="c%d" % i, notes=[Note(text="n%d" % i)])
+        for i in range(2)
+    ]
+    db.session.add_all(Order(customer=customers[i % 2]) for i in range(4))
+    db.session.commit()
+    return db.session.query(Order).order_by(Order.id)
+
+
+def test_memo(orders):
+    expected = Order.dump_query(orders)
+
+    memo = DumpMemo()
+    result = [o.to_dict(memo=memo) for o in orders]
+    assert result == expected
+    assert result[0]["customer"] is result[2]["customer"]
+    assert result[0]["customer"] == {
+        "id": 1,
+        "name": "c0",
+        "notes": [{"id": 1, "customerId": 1, "text": "n0"}],
+    }
+
+    result = Order.dump_query(orders, memo=DumpMemo())
+    assert result == expected
+    assert result[1]["customer"] is result[3]["customer"]
+
+    # Pending instances have no identity
+    order = Order(customer=Customer(name="new"))
+    assert order.to_dict(memo=memo)["customer"]["name"] == "new"
+
+
+def test_normalize(orders):
+    result = Order.dump_query(orders, normalize=True)
+    assert result["items"] == [
+        {"id": 1, "customerId": 1, "customer": "Customer:1"},
+        {"id": 2, "customerId": 2, "customer": "Customer:2"},
+        {"id": 3, "customerId": 1, "customer": "Customer:1"},
+        {"id": 4, "customerId": 2, "customer": "Customer:2"},
+    ]
+    assert result["included"] == {
+        "Customer:1": {"id": 1, "name": "c0", "notes": ["Note:1"]},
+        "Note:1": {"id": 1, "customerId": 1, "text": "n0"},
+        "Customer:2": {"id": 2, "name": "c1", "notes": ["Note:2"]},
+        "Note:2": {"id": 2, "customerId": 2, "text": "n1"},
+    }
+
+    with pytest.raises(ValueError):
+        Order.dump_query(orders, normalize=True, as_json=True)
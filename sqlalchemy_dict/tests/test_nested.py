@@ -0,0 +1,120 @@
+import pytest
+
+from sqlalchemy import Integer, Unicode, ForeignKey, event
+
+from sqlalchemy_dict import Field, relationship, update_all_from_dict
+from sqlalchemy_dict.tests.db import DeclarativeBase
+
+
+class Publisher(DeclarativeBase):
+    __tablename__ = "publisher"
+
+    id = Field(Integer, primary_key=True)
+    name = Field(Unicode(50))
+
+
+class Book(DeclarativeBase):
+    __tablename__ = "book"
+
+    id = Field(Integer, primary_key=True)
+    author_id = Field(Integer, ForeignKey("author.id"))
+    publisher_id = Field(Integer, ForeignKey("publisher.id"))
+    title = Field(Unicode(50))
+    publisher = relationship("Publisher")
+
+
+class Author(DeclarativeBase):
+    __tablename__ = "author"
+
+    id = Field(Integer, primary_key=True)
+    name = Field(Unicode(50))
+    books = relationship("Book", order_by=Book.id)
+
+
+@pytest.fixture
+def statements(db):
+    result = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        result.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    yield result
+    event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_nested_import(db, statements):
+    db.session.add_all(
+        [
+            Publisher(id=1, name="p1"),
+            Publisher(id=2, name="p2"),
+            Book(id=10, title="orphan"),
+        ]
+    )
+    db.session.commit()
+    author = Author(name="a1")
+    author.update_from_dict(
+        {
+            "books": [
+                {"title": "b1", "publisher": {"id": 1}},
+                {"title": "b2", "publisher": {"id": 2, "name": "P2"}},
+            ]
+        },
+        session=db.session,
+    )
+    db.session.add(author)
+    db.session.commit()
+    assert [b.title for b in author.books] == ["b1", "b2"]
+    assert [b.publisher.name for b in author.books] == ["p1", "P2"]
+
+    first, second = author.books
+    del statements[:]
+    author.update_from_dict(
+        {
+            "books": [
+                {"id": second.id, "title": "B2"},
+                {"id": 10, "publisher": {"id": 1}},
+                {"title": "b3"},
+            ]
+        }
+    )
+    # Just the orphan book is resolved by one query
+    selects = [s for s in statements if "FROM book" in s]
+    assert len(selects) == 1
+    assert "IN" in selects[0]
+
+    assert author.books[0] is second
+    assert [b.title for b in author.books] == ["B2", "orphan", "b3"]
+    db.session.commit()
+    assert first.author_id is None
+    orphan = db.session.query(Book).get(10)
+    assert orphan.author_id == author.id
+    assert orphan.publisher.name == "p1"
+
+    with pytest.raises(ValueError):
+        author.update_from_dict({"books": [{"id": 100}]})
+
+    with pytest.raises(ValueError):
+        author.update_from_dict({"books": {"id": 10}})
+
+
+def test_update_all_from_dict(db, statements):
+    db.session.add_all(
+        [Publisher(id=i, name="p%d" % i) for i in range(1, 4)]
+    )
+    db.session.commit()
+
+    books = [Book(), Book(), Book()]
+    del statements[:]
+    update_all_from_dict(
+        (
+            (b, {"title": "b%d" % i, "publisher": {"id": i + 1}})
+            for i, b in enumerate(books)
+        ),
+        session=db.session,
+    )
+    assert len(statements) == 1
+    assert [b.publisher.name for b in books] == ["p1", "p2", "p3"]
+
+    with pytest.raises(ValueError):
+        Book().update_from_dict({"publisher": {"id": 1}})
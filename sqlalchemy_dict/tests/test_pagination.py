@@ -0,0 +1,104 @@
+from datetime import date
+
+import pytest
+
+from sqlalchemy import Integer, Unicode, Date
+
+from sqlalchemy_dict import Field
+from sqlalchemy_dict.pagination import (
+    encode_cursor,
+    decode_cursor,
+    get_keyset,
+)
+from sqlalchemy_dict.tests.db import DeclarativeBase
+
+
+class Post(DeclarativeBase):
+    __tablename__ = "post"
+
+    id = Field(Integer, primary_key=True)
+    title = Field(Unicode(50))
+    published = Field(Date)
+    body = Field(Unicode(500), views={"full"})
+
+
+class Ticket(DeclarativeBase):
+    __tablename__ = "ticket"
+
+    id = Field(Integer, primary_key=True, protected=True)
+    status = Field(Unicode(20))
+    number = Field(Integer, unique=True, nullable=False)
+
+
+def test_cursor():
+    cursor = encode_cursor(["a", 1, None])
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == ["a", 1, None]
+
+    for cursor in ("#", "bm90IGpzb24", "e30"):
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+def test_paginate(db):
+    db.session.add_all(
+        Post(title="p%d" % i, published=date(2020, 1, 1 + i // 3))
+        for i in range(10)
+    )
+    db.session.commit()
+
+    query = db.session.query(Post)
+    pages = []
+    cursor = None
+    while True:
+        page = Post.paginate(
+            query, ("-published",), cursor=cursor, limit=4, view="list"
+        )
+        pages.append([i["id"] for i in page["items"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == [[10, 7, 8, 9], [4, 5, 6, 1], [2, 3]]
+    assert "body" not in page["items"][0]
+    assert page["items"][0]["published"] == "2020-01-01"
+
+    page = Post.paginate(query, ("title",), limit=20)
+    assert len(page["items"]) == 10
+    assert page["next_cursor"] is None
+
+    with pytest.raises(ValueError):
+        Post.paginate(query, ("body",), view="list")
+
+    with pytest.raises(ValueError):
+        Post.paginate(query, ("title",), cursor=encode_cursor([1]))
+
+
+def test_paginate_protected_primary_key(db):
+    db.session.add_all(Ticket(status="open", number=10 - i) for i in range(5))
+    db.session.commit()
+
+    # Protected primary key is not sent to clients in cursors
+    with pytest.raises(ValueError):
+        get_keyset(Ticket, ("status",))
+
+    with pytest.raises(ValueError):
+        get_keyset(Ticket, ("id",))
+
+    keyset = get_keyset(Ticket, ("status", "number"))
+    assert [e.key for e in keyset] == ["status", "number"]
+
+    query = db.session.query(Ticket)
+    pages = []
+    cursor = None
+    while True:
+        page = Ticket.paginate(
+            query, ("status", "number"), cursor=cursor, limit=2
+        )
+        pages.append([i["number"] for i in page["items"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == [[6, 7], [8, 9], [10]]
+    assert "id" not in page["items"][0]
@@ -0,0 +1,165 @@
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sqlalchemy import Integer, Unicode, Date, func
+
+from sqlalchemy_dict import Field, hybrid_property
+from sqlalchemy_dict.plan import PlanCache, plans
+from sqlalchemy_dict.tests.db import DeclarativeBase
+
+
+class Setting(DeclarativeBase):
+    __tablename__ = "setting"
+
+    id = Field(Integer, primary_key=True)
+    name = Field(Unicode(50), views={"admin"})
+    value = Field(Unicode(50))
+    updated = Field(Date)
+
+    @hybrid_property(export_mode="optional", dict_key="score")
+    def name_length(self):  # pragma: no cover
+        return len(self.name or "")
+
+    @name_length.expression
+    def name_length(cls):
+        return func.length(cls.name)
+
+
+setting_dict_sample = {"id": 1, "value": "on", "updated": "2020-01-02"}
+
+
+def test_plan_cache():
+    cache = PlanCache()
+    calls = []
+
+    def builder():
+        calls.append(1)
+        return object()
+
+    plan = cache.get(Setting, "export", None, builder)
+    assert cache.get(Setting, "export", None, builder) is plan
+    assert cache.get(Setting, "export", frozenset(), builder) is not plan
+    assert len(calls) == 2
+
+    cache.clear(Setting)
+    assert cache.get(Setting, "export", None, builder) is not plan
+    cache.clear()
+    assert len(calls) == 3
+
+
+def test_plan_cache_threads(monkeypatch):
+    expected = Setting()
+    expected.update_from_dict(setting_dict_sample)
+    expected = expected.to_dict()
+
+    builds = []
+    original_export = Setting._build_export_plan.__func__
+    original_import = Setting._build_import_plan.__func__
+
+    def build_export_plan(cls, include, view):
+        builds.append("export")
+        # Widen the race window
+        time.sleep(0.05)
+        return original_export(cls, include, view)
+
+    def build_import_plan(cls):
+        builds.append("import")
+        time.sleep(0.05)
+        return original_import(cls)
+
+    monkeypatch.setattr(
+        Setting, "_build_export_plan", classmethod(build_export_plan)
+    )
+    monkeypatch.setattr(
+        Setting, "_build_import_plan", classmethod(build_import_plan)
+    )
+    plans.clear(Setting)
+
+    workers = 16
+    barrier = threading.Barrier(workers)
+
+    def work(_):
+        barrier.wait()
+        results = []
+        for _ in range(50):
+            setting = Setting()
+            setting.update_from_dict(setting_dict_sample)
+            results.append(setting.to_dict())
+        return results
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = [
+                r for rs in executor.map(work, range(workers)) for r in rs
+            ]
+    finally:
+        plans.clear(Setting)
+
+    assert len(results) == workers * 50
+    assert all(r == expected for r in results)
+    assert sorted(builds) == ["export", "import"]
+
+
+def test_warmup():
+    from sqlalchemy_dict import warmup
+    from sqlalchemy_dict.tests.db import DeclarativeBase
+
+    def fail():  # pragma: no cover
+        raise AssertionError("Plan should be already built")
+
+    plans.clear()
+    models = warmup(DeclarativeBase)
+    assert Setting in models
+    assert DeclarativeBase not in models
+    for model in models:
+        plans.get(model, "export", (frozenset(), None), fail)
+        plans.get(model, "import", None, fail)
+        plans.get(
+            model,
+            "export_function",
+            (model.__formatter__, frozenset(), None),
+            fail,
+        )
+
+
+def test_lazy_import():
+    import sqlalchemy_dict
+
+    assert "warmup" in dir(sqlalchemy_dict)
+    # Public name is not shadowed by its module
+    import sqlalchemy_dict._warmup
+
+    assert sqlalchemy_dict.warmup is sqlalchemy_dict._warmup.warmup
+    assert sqlalchemy_dict.Field is sqlalchemy_dict.field.Field
+    with pytest.raises(AttributeError):
+        sqlalchemy_dict.NotExists
+
+
+def test_plan_options():
+    assert Setting.get_plan_options(["score", "x", "y"], "v1") == (
+        frozenset(["score"]),
+        "",
+    )
+    assert Setting.get_plan_options(None, "admin") == (frozenset(), "admin")
+    assert Setting.get_plan_options(None, None) == (frozenset(), None)
+
+    plans.clear()
+    Setting(id=1, name="a").to_dict(view="admin")
+    size = len(plans._plans)
+    for i in range(20):
+        # Untrusted include and view do not grow the cache
+        Setting(id=1, name="a").to_dict(include=["k%d" % i], view="v%d" % i)
+    assert len(plans._plans) <= size + 3
+
+    assert Setting.get_export_plan(view="v1") is Setting.get_export_plan(
+        view="v2"
+    )
+    assert list(Setting.get_export_plan(view="v1")) == [
+        "id",
+        "value",
+        "updated",
+    ]
@@ -0,0 +1,97 @@
+from sqlalchemy import Integer, Unicode, func
+
+from sqlalchemy_dict import Field, hybrid_property
+from sqlalchemy_dict.tests.db import DeclarativeBase
+
+
+class Vehicle(DeclarativeBase):
+    __tablename__ = "vehicle"
+
+    id = Field(Integer, primary_key=True)
+    type = Field(Unicode(20), protected=True)
+    name = Field(Unicode(50))
+
+    __mapper_args__ = {
+        "polymorphic_on": type,
+        "polymorphic_identity": "vehicle",
+    }
+
+
+class Car(Vehicle):
+    seats = Field(Integer, nullable=True)
+    __mapper_args__ = {"polymorphic_identity": "car"}
+
+
+class Truck(Vehicle):
+    capacity = Field(Integer, nullable=True)
+    __mapper_args__ = {"polymorphic_identity": "truck"}
+
+
+class Animal(DeclarativeBase):
+    __tablename__ = "animal"
+
+    id = Field(Integer, primary_key=True)
+    type = Field(Unicode(20), protected=True)
+    name = Field(Unicode(50))
+    breed = Field(Unicode(50), nullable=True, protected=True)
+
+    __mapper_args__ = {
+        "polymorphic_on": type,
+        "polymorphic_identity": "animal",
+    }
+
+    @hybrid_property(export_mode="sql")
+    def name_length(self):
+        return len(self.name)
+
+    @name_length.expression
+    def name_length(cls):
+        return func.length(cls.name)
+
+
+class Dog(Animal):
+    __mapper_args__ = {"polymorphic_identity": "dog"}
+
+    @hybrid_property(export_mode="sql")
+    def breed_length(self):
+        return len(self.breed)
+
+    @breed_length.expression
+    def breed_length(cls):
+        return func.length(cls.breed)
+
+
+def test_dump_polymorphic_query(db):
+    db.session.add_all(
+        [
+            Car(name="c1", seats=4),
+            Truck(name="t1", capacity=10),
+            Car(name="c2", seats=2),
+            Vehicle(name="v1"),
+        ]
+    )
+    db.session.commit()
+
+    query = db.session.query(Vehicle).order_by(Vehicle.id)
+    result = Vehicle.dump_query(query)
+    assert result == [
+        {"id": 1, "name": "c1", "seats": 4},
+        {"id": 2, "name": "t1", "capacity": 10},
+        {"id": 3, "name": "c2", "seats": 2},
+        {"id": 4, "name": "v1"},
+    ]
+
+    result = Vehicle.dump_query(query, discriminator="kind")
+    assert [r["kind"] for r in result] == ["car", "truck", "car", "vehicle"]
+    assert result[0]["seats"] == 4
+
+
+def test_dump_subclass_sql_hybrid(db):
+    db.session.add_all([Animal(name="cat"), Dog(name="rex", breed="boxer")])
+    db.session.commit()
+
+    query = db.session.query(Animal).order_by(Animal.id)
+    assert Animal.dump_query(query) == [
+        {"id": 1, "name": "cat", "nameLength": 3},
+        {"id": 2, "name": "rex", "nameLength": 3, "breedLength": 5},
+    ]
@@ -0,0 +1,138 @@
+import json
+
+from decimal import Decimal
+
+import pytest
+
+from sqlalchemy import Integer, Unicode, Numeric, ForeignKey, MetaData
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.types import TypeDecorator
+
+from sqlalchemy_dict import BaseModel, Field, relationship, hybrid_property
+from sqlalchemy_dict.profile import (
+    generate_value,
+    get_entry_kind,
+    load_base,
+    main,
+    profile,
+)
+
+ProfileBase = declarative_base(cls=BaseModel, metadata=MetaData())
+
+
+class JSONText(TypeDecorator):
+    impl = Unicode
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else json.dumps(value)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else json.loads(value)
+
+
+class Invoice(ProfileBase):
+    __tablename__ = "invoice"
+
+    id = Field(Integer, primary_key=True)
+    title = Field(Unicode(5))
+    total = Field(Numeric(10, 2))
+    meta = Field(JSONText)
+    lines = relationship("InvoiceLine")
+
+    @hybrid_property
+    def label(self):
+        return "%s: %s" % (self.title, self.total)
+
+
+class InvoiceLine(ProfileBase):
+    __tablename__ = "invoice_line"
+
+    id = Field(Integer, primary_key=True)
+    invoice_id = Field(Integer, ForeignKey("invoice.id"))
+
+
+TreeBase = declarative_base(cls=BaseModel, metadata=MetaData())
+
+
+class Node(TreeBase):
+    __tablename__ = "node"
+
+    id = Field(Integer, primary_key=True)
+    parent_id = Field(Integer, ForeignKey("node.id"))
+    parent = relationship("Node", remote_side=[id])
+
+
+def fail(value):
+    raise ValueError("broken")
+
+
+class Broken(TreeBase):
+    __tablename__ = "broken"
+
+    id = Field(Integer, primary_key=True)
+    title = Field(Unicode(5), export=fail)
+
+
+def test_generate_value():
+    columns = Invoice.__table__.columns
+    assert generate_value(columns.id, 2) == 3
+    assert generate_value(columns.title, 12) == "le 12"
+    assert generate_value(columns.total, 1) == Decimal("1.25")
+    assert generate_value(columns.meta, 1) == "meta 1"
+
+
+def test_profile():
+    profiles = profile(ProfileBase, rows=5, repeat=1)
+    assert [p.model for p in profiles] == [Invoice, InvoiceLine]
+
+    invoice = profiles[0]
+    assert invoice.rows == 5
+    assert invoice.exporting.time > 0
+    assert invoice.exporting.memory > 0
+
+    columns = {c.key: c for c in invoice.columns}
+    assert set(columns) == {"id", "title", "total", "meta", "lines", "label"}
+    assert columns["lines"].kind == "relationship"
+    assert columns["lines"].importing is None
+    assert columns["label"].kind == "hybrid"
+    assert columns["label"].importing is None
+    assert columns["meta"].kind == "custom"
+    assert columns["title"].kind == "column"
+    assert columns["title"].importing.time > 0
+
+    plan = Invoice.get_export_plan()
+    assert get_entry_kind(Invoice, plan["total"]) == "column"
+
+
+def test_profile_errors(capsys):
+    profiles = profile(TreeBase, rows=3, repeat=1)
+    assert [p.model for p in profiles] == [Node]
+    assert profiles[0].rows == 3
+    assert "Can not profile Broken: broken" in capsys.readouterr().err
+
+
+def test_main(capsys):
+    assert load_base("sqlalchemy_dict.tests.test_profile.ProfileBase") is (
+        ProfileBase
+    )
+    assert main(
+        [
+            "sqlalchemy_dict.tests.test_profile:ProfileBase",
+            "--rows",
+            "3",
+            "--repeat",
+            "1",
+            "--model",
+            "Invoice",
+            "--threshold",
+            "0",
+        ]
+    ) == 0
+    output = capsys.readouterr().out
+    assert output.startswith("Invoice (3 rows)")
+    assert "InvoiceLine" not in output
+    assert "! lines" in output
+    assert "  title" in output
+
+    with pytest.raises(SystemExit):
+        main(["sqlalchemy_dict.tests.missing:Base"])
@@ -0,0 +1,69 @@
+import json
+
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Integer, Unicode, Date, Numeric, select, func
+
+from sqlalchemy_dict import Field
+from sqlalchemy_dict.rows import iter_rows, dump_rows_json, get_row_function
+from sqlalchemy_dict.tests.db import DeclarativeBase
+
+
+class Sale(DeclarativeBase):
+    __tablename__ = "sale"
+
+    id = Field(Integer, primary_key=True)
+    sold_on = Field(Date)
+    _amount = Field("amount", Numeric(10, 2), dict_key="total")
+    token = Field(Unicode(50), protected=True)
+    note = Field(Unicode(50), export=lambda v: v and v.upper())
+
+
+def test_dump_rows(db):
+    db.session.add(
+        Sale(
+            sold_on=date(2020, 1, 2),
+            _amount=Decimal("1.50"),
+            token="secret",
+            note="abc",
+        )
+    )
+    db.session.commit()
+
+    expected = {
+        "id": 1,
+        "soldOn": "2020-01-02",
+        "total": "1.50",
+        "note": "ABC",
+    }
+    instance = db.session.query(Sale).one()
+    assert instance.to_dict() == expected
+
+    result = db.session.execute(select([Sale.__table__]))
+    assert Sale.dump_rows(result) == [expected]
+
+    rows = db.session.execute(
+        select([Sale.id, Sale._amount, func.count().label("row_count")])
+        .group_by(Sale.id)
+    ).fetchall()
+    assert list(iter_rows(Sale, rows)) == [
+        {"id": 1, "total": "1.50", "rowCount": 1}
+    ]
+
+    # Mappings (e.g. ``RowMapping`` of SQLAlchemy 1.4)
+    mappings = [dict(id=1, token="secret", sold_on=None)]
+    assert list(iter_rows(Sale, mappings)) == [{"id": 1, "soldOn": None}]
+
+    result = db.session.execute(select([Sale.__table__]))
+    assert json.loads(dump_rows_json(Sale, result)) == [expected]
+
+    function = get_row_function(Sale, ("id", "amount"))
+    assert function is get_row_function(Sale, ("id", "amount"))
+    assert "'total'" in function.source
+
+    @Sale.expose
+    def get_sales():
+        return db.session.execute(select([Sale.__table__]))
+
+    assert get_sales() == [expected]
@@ -0,0 +1,147 @@
+import json
+
+from sqlalchemy import Integer, Unicode, ForeignKey
+
+from sqlalchemy_dict import Field, relationship, synonym, hybrid_property
+from sqlalchemy_dict.tests.db import DeclarativeBase
+
+
+class Team(DeclarativeBase):
+    __tablename__ = "team"
+    id = Field(Integer, primary_key=True)
+    name = Field(Unicode(50))
+
+
+class Employee(DeclarativeBase):
+    __tablename__ = "employee"
+
+    id = Field(Integer, primary_key=True)
+    name = Field(Unicode(50), views={"public", "admin"})
+    _email = Field("email", Unicode(100), protected=True)
+    email = synonym("_email", views={"admin"}, protected=False)
+    salary = Field(Integer, views={"admin"})
+    password = Field(Unicode(50), protected=True, views={"admin"})
+    team_id = Field(Integer, ForeignKey("team.id"), views={"admin"})
+    team = relationship("Team", views={"public"})
+
+
+class Manager(DeclarativeBase):
+    __tablename__ = "manager"
+
+    id = Field(Integer, primary_key=True)
+    name = Field(Unicode(50), views={"public"})
+    bio = Field(Unicode(500))
+
+    @hybrid_property(views={"public"})
+    def title(self):
+        return "Mr. %s" % self.name
+
+    @title.expression
+    def title(cls):
+        return cls.name
+
+
+def test_view_plan():
+    assert list(Employee.get_export_plan()) == [
+        "id",
+        "name",
+        "email",
+        "salary",
+        "teamId",
+        "team",
+    ]
+    assert list(Employee.get_export_plan(view="public")) == [
+        "id",
+        "name",
+        "team",
+    ]
+    assert list(Employee.get_export_plan(view="admin")) == [
+        "id",
+        "name",
+        "email",
+        "salary",
+        "teamId",
+    ]
+    assert list(Employee.get_export_plan(view="unknown")) == ["id"]
+    assert Employee.get_export_plan(view="public") is (
+        Employee.get_export_plan(view="public")
+    )
+    assert Employee.get_export_function(view="public") is not (
+        Employee.get_export_function(view="admin")
+    )
+
+
+def test_view_to_dict(db):
+    employee = Employee(name="alice", email="a@b.c", salary=10, password="x")
+    employee.team = Team(name="core")
+    db.session.add(employee)
+    db.session.commit()
+
+    assert employee.to_dict(view="admin") == {
+        "id": 1,
+        "name": "alice",
+        "email": "a@b.c",
+        "salary": 10,
+        "teamId": 1,
+    }
+    assert employee.to_dict(view="public") == {
+        "id": 1,
+        "name": "alice",
+        "team": {"id": 1, "name": "core"},
+    }
+
+
+def test_view_dump_query(db):
+    db.session.add(Employee(name="alice", salary=10, team=Team(name="core")))
+    db.session.commit()
+    db.session.expunge_all()
+
+    result = Employee.dump_query(db.session.query(Employee), view="admin")
+    assert result == [
+        {"id": 1, "name": "alice", "email": None, "salary": 10, "teamId": 1}
+    ]
+
+    assert Employee.get_view_columns(view="admin") == (
+        "id",
+        "name",
+        "_email",
+        "salary",
+        "team_id",
+    )
+    assert Employee.get_view_columns(view="public") == (
+        "id",
+        "name",
+        "team_id",
+    )
+    db.session.expunge_all()
+    result = Employee.dump_query(db.session.query(Employee), view="public")
+    assert result == [
+        {"id": 1, "name": "alice", "team": {"id": 1, "name": "core"}}
+    ]
+    query = Employee._load_only_view(
+        db.session.query(Employee), None, "public"
+    )
+    assert "salary" not in str(query)
+
+    result = Employee.dump_query(
+        db.session.query(Employee), view="admin", as_json=True
+    )
+    assert json.loads(result[0]) == {
+        "id": 1,
+        "name": "alice",
+        "email": None,
+        "salary": 10,
+        "teamId": 1,
+    }
+
+
+def test_view_python_hybrid(db):
+    db.session.add(Manager(name="bob", bio="long"))
+    db.session.commit()
+    db.session.expunge_all()
+
+    assert Manager.get_view_columns(view="public") is None
+    result = Manager.dump_query(db.session.query(Manager), view="public")
+    assert result == [
+        {"id": 1, "name": "bob", "bio": "long", "title": "Mr. bob"}
+    ]
@@ -0,0 +1,106 @@
+import csv
+import io
+import json
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Integer, Unicode, Date, Numeric
+
+from sqlalchemy_dict import Field, composite
+from sqlalchemy_dict.writers import write_csv, write_ndjson
+from sqlalchemy_dict.tests.db import DeclarativeBase
+
+
+class Album(DeclarativeBase):
+    __tablename__ = "album"
+
+    id = Field(Integer, primary_key=True)
+    title = Field(Unicode(50))
+    released = Field(Date, nullable=True)
+
+
+class Span(object):
+    def __init__(self, start, end):
+        self.start = start
+        self.end = end
+
+    def __composite_values__(self):
+        return self.start, self.end
+
+
+class Trip(DeclarativeBase):
+    __tablename__ = "trip"
+
+    id = Field(Integer, primary_key=True)
+    start_date = Field(Date, dict_key="from")
+    end_date = Field(Date, dict_key="to")
+    span = composite(Span, start_date, end_date, as_dict=True)
+
+
+class Fee(DeclarativeBase):
+    __tablename__ = "fee"
+
+    id = Field(Integer, primary_key=True)
+    title = Field(Unicode(50))
+    amount = Field(Numeric(10, 2))
+
+
+class CountingIO(io.StringIO):
+    writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+
+def add_albums(db, count):
+    db.session.add_all(
+        [
+            Album(title="p%d" % i, released=date(2019, 1, 1 + i % 28))
+            for i in range(count)
+        ]
+    )
+    db.session.commit()
+
+
+def test_write_ndjson(db):
+    add_albums(db, 25)
+    query = db.session.query(Album).order_by(Album.id)
+    fp = CountingIO()
+    assert write_ndjson(Album, query, fp, batch_size=10) == 25
+    assert fp.writes == 3
+
+    lines = fp.getvalue().splitlines()
+    assert len(lines) == 25
+    assert [json.loads(l) for l in lines] == Album.dump_query(query)
+    assert json.loads(lines[0])["released"] == "2019-01-01"
+
+    # Iterable of instances
+    fp = io.StringIO()
+    assert write_ndjson(Album, [], fp) == 0
+    assert fp.getvalue() == ""
+
+
+def test_write_csv(db):
+    add_albums(db, 5)
+    fp = CountingIO()
+    query = db.session.query(Album).order_by(Album.id)
+    assert write_csv(Album, query, fp, batch_size=2) == 5
+    assert fp.writes == 3
+
+    rows = list(csv.reader(io.StringIO(fp.getvalue())))
+    assert rows[0] == list(Album.get_export_plan())
+    assert len(rows) == 6
+    assert rows[1][:2] == ["1", "p0"]
+    assert rows[1][rows[0].index("released")] == "2019-01-01"
+
+    # Decimal, nested values and no header
+    fp = io.StringIO()
+    trip = Trip(start_date=date(2019, 1, 1), end_date=None)
+    write_csv(Trip, [trip], fp, header=False)
+    row = next(csv.reader(io.StringIO(fp.getvalue())))
+    assert json.loads(row[-1]) == {"from": "2019-01-01", "to": None}
+
+    fp = io.StringIO()
+    write_csv(Fee, [Fee(id=1, amount=Decimal("1.50"))], fp)
+    assert fp.getvalue().splitlines()[1] == "1,,1.50"
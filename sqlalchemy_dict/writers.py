@@ -0,0 +1,118 @@
+import csv
+import io
+import json
+
+from typing import Union, Iterable, TextIO
+
+from sqlalchemy.orm import Query
+
+
+def _iter_dicts(model, source, include, batch_size):
+    if isinstance(source, Query):
+        source = source.yield_per(batch_size)
+    return model.iter_dump(source, include)
+
+
+def write_ndjson(
+    model,
+    source: Union[Query, Iterable],
+    fp: TextIO,
+    include=None,
+    batch_size: int = 1000,
+    **kwargs
+) -> int:
+    """
+    Write model dictionaries as newline delimited JSON to a file-like object.
+
+    Queries are fetched with ``yield_per(batch_size)`` and lines are written
+    in batches, so memory usage is bounded by ``batch_size``.
+
+    .. code-block:: python
+
+        with open('members.ndjson', 'w') as f:
+            write_ndjson(Member, session.query(Member), f)
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param source: Query or iterable of model instances
+    :param fp: Text file-like object
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param batch_size: Rows per fetch and write
+    :param kwargs: Keyword-arguments that directly pass into ``json.dumps``
+    :return: Count of written rows
+    """
+    dumps = json.dumps
+    count = 0
+    lines = []
+    for row in _iter_dicts(model, source, include, batch_size):
+        lines.append(dumps(row, **kwargs))
+        if len(lines) >= batch_size:
+            lines.append("")
+            fp.write("\n".join(lines))
+            count += len(lines) - 1
+            lines = []
+
+    if lines:
+        lines.append("")
+        fp.write("\n".join(lines))
+        count += len(lines) - 1
+    return count
+
+
+def write_csv(
+    model,
+    source: Union[Query, Iterable],
+    fp: TextIO,
+    include=None,
+    batch_size: int = 1000,
+    header: bool = True,
+    **kwargs
+) -> int:
+    """
+    Write model dictionaries as CSV to a file-like object, columns are model
+    export plan keys (see
+    ``sqlalchemy_dict.BaseModel.get_export_plan``). Lists and dictionaries
+    (e.g. relationships) are written as JSON and extra keys of polymorphic
+    subclasses are ignored.
+
+    Queries are fetched with ``yield_per(batch_size)`` and rows are written
+    in batches, so memory usage is bounded by ``batch_size``.
+
+    .. versionadded:: 0.8.0
+
+    :param model: ``sqlalchemy_dict.BaseModel`` subclass
+    :param source: Query or iterable of model instances
+    :param fp: Text file-like object, should be opened with ``newline=''``
+    :param include: Dictionary keys of ``optional`` properties to export
+    :param batch_size: Rows per fetch and write
+    :param header: Write header row
+    :param kwargs: Keyword-arguments that directly pass into ``csv.writer``
+    :return: Count of written rows
+    """
+    keys = tuple(model.get_export_plan(include))
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, **kwargs)
+    if header:
+        writer.writerow(keys)
+
+    dumps = json.dumps
+    count = 0
+    for row in _iter_dicts(model, source, include, batch_size):
+        values = []
+        for key in keys:
+            value = row.get(key)
+            if isinstance(value, (list, dict)):
+                value = dumps(value)
+            values.append(value)
+        writer.writerow(values)
+        count += 1
+
+        if count % batch_size == 0:
+            fp.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        fp.write(buffer.getvalue())
+    return count